@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Large-response serialization benchmark
+
+Builds a synthetic spec with large schemas, then times get_schema_details,
+get_path_details and get_operation_by_id from the service call to the
+JSON-RPC result bytes, two ways:
+
+- dicts: the response dict is converted the way FastMCP converts any tool
+  result (text content plus structured content) and dumped to the wire
+- fragments: the response is assembled from cached serialized fragments
+  and returned as JSON text, as the query tools do
+
+Usage:
+    python benchmarks/fragment_benchmark.py [--properties 3000] [--runs 50]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Dict, Any, Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fastmcp.tools import Tool  # noqa: E402
+from mcp.types import CallToolResult  # noqa: E402
+from src.storage import OpenAPIStorage  # noqa: E402
+from src.services.api_service import ApiService  # noqa: E402
+from src.services.path_service import PathService  # noqa: E402
+from src.services.schema_service import SchemaService  # noqa: E402
+from src.tools.query_tools import _json_result  # noqa: E402
+from src.utils.json_fragments import FragmentCache, orjson  # noqa: E402
+
+
+def build_spec(properties: int) -> Dict[str, Any]:
+    """
+    Build a spec with one very large schema and an operation using it.
+
+    Args:
+        properties: Number of properties of the large schema
+
+    Returns:
+        OpenAPI 3.0 document
+    """
+    address = {
+        "type": "object",
+        "description": "A postal address",
+        "properties": {
+            field: {"type": "string", "description": f"The {field} of the address", "maxLength": 120}
+            for field in ("line1", "line2", "city", "region", "postal_code", "country")
+        }
+    }
+    record = {
+        "type": "object",
+        "description": "A record with many fields",
+        "required": [f"field_{i}" for i in range(0, properties, 7)],
+        "properties": {
+            f"field_{i}": (
+                {"$ref": "#/components/schemas/Address"} if i % 10 == 0 else
+                {"type": "string", "format": "date-time", "description": f"Timestamp number {i}", "nullable": True}
+                if i % 3 == 0 else
+                {"type": "integer", "minimum": 0, "maximum": i * 10, "description": f"Counter number {i}"}
+            )
+            for i in range(properties)
+        }
+    }
+    response = {
+        "description": "The record",
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Record"}}}
+    }
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Large schemas", "version": "1.0.0"},
+        "paths": {
+            "/records/{id}": {
+                "get": {
+                    "operationId": "getRecord",
+                    "summary": "Get a record",
+                    "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                    "responses": {"200": response}
+                },
+                "put": {
+                    "operationId": "replaceRecord",
+                    "summary": "Replace a record",
+                    "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Record"}}}},
+                    "responses": {"200": response}
+                }
+            }
+        },
+        "components": {"schemas": {"Address": address, "Record": record}}
+    }
+
+
+def dict_wire(tool: Tool, result: Dict[str, Any]) -> bytes:
+    """Convert a response dict like FastMCP does for dict results and dump it to the wire."""
+    converted = tool.convert_result(result)
+    message = CallToolResult(content=converted.content, structuredContent=converted.structured_content)
+    return message.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def fragment_wire(result: Dict[str, Any]) -> bytes:
+    """Encode a response by splicing fragments and dump it to the wire."""
+    converted = _json_result(result)
+    return CallToolResult(content=converted.content).model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def timed(call: Callable[[], bytes], runs: int) -> tuple[float, int]:
+    """
+    Time a call.
+
+    Returns:
+        Median milliseconds and the size of the produced bytes
+    """
+    size = len(call())
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Large-response serialization benchmark")
+    parser.add_argument("--properties", type=int, default=3000, help="Properties of the large schema")
+    parser.add_argument("--runs", type=int, default=50, help="Timed calls per case")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        spec_path = Path(directory) / "large.json"
+        spec_path.write_text(json.dumps(build_spec(args.properties)))
+
+        storage = OpenAPIStorage()
+        result = asyncio.run(ApiService(storage).load_openapi("large", spec_path.as_uri(), trusted=True))
+        if result.get("error"):
+            raise SystemExit(result["message"])
+
+    plain_paths, plain_schemas = PathService(storage), SchemaService(storage)
+    fragments = FragmentCache()
+    cached_paths, cached_schemas = PathService(storage, fragments=fragments), SchemaService(storage, fragments)
+
+    def tool_result() -> Dict[str, Any]:
+        return {}
+
+    tool = Tool.from_function(tool_result)
+
+    cases = [
+        ("get_schema_details Record",
+         lambda service: service.get_schema_details("large", "Record"), plain_schemas, cached_schemas),
+        ("get_path_details /records/{id}",
+         lambda service: service.get_path_details("large", "/records/{id}"), plain_paths, cached_paths),
+        ("get_operation_by_id getRecord (resolved)",
+         lambda service: service.get_operation_by_id("large", "getRecord"), plain_paths, cached_paths),
+    ]
+
+    print(f"Encoder: {'orjson' if orjson is not None else 'json'}, {args.properties} properties, "
+          f"median of {args.runs} runs")
+    print(f"{'case':<42} {'dicts ms':>10} {'fragments ms':>13} {'speedup':>8} {'bytes':>10}")
+    for label, query, plain, cached in cases:
+        before, size = timed(lambda: dict_wire(tool, query(plain)), args.runs)
+        after, _ = timed(lambda: fragment_wire(query(cached)), args.runs)
+        print(f"{label:<42} {before:>10.2f} {after:>13.2f} {before / after:>7.1f}x {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
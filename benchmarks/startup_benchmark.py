@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark
+
+Measures the time from launching the server to the first successful
+`list_apis` response, over STDIO and over streamable HTTP.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--port 8931]
+"""
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import statistics
+import subprocess
+from typing import List
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, 'main.py')
+
+
+async def measure_stdio() -> float:
+    """
+    Spawn the server over STDIO and time the first list_apis call.
+
+    Returns:
+        Seconds from spawning the process to the first response
+    """
+    with open(os.devnull, 'w') as server_log:
+        transport = StdioTransport(
+            sys.executable, [MAIN, '--transport', 'stdio'],
+            cwd=ROOT, keep_alive=False, log_file=server_log
+        )
+        start = time.perf_counter()
+        async with Client(transport) as client:
+            await client.call_tool('list_apis', {})
+            return time.perf_counter() - start
+
+
+async def measure_http(port: int) -> float:
+    """
+    Start the HTTP server and time the first successful list_apis call.
+
+    Returns:
+        Seconds from starting the process to the first response
+    """
+    env = dict(os.environ, DEFAULT_HTTP_PORT=str(port), OPENAPI_WORKERS='1')
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN, '--transport', 'http'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        # Poll the port first so connection errors do not go through the MCP client
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}")
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.05).close()
+                break
+            except OSError:
+                await asyncio.sleep(0.005)
+
+        async with Client(f"http://127.0.0.1:{port}/mcp") as client:
+            await client.call_tool('list_apis', {})
+            return time.perf_counter() - start
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def report(mode: str, samples: List[float]) -> None:
+    """Print min / median / max of one mode in milliseconds."""
+    print(
+        f"{mode:<6} runs={len(samples)}  "
+        f"min={min(samples) * 1000:7.1f} ms  "
+        f"median={statistics.median(samples) * 1000:7.1f} ms  "
+        f"max={max(samples) * 1000:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='launches per mode (default: 5)')
+    parser.add_argument('--port', type=int, default=8931, help='port for the HTTP server (default: 8931)')
+    args = parser.parse_args()
+
+    report('stdio', [await measure_stdio() for _ in range(args.runs)])
+    report('http', [await measure_http(args.port) for _ in range(args.runs)])
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -6,20 +6,43 @@ A MCP server for loading, parsing and querying OpenAPI documents
 Entry point for the server - all logic is organized in the src/ directory
 """
 
+import os
 import logging
+import argparse
+from typing import Optional
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import PlainTextResponse
-from src.config import DEFAULT_HTTP_HOST, DEFAULT_HTTP_PORT
+from starlette.responses import JSONResponse
+from src.config import (
+    DEFAULT_HTTP_HOST,
+    DEFAULT_HTTP_PORT,
+    STORAGE_BACKEND,
+    SQLITE_PATH,
+    WORKERS,
+    TRANSPORT,
+    TRANSPORTS,
+    CATALOG_DIR,
+    COORDINATOR_ADDRESS_ENV,
+    COORDINATOR_AUTHKEY_ENV,
+    PRELOAD_MANIFEST
+)
 from src.storage import OpenAPIStorage
+from src.execution import ToolExecutor
+from src.preloader import Preloader, load_manifest
+from src.watcher import FileWatcher
+from src.prewarmer import OperationPrewarmer
+from src.utils.json_fragments import FragmentCache
+from src.indexers.semantic_indexer import SemanticIndex
 from src.services.api_service import ApiService
 from src.services.path_service import PathService
 from src.services.schema_service import SchemaService
 from src.services.search_service import SearchService
 from src.services.tag_service import TagService
+from src.services.diff_service import DiffService
 from src.tools.loading_tools import register_loading_tools
 from src.tools.query_tools import register_query_tools
 from src.tools.search_tools import register_search_tools
+from src.tools.diff_tools import register_diff_tools
 
 
 class HealthCheckFilter(logging.Filter):
@@ -41,10 +64,21 @@ class HealthCheckFilter(logging.Filter):
         return True
 
 
-def create_app() -> FastMCP:
+def create_app(
+    storage: Optional[OpenAPIStorage] = None,
+    api_service: Optional[ApiService] = None,
+    preload: bool = True
+) -> FastMCP:
     """
     Create and configure the FastMCP application.
 
+    Args:
+        storage: Storage to serve from (defaults to the configured backend)
+        api_service: ApiService to load through (defaults to a local ApiService)
+        preload: Load the APIs of the preload manifest and watch loaded local
+                 files in the background; when False, /health only checks the
+                 storage for the manifest's APIs
+
     Returns:
         Configured FastMCP instance
     """
@@ -52,37 +86,160 @@ def create_app() -> FastMCP:
     mcp = FastMCP("OpenAPI Search MCP")
 
     # Initialize storage layer
-    storage = OpenAPIStorage()
+    if storage is None:
+        backend = None
+        if STORAGE_BACKEND == 'sqlite':
+            from src.backends.sqlite_backend import SQLiteBackend
+            backend = SQLiteBackend(SQLITE_PATH)
+        storage = OpenAPIStorage(backend)
+
+    # Operation vectors for semantic search, filled as APIs are loaded
+    semantic_index = SemanticIndex()
+
+    # Pre-resolved hot operations, re-warmed after loads, and serialized
+    # schemas and operations spliced into large responses
+    prewarmer = OperationPrewarmer(storage)
+    fragments = FragmentCache()
 
     # Initialize service layer (with dependency injection)
-    api_service = ApiService(storage)
-    path_service = PathService(storage)
-    schema_service = SchemaService(storage)
-    search_service = SearchService(storage)
+    api_service = api_service or ApiService(storage, semantic_index, prewarmer)
+    path_service = PathService(storage, prewarmer, fragments)
+    schema_service = SchemaService(storage, fragments)
+    search_service = SearchService(storage, semantic_index)
     tag_service = TagService(storage)
+    diff_service = DiffService(storage)
+
+    # Query tool bodies run in a bounded pool, off the event loop
+    executor = ToolExecutor()
 
     # Register all MCP tools
     register_loading_tools(mcp, api_service)
-    register_query_tools(mcp, path_service, schema_service)
-    register_search_tools(mcp, search_service, tag_service)
+    register_query_tools(mcp, path_service, schema_service, executor)
+    register_search_tools(mcp, search_service, tag_service, executor)
+    register_diff_tools(mcp, diff_service, executor)
+
+    # Load the APIs listed in the preload manifest, if one is configured
+    preloader = None
+    if PRELOAD_MANIFEST:
+        preloader = Preloader(api_service, load_manifest(PRELOAD_MANIFEST))
+        if preload:
+            preloader.start()
+
+    # Reload local files and directories when they change on disk
+    if preload:
+        FileWatcher(api_service).start()
 
     # Register health check endpoint for Docker container monitoring
     @mcp.custom_route("/health", methods=["GET"])
-    async def health_check(request: Request) -> PlainTextResponse:
-        """健康检查端点，用于 Docker 容器监控，不记录访问日志"""
-        return PlainTextResponse("OK")
+    async def health_check(request: Request) -> JSONResponse:
+        """健康检查端点，用于 Docker 容器监控，不记录访问日志；必需的预加载 API 全部就绪前返回 503，并附带工具执行池的计数"""
+        status = {"status": "ready", "apis": {}} if preloader is None else preloader.status(storage)
+        status["executor"] = executor.stats()
+        return JSONResponse(status, status_code=200 if status["status"] == "ready" else 503)
 
     return mcp
 
 
-if __name__ == "__main__":
-    # Configure logging filter to exclude /health endpoint from access logs
+def create_worker_app():
+    """
+    Create the ASGI application for one worker in multi-worker mode.
+
+    Workers serve queries from the shared catalog and forward loads to the
+    coordinator. Sessions are stateless because consecutive requests of one
+    client may reach different workers.
+
+    Returns:
+        Starlette application
+    """
+    from src.backends.shared_catalog import SharedCatalogBackend
+    from src.coordinator import CoordinatorClient, CoordinatedApiService
+
     logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
 
-    # Create the application
-    mcp = create_app()
+    storage = OpenAPIStorage(SharedCatalogBackend(CATALOG_DIR))
+    client = CoordinatorClient(
+        os.environ[COORDINATOR_ADDRESS_ENV],
+        bytes.fromhex(os.environ[COORDINATOR_AUTHKEY_ENV])
+    )
+    # The coordinator preloads the manifest; workers only report its progress
+    mcp = create_app(storage, CoordinatedApiService(storage, client), preload=False)
+    return mcp.http_app(transport="streamable-http", stateless_http=True)
+
+
+def run_multi_worker(workers: int) -> None:
+    """
+    Start the load coordinator and serve HTTP from several worker processes.
+
+    Args:
+        workers: Number of uvicorn worker processes
+    """
+    import secrets
+    import multiprocessing
+    import uvicorn
+    from src.backends.shared_catalog import default_catalog_dir
+    from src.coordinator import run_coordinator
+
+    catalog_dir = CATALOG_DIR or default_catalog_dir()
+    os.makedirs(catalog_dir, exist_ok=True)
+    address = os.path.join(catalog_dir, 'coordinator.sock')
+    authkey = secrets.token_bytes(32)
+
+    # Workers are spawned by uvicorn and inherit these through the environment
+    os.environ['OPENAPI_CATALOG_DIR'] = catalog_dir
+    os.environ[COORDINATOR_ADDRESS_ENV] = address
+    os.environ[COORDINATOR_AUTHKEY_ENV] = authkey.hex()
+
+    coordinator = multiprocessing.Process(
+        target=run_coordinator,
+        args=(catalog_dir, address, authkey),
+        daemon=True
+    )
+    coordinator.start()
+
+    uvicorn.run(
+        "main:create_worker_app",
+        factory=True,
+        host=DEFAULT_HTTP_HOST,
+        port=DEFAULT_HTTP_PORT,
+        workers=workers
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line options.
+
+    Returns:
+        Parsed options (transport)
+    """
+    parser = argparse.ArgumentParser(description="OpenAPI Search MCP Server")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=TRANSPORT,
+        help="'stdio' for clients that spawn the server per session, 'http' for a standalone server "
+             "(default: OPENAPI_TRANSPORT or http)"
+    )
+    args = parser.parse_args()
+    if args.transport not in TRANSPORTS:
+        parser.error(f"invalid OPENAPI_TRANSPORT '{args.transport}' (choose from {', '.join(TRANSPORTS)})")
+    return args
+
 
-    # Start MCP server
-    # For STDIO mode (Claude Desktop): mcp.run()
-    # For HTTP mode: mcp.run(transport="streamable-http", host=DEFAULT_HTTP_HOST, port=DEFAULT_HTTP_PORT)
-    mcp.run(transport="streamable-http", host=DEFAULT_HTTP_HOST, port=DEFAULT_HTTP_PORT)
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.transport == 'stdio':
+        # STDIO mode (Claude Desktop and other clients that spawn the server)
+        create_app().run(transport="stdio")
+    elif WORKERS > 1:
+        run_multi_worker(WORKERS)
+    else:
+        # Configure logging filter to exclude /health endpoint from access logs
+        logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
+
+        # Create the application
+        mcp = create_app()
+
+        # Start MCP server in HTTP mode
+        mcp.run(transport="streamable-http", host=DEFAULT_HTTP_HOST, port=DEFAULT_HTTP_PORT)
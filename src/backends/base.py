@@ -0,0 +1,114 @@
+"""
+Storage backend interface
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class StorageBackend(ABC):
+    """
+    Persistent document store behind OpenAPIStorage.
+
+    OpenAPIStorage keeps hot documents in memory and uses a backend as the
+    cold copy. Shared backends are visible to several processes at once, so
+    the storage syncs its catalog from them instead of tracking names locally.
+
+    Query methods are optional push-downs: returning None means the backend
+    cannot answer the query and the caller should scan the document instead.
+    """
+
+    # True if other processes may add or remove documents in this backend
+    shared = False
+
+    @abstractmethod
+    def save(self, name: str, document_data: Dict[str, Any], summary: Dict[str, Any]) -> int:
+        """
+        Persist a document.
+
+        Args:
+            name: API name
+            document_data: Parsed and indexed OpenAPI document data
+            summary: Lightweight summary used for listings
+
+        Returns:
+            Stored size in bytes
+        """
+
+    @abstractmethod
+    def load(self, name: str) -> Dict[str, Any]:
+        """
+        Load a document.
+
+        Args:
+            name: API name
+
+        Returns:
+            Document data
+        """
+
+    @abstractmethod
+    def delete(self, name: str) -> None:
+        """
+        Delete a document if present.
+
+        Args:
+            name: API name
+        """
+
+    def catalog(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List documents held by a shared backend.
+
+        Returns:
+            Dictionary mapping API name to {generation, size_bytes, summary}
+        """
+        raise NotImplementedError
+
+    def catalog_version(self) -> Any:
+        """
+        Get a cheap token that changes whenever the catalog of a shared backend changes.
+
+        Callers re-read catalog() only when the token differs from the one
+        they saw last.
+
+        Returns:
+            Comparable token
+        """
+        raise NotImplementedError
+
+    def search_operations(
+        self,
+        name: str,
+        keyword: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None
+    ) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Search operations by keyword, method and tag.
+
+        Returns:
+            Tuple of (generation, matching endpoints in document order), both
+            read in one transaction, or None if not supported or not stored
+        """
+        return None
+
+    def find_operations_by_tag(self, name: str, tag: str) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        List operations carrying a tag.
+
+        Returns:
+            Tuple of (generation, matching endpoints in document order), both
+            read in one transaction, or None if not supported or not stored
+        """
+        return None
+
+    def get_schema(self, name: str, schema_name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get a single component schema.
+
+        Returns:
+            Tuple of (generation, schema definition), both read in one
+            transaction, or None if missing or not supported
+        """
+        return None
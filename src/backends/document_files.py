@@ -0,0 +1,62 @@
+"""
+Document file formats shared by file-based backends
+"""
+
+import os
+import mmap
+import pickle
+from typing import Dict, Any
+from src.utils.compiled_tree import write_compiled, read_compiled
+
+FORMAT_PICKLE = 'pickle'
+FORMAT_COMPILED = 'compiled'
+
+FILE_EXTENSIONS = {
+    FORMAT_PICKLE: '.pickle',
+    FORMAT_COMPILED: '.oapc',
+}
+
+
+def write_document_file(path: str, document_data: Dict[str, Any], document_format: str) -> int:
+    """
+    Write a document file atomically.
+
+    Args:
+        path: Destination path
+        document_data: Parsed and indexed OpenAPI document data
+        document_format: FORMAT_PICKLE or FORMAT_COMPILED
+
+    Returns:
+        Number of bytes written
+    """
+    if document_format == FORMAT_COMPILED:
+        return write_compiled(path, document_data)
+
+    blob = pickle.dumps(document_data, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(blob)
+
+
+def read_document_file(path: str, document_format: str) -> Dict[str, Any]:
+    """
+    Read a document file through mmap.
+
+    Pickle files are decoded in full. Compiled files are returned as a
+    read-only view that decodes nodes on access.
+
+    Args:
+        path: File path
+        document_format: FORMAT_PICKLE or FORMAT_COMPILED
+
+    Returns:
+        Document data (a plain dict or a CompiledMapping)
+    """
+    if document_format == FORMAT_COMPILED:
+        return read_compiled(path)
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return pickle.loads(mapped)
@@ -0,0 +1,211 @@
+"""
+Shared-memory document catalog for multi-worker deployments
+"""
+
+import os
+import json
+import fcntl
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator
+from src.config import DOCUMENT_FORMAT
+from src.backends.base import StorageBackend
+from src.backends.document_files import write_document_file, read_document_file, FILE_EXTENSIONS
+
+
+MANIFEST_FILE = 'catalog.json'
+LOCK_FILE = 'catalog.lock'
+
+
+def default_catalog_dir() -> str:
+    """
+    Pick a catalog directory, preferring tmpfs so blobs live in shared memory.
+
+    Returns:
+        Directory path
+    """
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(base, 'openapi-search-catalog')
+
+
+class SharedCatalogBackend(StorageBackend):
+    """
+    Publishes documents as immutable blobs in a shared directory.
+
+    Every save writes a new blob file and atomically swaps a JSON manifest
+    mapping API names to {generation, blob, size_bytes, summary}. Generations
+    come from a catalog-wide sequence kept in the manifest, so a removed and
+    re-added API never repeats one. Readers
+    never see a partially written document: they memory-map the blob named
+    by the manifest they read. On tmpfs the blob pages are shared by every
+    process that maps them. With the compiled format, workers serve queries
+    straight from the shared mapping and only decode the subtrees they return.
+    """
+
+    shared = True
+
+    def __init__(self, directory: str = None, document_format: str = None):
+        """
+        Initialize SharedCatalogBackend.
+
+        Args:
+            directory: Catalog directory (defaults to default_catalog_dir())
+            document_format: 'pickle' or 'compiled' (defaults to DOCUMENT_FORMAT)
+        """
+        self.directory = directory or default_catalog_dir()
+        self.document_format = document_format or DOCUMENT_FORMAT
+        os.makedirs(self.directory, exist_ok=True)
+        self._manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        self._manifest_key = None
+        self._manifest: Dict[str, Any] = {"sequence": 0, "apis": {}}
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize manifest updates across processes."""
+        with open(os.path.join(self.directory, LOCK_FILE), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """
+        Read the manifest ({sequence, apis}), re-parsing it only when the file changed.
+        """
+        try:
+            stat = os.stat(self._manifest_path)
+        except FileNotFoundError:
+            return {"sequence": 0, "apis": {}}
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._manifest_key:
+            with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if 'apis' not in manifest:
+                # Manifest written before the catalog-wide sequence was added
+                apis = manifest
+                manifest = {
+                    "sequence": max((entry['generation'] for entry in apis.values()), default=0),
+                    "apis": apis
+                }
+            self._manifest = manifest
+            self._manifest_key = key
+        return self._manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Atomically replace the manifest."""
+        tmp_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, default=str)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _write_blob(self, name: str, generation: int, document_data: Dict[str, Any]) -> tuple[str, int]:
+        """Write an immutable blob file and return its file name and size."""
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+        blob_name = f"{digest}-{generation}{FILE_EXTENSIONS[self.document_format]}"
+        size = write_document_file(os.path.join(self.directory, blob_name), document_data, self.document_format)
+        return blob_name, size
+
+    def _remove_blob(self, blob_name: str) -> None:
+        """Unlink a superseded blob; processes that mapped it keep their view."""
+        try:
+            os.remove(os.path.join(self.directory, blob_name))
+        except FileNotFoundError:
+            pass
+
+    def save(self, name: str, document_data: Dict[str, Any], summary: Dict[str, Any]) -> int:
+        """
+        Publish a new generation of a document.
+
+        Args:
+            name: API name
+            document_data: Parsed and indexed OpenAPI document data
+            summary: Lightweight summary used for listings
+
+        Returns:
+            Blob size in bytes
+        """
+        with self._write_lock():
+            manifest = self._read_manifest()
+            apis = dict(manifest['apis'])
+            previous = apis.get(name)
+            generation = manifest['sequence'] + 1
+            blob_name, size = self._write_blob(name, generation, document_data)
+
+            apis[name] = {
+                "generation": generation,
+                "blob": blob_name,
+                "size_bytes": size,
+                "summary": summary
+            }
+            self._write_manifest({"sequence": generation, "apis": apis})
+
+            if previous:
+                self._remove_blob(previous['blob'])
+
+        return size
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """
+        Decode the current generation of a document from its mapped blob.
+
+        Args:
+            name: API name
+
+        Returns:
+            Document data
+
+        Raises:
+            KeyError: If the API is not in the catalog
+        """
+        try:
+            return self._load_blob(self._read_manifest()['apis'][name]['blob'])
+        except FileNotFoundError:
+            # A newer generation replaced the blob after we read the manifest
+            self._manifest_key = None
+            return self._load_blob(self._read_manifest()['apis'][name]['blob'])
+
+    def _load_blob(self, blob_name: str) -> Dict[str, Any]:
+        """Read a blob file through mmap."""
+        return read_document_file(os.path.join(self.directory, blob_name), self.document_format)
+
+    def delete(self, name: str) -> None:
+        """
+        Remove a document from the catalog.
+
+        Args:
+            name: API name
+        """
+        with self._write_lock():
+            manifest = self._read_manifest()
+            apis = dict(manifest['apis'])
+            entry = apis.pop(name, None)
+            if entry is None:
+                return
+            # Advance the sequence so readers see the catalog change
+            self._write_manifest({"sequence": manifest['sequence'] + 1, "apis": apis})
+            self._remove_blob(entry['blob'])
+
+    def catalog(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List published documents.
+
+        Returns:
+            Dictionary mapping API name to {generation, size_bytes, summary}
+        """
+        return self._read_manifest()['apis']
+
+    def catalog_version(self) -> Any:
+        """
+        Get the identity of the current manifest file, which every save and delete replaces.
+
+        Returns:
+            (inode, mtime, size) of the manifest, or None if there is none yet
+        """
+        try:
+            stat = os.stat(self._manifest_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
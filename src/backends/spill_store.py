@@ -0,0 +1,83 @@
+"""
+On-disk spill store for evicted OpenAPI documents
+"""
+
+import os
+import hashlib
+import tempfile
+from typing import Dict, Any
+from src.config import DOCUMENT_FORMAT
+from src.backends.base import StorageBackend
+from src.backends.document_files import write_document_file, read_document_file, FILE_EXTENSIONS
+
+
+class SpillStore(StorageBackend):
+    """
+    Persists evicted documents as files in a local directory.
+
+    Each API is written once when it is added (write-through), so evicting
+    it from memory only drops the in-memory reference. With the compiled
+    format, rehydration maps the file and decodes subtrees on access.
+    """
+
+    def __init__(self, directory: str = None, document_format: str = None):
+        """
+        Initialize SpillStore.
+
+        Args:
+            directory: Spill directory; a private temporary directory is created if omitted
+            document_format: 'pickle' or 'compiled' (defaults to DOCUMENT_FORMAT)
+        """
+        self.directory = directory or tempfile.mkdtemp(prefix='openapi-spill-')
+        self.document_format = document_format or DOCUMENT_FORMAT
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path_for(self, name: str) -> str:
+        """
+        Get the spill file path for an API name.
+
+        API names are hashed so arbitrary names map to safe file names.
+        """
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{digest}{FILE_EXTENSIONS[self.document_format]}")
+
+    def save(self, name: str, document_data: Dict[str, Any], summary: Dict[str, Any]) -> int:
+        """
+        Write a document to the spill store.
+
+        Args:
+            name: API name
+            document_data: Document data to persist
+            summary: Unused; summaries stay in memory for private backends
+
+        Returns:
+            Number of bytes written
+        """
+        return write_document_file(self._path_for(name), document_data, self.document_format)
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """
+        Read a document back from the spill store.
+
+        Args:
+            name: API name
+
+        Returns:
+            Document data
+
+        Raises:
+            FileNotFoundError: If the API was never spilled
+        """
+        return read_document_file(self._path_for(name), self.document_format)
+
+    def delete(self, name: str) -> None:
+        """
+        Remove a document from the spill store if present.
+
+        Args:
+            name: API name
+        """
+        try:
+            os.remove(self._path_for(name))
+        except FileNotFoundError:
+            pass
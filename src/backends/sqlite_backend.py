@@ -0,0 +1,407 @@
+"""
+SQLite storage backend with an FTS5 operation index
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from src.config import HTTP_METHODS
+from src.backends.base import StorageBackend
+
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS apis (
+    name TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    document BLOB NOT NULL
+);
+
+-- Catalog-wide sequence of generations; bumped by every save and delete so a
+-- removed and re-added API never repeats a (name, generation) pair
+CREATE TABLE IF NOT EXISTS catalog_sequence (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO catalog_sequence
+    SELECT 0, COALESCE(MAX(generation), 0) FROM apis;
+
+CREATE TABLE IF NOT EXISTS operations (
+    api TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    method TEXT NOT NULL,
+    operation_id TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    search_path TEXT NOT NULL,
+    search_summary TEXT NOT NULL,
+    search_description TEXT NOT NULL,
+    PRIMARY KEY (api, position)
+);
+CREATE INDEX IF NOT EXISTS idx_operations_method ON operations (api, method);
+
+CREATE TABLE IF NOT EXISTS operation_tags (
+    api TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (api, tag, position)
+);
+
+CREATE TABLE IF NOT EXISTS schemas (
+    api TEXT NOT NULL,
+    name TEXT NOT NULL,
+    schema TEXT NOT NULL,
+    PRIMARY KEY (api, name)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS operations_fts USING fts5(
+    api UNINDEXED,
+    position UNINDEXED,
+    search_path,
+    search_summary,
+    search_description,
+    tokenize = 'trigram'
+);
+"""
+
+# The trigram tokenizer cannot match keywords shorter than three characters
+FTS_MIN_KEYWORD_LENGTH = 3
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Stores documents, operations and schemas in an SQLite database.
+
+    The database runs in WAL mode so many processes can read it while one
+    writes. Operations are indexed by method and tag, and their path,
+    summary and description are indexed in an FTS5 trigram table, which
+    answers the same case-insensitive substring queries as SearchService.
+    """
+
+    shared = True
+
+    def __init__(self, path: str):
+        """
+        Initialize SQLiteBackend.
+
+        Args:
+            path: Database file path
+        """
+        self.path = path
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA_SQL)
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection owned by the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _read_snapshot(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run several reads against one snapshot of the database.
+
+        In WAL mode a read transaction sees the database as of its first
+        read, so commits by other connections meanwhile are not seen.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.commit()
+
+    @staticmethod
+    def _generation(conn: sqlite3.Connection, name: str) -> Optional[int]:
+        """Get the stored generation of an API, or None if it is not stored."""
+        row = conn.execute("SELECT generation FROM apis WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, name: str, document_data: Dict[str, Any], summary: Dict[str, Any]) -> int:
+        """
+        Persist a document and rebuild its operation, schema and search rows.
+
+        Args:
+            name: API name
+            document_data: Parsed and indexed OpenAPI document data
+            summary: Lightweight summary used for listings
+
+        Returns:
+            Stored size in bytes
+        """
+        blob = pickle.dumps(document_data, protocol=pickle.HIGHEST_PROTOCOL)
+        conn = self._connection()
+
+        with conn:
+            self._delete_rows(conn, name)
+            generation = self._next_generation(conn)
+            conn.execute(
+                """
+                INSERT INTO apis (name, generation, size_bytes, summary, document)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    generation = excluded.generation,
+                    size_bytes = excluded.size_bytes,
+                    summary = excluded.summary,
+                    document = excluded.document
+                """,
+                (name, generation, len(blob), json.dumps(summary, default=str), blob)
+            )
+
+            operations, operation_tags, fts_rows = self._operation_rows(name, document_data.get('paths', {}))
+            conn.executemany(
+                "INSERT INTO operations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                operations
+            )
+            conn.executemany("INSERT OR IGNORE INTO operation_tags VALUES (?, ?, ?)", operation_tags)
+            conn.executemany("INSERT INTO operations_fts VALUES (?, ?, ?, ?, ?)", fts_rows)
+
+            schemas = document_data.get('components', {}).get('schemas', {})
+            conn.executemany(
+                "INSERT INTO schemas VALUES (?, ?, ?)",
+                [(name, schema_name, json.dumps(schema, default=str)) for schema_name, schema in schemas.items()]
+            )
+
+        return len(blob)
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """
+        Load a document.
+
+        Args:
+            name: API name
+
+        Returns:
+            Document data
+
+        Raises:
+            KeyError: If the API is not stored
+        """
+        row = self._connection().execute("SELECT document FROM apis WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return pickle.loads(row[0])
+
+    def delete(self, name: str) -> None:
+        """
+        Delete a document and all of its rows.
+
+        Args:
+            name: API name
+        """
+        conn = self._connection()
+        with conn:
+            self._delete_rows(conn, name)
+            if conn.execute("DELETE FROM apis WHERE name = ?", (name,)).rowcount:
+                self._next_generation(conn)
+
+    def catalog(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List stored documents.
+
+        Returns:
+            Dictionary mapping API name to {generation, size_bytes, summary}
+        """
+        rows = self._connection().execute("SELECT name, generation, size_bytes, summary FROM apis")
+        return {
+            name: {
+                "generation": generation,
+                "size_bytes": size_bytes,
+                "summary": json.loads(summary)
+            }
+            for name, generation, size_bytes, summary in rows
+        }
+
+    def catalog_version(self) -> int:
+        """
+        Get the catalog sequence, which every save and delete advances.
+
+        Returns:
+            Current sequence value
+        """
+        return self._connection().execute("SELECT value FROM catalog_sequence WHERE id = 0").fetchone()[0]
+
+    def search_operations(
+        self,
+        name: str,
+        keyword: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None
+    ) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Search operations with indexed SQL.
+
+        Args:
+            name: API name
+            keyword: Case-insensitive substring of path, summary or description (optional)
+            method: Lowercase HTTP method filter (optional)
+            tag: Tag filter (optional)
+
+        Returns:
+            Tuple of (generation, matching endpoints in document order), or None if not stored
+        """
+        sql = "SELECT o.path, o.method, o.operation_id, o.summary, o.tags FROM operations o"
+        conditions = ["o.api = ?"]
+        params: List[Any] = [name]
+
+        if tag:
+            sql += " JOIN operation_tags t ON t.api = o.api AND t.position = o.position AND t.tag = ?"
+            params.insert(0, tag)
+
+        if method:
+            conditions.append("o.method = ?")
+            params.append(method)
+
+        if keyword:
+            keyword_lower = keyword.lower()
+            if len(keyword_lower) >= FTS_MIN_KEYWORD_LENGTH:
+                conditions.append(
+                    "o.position IN (SELECT position FROM operations_fts WHERE operations_fts MATCH ? AND api = ?)"
+                )
+                params.extend(['"' + keyword_lower.replace('"', '""') + '"', name])
+            else:
+                conditions.append(
+                    "(instr(o.search_path, ?) > 0 OR instr(o.search_summary, ?) > 0 "
+                    "OR instr(o.search_description, ?) > 0)"
+                )
+                params.extend([keyword_lower] * 3)
+
+        sql += " WHERE " + " AND ".join(conditions) + " ORDER BY o.position"
+
+        with self._read_snapshot() as conn:
+            generation = self._generation(conn, name)
+            if generation is None:
+                return None
+            rows = conn.execute(sql, params).fetchall()
+
+        return generation, [
+            {
+                "path": path,
+                "method": http_method,
+                "operationId": operation_id,
+                "summary": summary,
+                "tags": json.loads(tags)
+            }
+            for path, http_method, operation_id, summary, tags in rows
+        ]
+
+    def find_operations_by_tag(self, name: str, tag: str) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        List operations carrying a tag using the tag index.
+
+        Args:
+            name: API name
+            tag: Tag name
+
+        Returns:
+            Tuple of (generation, matching endpoints in document order), or None if not stored
+        """
+        with self._read_snapshot() as conn:
+            generation = self._generation(conn, name)
+            if generation is None:
+                return None
+            rows = conn.execute(
+                """
+                SELECT o.path, o.method, o.operation_id, o.summary
+                FROM operation_tags t
+                JOIN operations o ON o.api = t.api AND o.position = t.position
+                WHERE t.api = ? AND t.tag = ?
+                ORDER BY t.position
+                """,
+                (name, tag)
+            ).fetchall()
+
+        return generation, [
+            {
+                "path": path,
+                "method": method,
+                "operationId": operation_id,
+                "summary": summary
+            }
+            for path, method, operation_id, summary in rows
+        ]
+
+    def get_schema(self, name: str, schema_name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get a single component schema.
+
+        Args:
+            name: API name
+            schema_name: Schema name
+
+        Returns:
+            Tuple of (generation, schema definition), or None if missing
+        """
+        row = self._connection().execute(
+            "SELECT a.generation, s.schema FROM apis a JOIN schemas s ON s.api = a.name "
+            "WHERE a.name = ? AND s.name = ?",
+            (name, schema_name)
+        ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    @staticmethod
+    def _next_generation(conn: sqlite3.Connection) -> int:
+        """Advance the catalog sequence inside the current write transaction and return its new value."""
+        conn.execute("UPDATE catalog_sequence SET value = value + 1 WHERE id = 0")
+        return conn.execute("SELECT value FROM catalog_sequence WHERE id = 0").fetchone()[0]
+
+    @staticmethod
+    def _delete_rows(conn: sqlite3.Connection, name: str) -> None:
+        """Delete the derived rows of an API."""
+        conn.execute("DELETE FROM operations WHERE api = ?", (name,))
+        conn.execute("DELETE FROM operation_tags WHERE api = ?", (name,))
+        conn.execute("DELETE FROM operations_fts WHERE api = ?", (name,))
+        conn.execute("DELETE FROM schemas WHERE api = ?", (name,))
+
+    @staticmethod
+    def _operation_rows(name: str, paths: Dict[str, Any]) -> tuple[list, list, list]:
+        """
+        Flatten the paths section into operation, tag and full-text rows.
+
+        Positions follow the iteration order SearchService uses, so ordering
+        by position reproduces its result order.
+        """
+        operations = []
+        operation_tags = []
+        fts_rows = []
+        position = 0
+
+        for path, path_item in paths.items():
+            if not isinstance(path_item, dict):
+                continue
+
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, dict):
+                    continue
+
+                tags = operation.get('tags', [])
+                search_path = path.lower()
+                search_summary = (operation.get('summary') or '').lower()
+                search_description = (operation.get('description') or '').lower()
+
+                operations.append((
+                    name, position, path, method,
+                    operation.get('operationId', ''),
+                    operation.get('summary', ''),
+                    json.dumps(tags, default=str),
+                    search_path, search_summary, search_description
+                ))
+                operation_tags.extend((name, tag, position) for tag in tags)
+                fts_rows.append((name, position, search_path, search_summary, search_description))
+                position += 1
+
+        return operations, operation_tags, fts_rows
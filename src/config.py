@@ -2,21 +2,205 @@
 Configuration constants for the OpenAPI Search MCP Server
 """
 
+import os
+
 # HTTP methods supported by OpenAPI
 HTTP_METHODS = ['get', 'post', 'put', 'delete', 'patch', 'options', 'head', 'trace']
 
-# HTTP client timeout in seconds
-HTTP_TIMEOUT = 30.0
+# HTTP client timeouts in seconds: for establishing a connection, and for
+# each read of the response body (a stalled download fails after this long)
+HTTP_CONNECT_TIMEOUT = float(os.environ.get('OPENAPI_HTTP_CONNECT_TIMEOUT', '10'))
+HTTP_READ_TIMEOUT = float(os.environ.get('OPENAPI_HTTP_READ_TIMEOUT', '30'))
+
+# Largest accepted document body in bytes (0 disables the limit)
+MAX_DOCUMENT_BYTES = int(float(os.environ.get('OPENAPI_MAX_DOCUMENT_MB', '200')) * 1024 * 1024)
+
+# Chunk size for streaming document downloads
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Downloaded bytes between two progress reports of a document load
+PROGRESS_INTERVAL_BYTES = 1024 * 1024
+
+# Local files: extensions loaded from a directory, seconds between polls for
+# changes to loaded files (0 disables watching), and processes parsing changed
+# files in parallel
+SPEC_FILE_EXTENSIONS = ('.json', '.yaml', '.yml')
+FILE_WATCH_INTERVAL = float(os.environ.get('OPENAPI_FILE_WATCH_INTERVAL', '2'))
+FILE_PARSE_WORKERS = int(os.environ.get('OPENAPI_FILE_PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# Directories the load_openapi tool may read file:// URLs from, separated by
+# os.pathsep (":" on Linux). Empty refuses local files from the tool; the
+# preload manifest may name any file.
+LOCAL_ROOTS = [root for root in os.environ.get('OPENAPI_LOCAL_ROOTS', '').split(os.pathsep) if root]
+
+# External $ref resolution: cached fetched documents, their lifetime in seconds,
+# and the number of documents fetched concurrently
+EXTERNAL_REF_CACHE_SIZE = int(os.environ.get('OPENAPI_REF_CACHE_SIZE', '256'))
+EXTERNAL_REF_CACHE_TTL = float(os.environ.get('OPENAPI_REF_CACHE_TTL', '600'))
+EXTERNAL_REF_CONCURRENCY = 8
+
+# Named projection levels for operation payloads: the operation fields each level
+# returns (dotted paths, '*' wildcards allowed). None returns the whole operation.
+PROJECTION_LEVELS = {
+    'summary': ['operationId', 'summary', 'tags', 'deprecated'],
+    'signature': [
+        'operationId', 'summary', 'tags', 'deprecated',
+        'parameters', 'requestBody', 'responses.2*', 'security'
+    ],
+    'full': None
+}
+
+# Semantic search: size of the hashed operation vectors and groups of words treated
+# as related. Rows are float32, so 100k operations take dimensions * 400 KB and a
+# query reads all of it; 128 keeps that scan in single-digit milliseconds.
+SEMANTIC_DIMENSIONS = int(os.environ.get('OPENAPI_SEMANTIC_DIMENSIONS', '128'))
+# Hashed features (words, synonym groups, trigrams) whose columns are kept; least
+# recently used ones beyond this are hashed again when next seen
+SEMANTIC_FEATURE_CACHE_SIZE = 65536
+SEMANTIC_SYNONYM_GROUPS = [
+    ['cancel', 'terminate', 'delete', 'remove', 'revoke', 'destroy', 'void', 'end', 'stop', 'disable', 'deactivate'],
+    ['create', 'add', 'new', 'make', 'register', 'insert', 'post', 'open', 'start', 'enable', 'activate'],
+    ['get', 'fetch', 'retrieve', 'read', 'show', 'view', 'describe', 'detail', 'lookup', 'find'],
+    ['list', 'search', 'query', 'browse', 'enumerate', 'all', 'filter', 'index'],
+    ['update', 'modify', 'edit', 'change', 'patch', 'put', 'set', 'replace', 'rename'],
+    ['subscription', 'plan', 'membership', 'tier', 'package', 'recurring'],
+    ['user', 'account', 'member', 'customer', 'profile', 'person', 'owner'],
+    ['payment', 'charge', 'transaction', 'transfer', 'payout', 'pay'],
+    ['invoice', 'bill', 'billing', 'receipt', 'statement'],
+    ['refund', 'reimburse', 'chargeback', 'reverse'],
+    ['order', 'purchase', 'checkout', 'cart', 'basket'],
+    ['product', 'item', 'sku', 'catalog', 'article', 'good'],
+    ['login', 'signin', 'authenticate', 'auth', 'session', 'token', 'credential'],
+    ['logout', 'signout'],
+    ['password', 'passphrase', 'secret', 'pin'],
+    ['file', 'upload', 'attachment', 'document', 'blob', 'media'],
+    ['image', 'photo', 'picture', 'avatar', 'thumbnail'],
+    ['message', 'email', 'mail', 'notification', 'notify', 'sms', 'alert'],
+    ['team', 'group', 'organization', 'org', 'workspace', 'tenant'],
+    ['permission', 'role', 'access', 'grant', 'scope', 'privilege'],
+    ['setting', 'config', 'configuration', 'preference', 'option'],
+    ['count', 'total', 'number', 'stat', 'statistic', 'metric', 'usage'],
+    ['address', 'location', 'place', 'geo'],
+    ['comment', 'reply', 'note', 'review', 'feedback'],
+    ['webhook', 'callback', 'hook', 'event', 'subscriber'],
+    ['status', 'state', 'health', 'progress']
+]
+
+# Fields list_apis can sort by: listing fields and per-API statistics
+API_SORT_KEYS = [
+    'name', 'title', 'paths_count', 'tags_count', 'operations_count', 'deprecated_count',
+    'schema_count', 'max_schema_depth', 'raw_bytes', 'parse_ms', 'index_ms'
+]
+
+# Tool execution: worker threads for synchronous tool bodies, requests allowed to
+# wait for a worker before new ones are rejected as busy, and the per-request
+# deadline in seconds (0 disables it)
+TOOL_WORKERS = int(os.environ.get('OPENAPI_TOOL_WORKERS', '4'))
+TOOL_QUEUE_DEPTH = int(os.environ.get('OPENAPI_TOOL_QUEUE_DEPTH', '32'))
+TOOL_TIMEOUT = float(os.environ.get('OPENAPI_TOOL_TIMEOUT', '30'))
+
+# Pre-warming of hot resolved operations: memory budget for pre-resolved results
+# (0 disables it) and cache misses before the warm set is recomputed
+PREWARM_BUDGET_BYTES = int(float(os.environ.get('OPENAPI_PREWARM_BUDGET_MB', '16')) * 1024 * 1024)
+PREWARM_REPLAN_MISSES = int(os.environ.get('OPENAPI_PREWARM_REPLAN_MISSES', '64'))
+# Operations whose lookups are counted at most; beyond this all counts are halved
+# and operations that drop to zero are forgotten, so old traffic fades out
+PREWARM_MAX_TRACKED = int(os.environ.get('OPENAPI_PREWARM_MAX_TRACKED', '10000'))
+
+# Serialized JSON of schemas and (resolved) operations kept for splicing into
+# responses, in bytes (0 disables the cache)
+FRAGMENT_CACHE_BYTES = int(float(os.environ.get('OPENAPI_FRAGMENT_CACHE_MB', '64')) * 1024 * 1024)
+
+# Pattern search: characters per n-gram of the prefilter index, compiled
+# patterns kept, and the longest pattern accepted
+NGRAM_SIZE = 3
+PATTERN_CACHE_SIZE = int(os.environ.get('OPENAPI_PATTERN_CACHE_SIZE', '256'))
+MAX_PATTERN_LENGTH = 256
+
+# Most quantifiers over overlapping characters a pattern may chain, as in
+# a.*b.*c (two); each one more multiplies worst-case matching time by the text length
+MAX_AMBIGUOUS_REPEATS = 2
+
+# Seconds one pattern match may run when the optional `regex` package is
+# installed (0: limited by the request deadline only)
+PATTERN_MATCH_TIMEOUT = float(os.environ.get('OPENAPI_PATTERN_MATCH_TIMEOUT', '1'))
+
+# Operation fields pattern_search can match
+PATTERN_FIELDS = ('path', 'operationId', 'summary')
+PATTERN_SYNTAXES = ('regex', 'glob')
+
+# Maximum concurrent bodies for expensive tools (others may use every worker)
+TOOL_CONCURRENCY_LIMITS = {
+    'get_operations_by_ids': 2,
+    'search_endpoints': 2,
+    'pattern_search': 2,
+    'semantic_search': 2,
+    'diff_apis': 1
+}
+
+# MCP transport: "stdio" for clients that spawn the server per session,
+# "http" (streamable HTTP) for a standalone server
+TRANSPORTS = ('stdio', 'http')
+TRANSPORT = os.environ.get('OPENAPI_TRANSPORT', 'http').lower()
 
 # Default HTTP server settings
 DEFAULT_HTTP_HOST = "0.0.0.0"  # Listen on all network interfaces
-DEFAULT_HTTP_PORT = 8848
+DEFAULT_HTTP_PORT = int(os.environ.get('DEFAULT_HTTP_PORT', '8848'))
+
+# Memory budget for resident documents in bytes (0 disables eviction).
+# Cold APIs beyond the budget are spilled to SPILL_DIR and rehydrated on demand.
+# Each resident document is charged its estimated in-memory size, several
+# times its stored size; compiled documents are charged their mapped file.
+MEMORY_BUDGET_BYTES = int(float(os.environ.get('OPENAPI_MEMORY_BUDGET_MB', '0')) * 1024 * 1024)
+
+# Children of a container measured when estimating a document's memory
+MEMORY_SAMPLE_CHILDREN = 64
+SPILL_DIR = os.environ.get('OPENAPI_SPILL_DIR') or None
+
+# Storage backend: "memory" (default) or "sqlite" for a catalog shared across processes
+STORAGE_BACKEND = os.environ.get('OPENAPI_STORAGE_BACKEND', 'memory').lower()
+SQLITE_PATH = os.environ.get('OPENAPI_SQLITE_PATH', 'openapi_catalog.db')
+
+# Multi-worker mode: with more than one worker, a coordinator process owns loading
+# and publishes documents to a shared-memory catalog read by all workers
+WORKERS = int(os.environ.get('OPENAPI_WORKERS', '1'))
+
+# File format for spilled and shared documents: "pickle" (decoded in full on load)
+# or "compiled" (memory-mapped node table, subtrees decoded on access). Multi-worker
+# mode defaults to compiled: pickled blobs are decoded into a private copy in every
+# worker, while compiled blobs are served from page-cache pages all workers share.
+DOCUMENT_FORMAT = os.environ.get('OPENAPI_DOCUMENT_FORMAT', 'compiled' if WORKERS > 1 else 'pickle').lower()
+CATALOG_DIR = os.environ.get('OPENAPI_CATALOG_DIR') or None
+COORDINATOR_ADDRESS_ENV = 'OPENAPI_COORDINATOR_ADDRESS'
+COORDINATOR_AUTHKEY_ENV = 'OPENAPI_COORDINATOR_AUTHKEY'
+
+# Startup preload: a JSON or YAML manifest of APIs to load when the server starts,
+# and how many of them may load at the same time
+PRELOAD_MANIFEST = os.environ.get('OPENAPI_PRELOAD_MANIFEST') or None
+PRELOAD_CONCURRENCY = int(os.environ.get('OPENAPI_PRELOAD_CONCURRENCY', '4'))
 
 # Error message templates
 ERROR_API_NOT_FOUND = "API '{name}' not found. Available APIs: {available}"
 ERROR_PATH_NOT_FOUND = "Path '{path}' not found in API '{name}'"
 ERROR_SCHEMA_NOT_FOUND = "Schema '{schema_name}' not found in API '{name}'. Available schemas: {available}"
 ERROR_OPERATION_NOT_FOUND = "Operation ID '{operation_id}' not found in API '{name}'"
+ERROR_UNKNOWN_PROJECTION_LEVEL = "Unknown projection level '{level}'. Available levels: {available}"
+ERROR_UNKNOWN_SORT_KEY = "Unknown sort key '{key}'. Available keys: {available}"
+ERROR_PATH_PREFIX_NOT_FOUND = "No paths under prefix '{prefix}' in API '{name}'"
+ERROR_SECURITY_SCHEME_NOT_FOUND = "Security scheme '{scheme}' not found in API '{name}'. Available schemes: {available}"
+ERROR_POINTER_NOT_FOUND = "JSON pointer '{pointer}' not found in API '{name}'"
+ERROR_UNKNOWN_PATTERN_FIELD = "Unknown field '{field}'. Available fields: {available}"
+ERROR_UNKNOWN_PATTERN_SYNTAX = "Unknown pattern syntax '{syntax}'. Available syntaxes: {available}"
+ERROR_INVALID_PATTERN = "Invalid pattern '{pattern}': {reason}"
+ERROR_PATTERN_TIMEOUT = "Pattern '{pattern}' took longer than {timeout}s to match one {field}; simplify it"
+ERROR_TOOL_BUSY = "Server busy: too many requests waiting for '{tool}', retry shortly"
+ERROR_TOOL_DEADLINE = "Tool '{tool}' did not finish within its {timeout}s deadline"
 ERROR_INVALID_OPENAPI_MISSING_VERSION = "Invalid OpenAPI document: missing 'openapi' or 'swagger' field"
 ERROR_INVALID_OPENAPI_MISSING_INFO = "Invalid OpenAPI document: missing 'info' field"
 ERROR_INVALID_OPENAPI_MISSING_PATHS = "Invalid OpenAPI document: missing 'paths' field"
+ERROR_EXTERNAL_REF_REFUSED = (
+    "Refused to follow $ref '{ref}' in {document}: documents loaded over {scheme} "
+    "may only reference {allowed} documents"
+)
+ERROR_LOCAL_FILE_REFUSED = "Refused to read '{path}': local files must be under OPENAPI_LOCAL_ROOTS ({roots})"
+ERROR_LOCAL_REF_REFUSED = "Refused to follow $ref '{ref}' in {document}: '{path}' is outside OPENAPI_LOCAL_ROOTS"
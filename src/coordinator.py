@@ -0,0 +1,170 @@
+"""
+Load coordinator for multi-worker deployments
+"""
+
+import os
+import asyncio
+import logging
+import threading
+from multiprocessing.connection import Listener, Client, Connection
+from typing import Dict, Any, Optional
+from src.config import PRELOAD_MANIFEST
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.watcher import FileWatcher
+from src.loaders.openapi_loader import ProgressCallback
+from src.backends.shared_catalog import SharedCatalogBackend
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoadCoordinator:
+    """
+    Owns document loading for a group of workers.
+
+    Workers forward load requests over a local connection. The coordinator
+    fetches, validates and indexes the document once, then publishes it to
+    the shared catalog, where every worker picks it up on its next query.
+    """
+
+    def __init__(self, catalog_dir: str, address: str, authkey: bytes):
+        """
+        Initialize LoadCoordinator.
+
+        Args:
+            catalog_dir: Shared catalog directory
+            address: Listener address (a Unix socket path)
+            authkey: Shared secret workers must present
+        """
+        self.address = address
+        self.authkey = authkey
+        # The coordinator only publishes documents, so keep at most one resident
+        storage = OpenAPIStorage(SharedCatalogBackend(catalog_dir), memory_budget_bytes=1)
+        self.api_service = ApiService(storage)
+
+    def serve_forever(self) -> None:
+        """Accept worker connections and serve each in its own thread."""
+        # Remove a socket left behind by a previous run
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        with Listener(self.address, family='AF_UNIX', authkey=self.authkey) as listener:
+            logger.info("Load coordinator listening on %s", self.address)
+            while True:
+                conn = listener.accept()
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def _serve_connection(self, conn: Connection) -> None:
+        """Answer load requests on one worker connection until it closes."""
+        with conn:
+            while True:
+                try:
+                    name, url = conn.recv()
+                except EOFError:
+                    return
+                conn.send(asyncio.run(self.api_service.load_openapi(name, url)))
+
+
+def run_coordinator(catalog_dir: str, address: str, authkey: bytes) -> None:
+    """
+    Process entry point for the load coordinator.
+
+    Args:
+        catalog_dir: Shared catalog directory
+        address: Listener address (a Unix socket path)
+        authkey: Shared secret workers must present
+    """
+    logging.basicConfig(level=logging.INFO)
+    coordinator = LoadCoordinator(catalog_dir, address, authkey)
+
+    # Preloaded APIs are published to the shared catalog like any other load
+    if PRELOAD_MANIFEST:
+        from src.preloader import Preloader, load_manifest
+        Preloader(coordinator.api_service, load_manifest(PRELOAD_MANIFEST)).start()
+
+    # Local files loaded through the coordinator are watched here, once for all workers
+    FileWatcher(coordinator.api_service).start()
+
+    coordinator.serve_forever()
+
+
+class CoordinatorClient:
+    """
+    Worker-side connection to the load coordinator.
+    """
+
+    def __init__(self, address: str, authkey: bytes):
+        """
+        Initialize CoordinatorClient.
+
+        Args:
+            address: Coordinator listener address
+            authkey: Shared secret
+        """
+        self.address = address
+        self.authkey = authkey
+
+    def _request(self, name: str, url: str) -> Dict[str, Any]:
+        """Send one load request and wait for the result."""
+        with Client(self.address, family='AF_UNIX', authkey=self.authkey) as conn:
+            conn.send((name, url))
+            return conn.recv()
+
+    async def load(self, name: str, url: str) -> Dict[str, Any]:
+        """
+        Ask the coordinator to load a document.
+
+        Args:
+            name: API name
+            url: URL of the OpenAPI document
+
+        Returns:
+            Loading status and document basic info
+        """
+        return await asyncio.to_thread(self._request, name, url)
+
+
+class CoordinatedApiService(ApiService):
+    """
+    ApiService for workers: loads are delegated to the coordinator,
+    listings are served from the shared catalog.
+    """
+
+    def __init__(self, storage: OpenAPIStorage, client: CoordinatorClient):
+        """
+        Initialize CoordinatedApiService.
+
+        Args:
+            storage: OpenAPIStorage backed by the shared catalog
+            client: Connection to the load coordinator
+        """
+        super().__init__(storage)
+        self.client = client
+
+    async def load_openapi(
+        self,
+        name: str,
+        url: str,
+        on_progress: Optional[ProgressCallback] = None,
+        trusted: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Load an OpenAPI document through the coordinator.
+
+        Args:
+            name: API name for later queries
+            url: URL of the OpenAPI document
+            on_progress: Ignored; the coordinator does not stream download progress back
+            trusted: Ignored; the coordinator confines every load it is sent to its local roots
+
+        Returns:
+            Loading status and document basic info
+        """
+        try:
+            return await self.client.load(name, url)
+        except (OSError, EOFError) as e:
+            return {
+                "error": True,
+                "message": f"Load coordinator unavailable: {str(e)}"
+            }
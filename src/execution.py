@@ -0,0 +1,206 @@
+"""
+Bounded execution of synchronous tool bodies with admission control
+"""
+
+import time
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
+from src.config import (
+    TOOL_WORKERS,
+    TOOL_QUEUE_DEPTH,
+    TOOL_TIMEOUT,
+    TOOL_CONCURRENCY_LIMITS,
+    ERROR_TOOL_BUSY,
+    ERROR_TOOL_DEADLINE
+)
+
+
+# Monotonic deadline of the tool call running in the current context
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('tool_deadline', default=None)
+
+
+class DeadlineExceededError(Exception):
+    """Raised inside a tool body once its request deadline has passed."""
+
+
+def check_deadline() -> None:
+    """
+    Abort the current tool body if its deadline has passed.
+
+    Long-running loops (reference resolution, scans, diffs) call this so a
+    request that timed out stops using its worker. Outside a tool call it
+    does nothing.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    deadline = _deadline.get()
+    if deadline is not None and time.monotonic() > deadline:
+        raise DeadlineExceededError()
+
+
+def time_remaining() -> Optional[float]:
+    """
+    Get the time left before the current tool body's deadline.
+
+    Returns:
+        Seconds left (0 once passed), or None outside a tool call or without a deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+
+class ToolExecutor:
+    """
+    Runs synchronous tool bodies in a bounded thread pool.
+
+    At most max_workers bodies run at once, and each tool has its own
+    concurrency limit so one expensive tool cannot occupy every worker.
+    Requests that cannot start immediately wait, but only max_queue of
+    them; beyond that new requests are rejected at once with a busy error.
+    Every request has a deadline covering both waiting and running; when
+    it passes, the caller gets a deadline error and the body is stopped at
+    its next check_deadline() call.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TOOL_WORKERS,
+        max_queue: int = TOOL_QUEUE_DEPTH,
+        timeout: float = TOOL_TIMEOUT,
+        tool_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize ToolExecutor.
+
+        Args:
+            max_workers: Worker threads (bodies running at once)
+            max_queue: Requests allowed to wait for a worker or a tool slot
+            timeout: Per-request deadline in seconds (0 disables it)
+            tool_limits: Maximum concurrent bodies per tool name (defaults to TOOL_CONCURRENCY_LIMITS)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.tool_limits = TOOL_CONCURRENCY_LIMITS if tool_limits is None else tool_limits
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tool')
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._tool_slots: Dict[str, asyncio.Semaphore] = {}
+        self._waiting = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _semaphores(self, tool: str) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        """Get the worker and per-tool limiters for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._workers = asyncio.Semaphore(self.max_workers)
+            self._tool_slots = {}
+
+        slot = self._tool_slots.get(tool)
+        if slot is None:
+            limit = min(self.tool_limits.get(tool, self.max_workers), self.max_workers)
+            slot = asyncio.Semaphore(limit)
+            self._tool_slots[tool] = slot
+        return self._workers, slot
+
+    async def run(self, tool: str, fn: Callable[..., Dict[str, Any]], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Run a tool body in the pool, subject to limits and a deadline.
+
+        Args:
+            tool: Tool name (selects the per-tool limit)
+            fn: Synchronous tool body
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's result, or an error dict if the server is busy or the deadline passed
+        """
+        workers, slot = self._semaphores(tool)
+
+        # Reject instead of queueing without bound
+        if (slot.locked() or workers.locked()) and self._waiting >= self.max_queue:
+            self.rejected += 1
+            return {
+                "error": True,
+                "busy": True,
+                "message": ERROR_TOOL_BUSY.format(tool=tool)
+            }
+
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        acquired = []
+        started = False
+        self._waiting += 1
+        try:
+            for semaphore in (slot, workers):
+                if semaphore.locked():
+                    await asyncio.wait_for(semaphore.acquire(), self._remaining(deadline))
+                else:
+                    # Free slots are taken without yielding, so the busy check stays exact
+                    await semaphore.acquire()
+                acquired.append(semaphore)
+
+            context = contextvars.copy_context()
+            context.run(_deadline.set, deadline)
+            call = functools.partial(context.run, fn, *args, **kwargs)
+            future = asyncio.get_running_loop().run_in_executor(self._pool, call)
+            # Slots are held until the body really finishes, even if the caller gave up
+            future.add_done_callback(lambda f: self._finished(f, acquired))
+            started = True
+        except asyncio.TimeoutError:
+            return self._deadline_error(tool)
+        finally:
+            self._waiting -= 1
+            if not started:
+                # Timed out or cancelled (e.g. the client disconnected) while waiting
+                for semaphore in acquired:
+                    semaphore.release()
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self._remaining(deadline))
+        except (asyncio.TimeoutError, DeadlineExceededError):
+            return self._deadline_error(tool)
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(deadline - time.monotonic(), 0)
+
+    @staticmethod
+    def _finished(future: asyncio.Future, acquired: list) -> None:
+        for semaphore in acquired:
+            semaphore.release()
+        if not future.cancelled():
+            # Mark the exception as retrieved when the caller already timed out
+            future.exception()
+
+    def _deadline_error(self, tool: str) -> Dict[str, Any]:
+        self.timed_out += 1
+        return {
+            "error": True,
+            "message": ERROR_TOOL_DEADLINE.format(tool=tool, timeout=self.timeout)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get executor counters.
+
+        Returns:
+            Pool size, queue depth, waiting requests, rejections and timeouts
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "waiting": self._waiting,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out
+        }
@@ -0,0 +1,75 @@
+"""
+Merkle hash indexer for fast document comparison
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any
+from src.config import HTTP_METHODS
+from src.utils.hash_consing import tree_digest
+from src.utils.json_pointer import join_pointer
+
+
+class MerkleIndexer:
+    """
+    Builds per-node structural hashes used to diff document versions.
+    """
+
+    @staticmethod
+    def build_merkle_index(doc: Mapping) -> Dict[str, Any]:
+        """
+        Hash every path item, operation and component of a document.
+
+        Each entry also lists the local $refs found inside it, so a diff can
+        tell whether an unchanged operation depends on a changed component.
+
+        Args:
+            doc: Complete OpenAPI document
+
+        Returns:
+            Dictionary with the document hash plus path item, operation and
+            component entries
+
+        Example:
+            {
+                "root": "9f2c...",
+                "path_items": {"/users/{id}": {"hash": "51ab...", "refs": [...]}},
+                "operations": {"/users/{id}": {"get": {"hash": "c03e...", "refs": ["#/components/schemas/User"]}}},
+                "components": {"#/components/schemas/User": {"hash": "77d1...", "refs": []}}
+            }
+        """
+        memo = {}
+
+        def entry(node: Any) -> Dict[str, Any]:
+            refs = set()
+            digest = tree_digest(node, refs, memo)
+            return {"hash": digest.hex(), "refs": sorted(refs)}
+
+        path_items = {}
+        operations = {}
+        paths = doc.get('paths')
+        if isinstance(paths, Mapping):
+            for path, path_item in paths.items():
+                path_items[path] = entry(path_item)
+                if not isinstance(path_item, Mapping):
+                    continue
+                operations[path] = {
+                    method: entry(path_item[method])
+                    for method in HTTP_METHODS
+                    if method in path_item
+                }
+
+        component_entries = {}
+        components = doc.get('components')
+        if isinstance(components, Mapping):
+            for kind, entries in components.items():
+                if not isinstance(entries, Mapping):
+                    continue
+                for entry_name, component in entries.items():
+                    component_entries[join_pointer(['components', kind, entry_name])] = entry(component)
+
+        return {
+            "root": tree_digest(doc, memo=memo).hex(),
+            "path_items": path_items,
+            "operations": operations,
+            "components": component_entries
+        }
@@ -0,0 +1,108 @@
+"""
+N-gram indexer for prefiltering pattern searches
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, List, Optional, Set
+from src.config import NGRAM_SIZE, PATTERN_FIELDS
+
+
+def ngrams(text: str) -> Set[str]:
+    """
+    Get the lowercased n-grams of a string.
+
+    Args:
+        text: Any string
+
+    Returns:
+        Every NGRAM_SIZE-character substring of the lowercased text
+    """
+    text = text.lower()
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def field_text(operation: Mapping, field: str) -> str:
+    """
+    Get the text of a searchable field of a path tree operation.
+
+    Args:
+        operation: Path tree operation entry
+        field: One of PATTERN_FIELDS
+
+    Returns:
+        Field value as a string ("" when missing)
+    """
+    value = operation.get(field)
+    return value if isinstance(value, str) else ''
+
+
+class NgramIndexer:
+    """
+    Builds n-gram posting lists over operation paths, operationIds and summaries.
+    """
+
+    @staticmethod
+    def build_ngram_index(operations: Sequence[Mapping]) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Index the n-grams of every operation's searchable fields.
+
+        Operations are referred to by their position in the path tree's
+        operation list, which already holds the path, method, operationId
+        and summary of each operation.
+
+        Args:
+            operations: The 'operations' list of the path tree
+
+        Returns:
+            Per field, the ascending operation positions containing each n-gram
+
+        Example:
+            {
+                "path": {"/pe": [0, 1], "pet": [0, 1], ...},
+                "operationId": {"lis": [0], ...},
+                "summary": {...}
+            }
+        """
+        index: Dict[str, Dict[str, List[int]]] = {field: {} for field in PATTERN_FIELDS}
+        for position, operation in enumerate(operations):
+            for field in PATTERN_FIELDS:
+                postings = index[field]
+                for gram in ngrams(field_text(operation, field)):
+                    postings.setdefault(gram, []).append(position)
+        return index
+
+    @staticmethod
+    def candidates(postings: Mapping, literals: Iterable[str]) -> Optional[List[int]]:
+        """
+        Find the operations that contain every n-gram of the given literals.
+
+        Args:
+            postings: N-gram posting lists of one field
+            literals: Lowercased strings every match must contain
+
+        Returns:
+            Ascending operation positions, or None if the literals give no
+            n-grams and every operation is a candidate
+        """
+        grams = set()
+        for literal in literals:
+            grams |= ngrams(literal)
+        if not grams:
+            return None
+
+        # Intersect starting from the rarest n-gram
+        lists = []
+        for gram in grams:
+            positions = postings.get(gram)
+            if not positions:
+                return []
+            lists.append(positions)
+        lists.sort(key=len)
+
+        result = set(lists[0])
+        for positions in lists[1:]:
+            result.intersection_update(positions)
+            if not result:
+                break
+        return sorted(result)
+
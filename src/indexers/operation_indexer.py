@@ -33,22 +33,36 @@ class OperationIndexer:
         index = {}
 
         for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
-                continue
-
-            for method in HTTP_METHODS:
-                if method in path_item:
-                    operation = path_item[method]
-                    if isinstance(operation, dict):
-                        operation_id = operation.get('operationId')
-                        if operation_id:
-                            index[operation_id] = {
-                                'path': path,
-                                'method': method
-                            }
+            OperationIndexer.index_path_item(index, path, path_item)
 
         return index
 
+    @staticmethod
+    def index_path_item(index: Dict[str, Dict[str, str]], path: str, path_item: Any) -> None:
+        """
+        Add the operations of one path item to an operation index.
+
+        Used directly by streaming loads, where path items arrive one at a time.
+
+        Args:
+            index: Operation index to update in place
+            path: API path
+            path_item: Path item object
+        """
+        if not isinstance(path_item, dict):
+            return
+
+        for method in HTTP_METHODS:
+            if method in path_item:
+                operation = path_item[method]
+                if isinstance(operation, dict):
+                    operation_id = operation.get('operationId')
+                    if operation_id:
+                        index[operation_id] = {
+                            'path': path,
+                            'method': method
+                        }
+
     @staticmethod
     def extract_tags(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,108 @@
+"""
+Path segment tree indexer for prefix browsing
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any, List
+from src.config import HTTP_METHODS
+
+
+def split_path(path: str) -> List[str]:
+    """
+    Split an API path or prefix into its segments.
+
+    Empty segments are dropped, so "/v1/billing/" and "/v1/billing" give
+    the same segments. A trailing "*" segment (as in "/v1/billing/*") is
+    dropped too.
+
+    Args:
+        path: API path like /v1/billing/invoices/{id}
+
+    Returns:
+        List of segments, e.g. ["v1", "billing", "invoices", "{id}"]
+    """
+    segments = [segment for segment in path.split('/') if segment]
+    if segments and segments[-1] == '*':
+        segments.pop()
+    return segments
+
+
+class PathTreeIndexer:
+    """
+    Builds a tree of path segments with per-node operation counts.
+    """
+
+    @staticmethod
+    def build_path_tree(paths: Mapping) -> Dict[str, Any]:
+        """
+        Build the segment tree of all paths.
+
+        Operations are listed once, in depth-first order of the tree with
+        children sorted by segment, so the operations under any node form
+        the contiguous slice operations[start:end] of that node.
+
+        Args:
+            paths: The 'paths' section of an OpenAPI document
+
+        Returns:
+            Dictionary with the ordered operations and the root node
+
+        Example:
+            {
+                "operations": [
+                    {"path": "/v1/billing/invoices", "method": "get", "operationId": "listInvoices", "summary": "..."}
+                ],
+                "root": {
+                    "start": 0, "end": 1, "paths": [],
+                    "children": {
+                        "v1": {"start": 0, "end": 1, "paths": [], "children": {...}}
+                    }
+                }
+            }
+        """
+        # Group path items under their segment nodes first
+        root: Dict[str, Any] = {"paths": [], "children": {}}
+        for path, path_item in paths.items():
+            if not isinstance(path_item, Mapping):
+                continue
+            node = root
+            for segment in split_path(path):
+                node = node["children"].setdefault(segment, {"paths": [], "children": {}})
+            node["paths"].append((path, path_item))
+
+        operations: List[Dict[str, Any]] = []
+
+        def number(node: Dict[str, Any]) -> Dict[str, Any]:
+            start = len(operations)
+            node_paths = []
+            for path, path_item in node["paths"]:
+                methods = []
+                for method in HTTP_METHODS:
+                    operation = path_item.get(method)
+                    if not isinstance(operation, Mapping):
+                        continue
+                    methods.append(method)
+                    operations.append({
+                        "path": path,
+                        "method": method,
+                        "operationId": operation.get('operationId'),
+                        "summary": operation.get('summary', '')
+                    })
+                node_paths.append({"path": path, "methods": methods})
+
+            children = {
+                segment: number(child)
+                for segment, child in sorted(node["children"].items())
+            }
+            return {
+                "start": start,
+                "end": len(operations),
+                "paths": node_paths,
+                "children": children
+            }
+
+        tree_root = number(root)
+        return {
+            "operations": operations,
+            "root": tree_root
+        }
@@ -0,0 +1,61 @@
+"""
+JSON pointer indexer for referenceable nodes
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any, List
+from src.config import HTTP_METHODS
+from src.utils.json_pointer import join_pointer
+
+
+class PointerIndexer:
+    """
+    Builds the JSON pointer table used to resolve $refs without parsing pointers.
+    """
+
+    @staticmethod
+    def build_pointer_table(doc: Mapping) -> Dict[str, List[str]]:
+        """
+        Map the canonical pointer of every referenceable node to its path tokens.
+
+        Covers every entry under components/<kind> (schemas, parameters,
+        responses, requestBodies, headers, examples, ...), path items and
+        operations.
+        Tokens are stored unescaped, so lookups never split or decode pointers.
+
+        Args:
+            doc: Complete OpenAPI document
+
+        Returns:
+            Dictionary mapping '#/...' pointers to path tokens
+
+        Example:
+            {
+                "#/components/schemas/User": ["components", "schemas", "User"],
+                "#/paths/~1users~1{id}/get": ["paths", "/users/{id}", "get"]
+            }
+        """
+        table = {}
+
+        components = doc.get('components')
+        if isinstance(components, Mapping):
+            for kind, entries in components.items():
+                if not isinstance(entries, Mapping):
+                    continue
+                for entry_name in entries:
+                    tokens = ['components', kind, entry_name]
+                    table[join_pointer(tokens)] = tokens
+
+        paths = doc.get('paths')
+        if isinstance(paths, Mapping):
+            for path, path_item in paths.items():
+                tokens = ['paths', path]
+                table[join_pointer(tokens)] = tokens
+                if not isinstance(path_item, Mapping):
+                    continue
+                for method in HTTP_METHODS:
+                    if method in path_item:
+                        tokens = ['paths', path, method]
+                        table[join_pointer(tokens)] = tokens
+
+        return table
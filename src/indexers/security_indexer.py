@@ -0,0 +1,131 @@
+"""
+Effective-security indexer for scheme and scope lookups
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, List
+from src.config import HTTP_METHODS
+
+
+class SecurityIndexer:
+    """
+    Builds the index of which operations require which security schemes and scopes.
+    """
+
+    @staticmethod
+    def build_security_index(doc: Mapping) -> Dict[str, Any]:
+        """
+        Compute every operation's effective security and index it by scheme and scope.
+
+        An operation's own `security` replaces the document-level one, and
+        an empty requirement list (or an empty requirement object among the
+        alternatives) makes the operation callable without credentials.
+        Schemes are read from components/securitySchemes.
+
+        Args:
+            doc: Complete OpenAPI document
+
+        Returns:
+            Operations with their effective security, plus positions in that
+            list by scheme, by scheme and scope, and for unauthenticated operations
+
+        Example:
+            {
+                "schemes": {"oauth": "oauth2", "apiKey": "apiKey"},
+                "operations": [
+                    {"path": "/pets", "method": "post", "operationId": "createPet",
+                     "summary": "Create a pet", "security": [{"oauth": ["pets:write"]}]}
+                ],
+                "by_scheme": {"oauth": [0]},
+                "by_scope": {"oauth": {"pets:write": [0]}},
+                "unauthenticated": [],
+                "undefined_schemes": []
+            }
+        """
+        components = doc.get('components')
+        definitions = components.get('securitySchemes') if isinstance(components, Mapping) else None
+        if not isinstance(definitions, Mapping):
+            definitions = {}
+
+        schemes = {
+            scheme: definition.get('type', '') if isinstance(definition, Mapping) else ''
+            for scheme, definition in definitions.items()
+        }
+        global_security = SecurityIndexer._requirements(doc.get('security'))
+
+        operations: List[Dict[str, Any]] = []
+        by_scheme: Dict[str, List[int]] = {}
+        by_scope: Dict[str, Dict[str, List[int]]] = {}
+        unauthenticated: List[int] = []
+        undefined = set()
+
+        paths = doc.get('paths')
+        if not isinstance(paths, Mapping):
+            paths = {}
+
+        for path, path_item in paths.items():
+            if not isinstance(path_item, Mapping):
+                continue
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, Mapping):
+                    continue
+
+                if 'security' in operation:
+                    security = SecurityIndexer._requirements(operation.get('security'))
+                else:
+                    security = global_security
+
+                position = len(operations)
+                operations.append({
+                    "path": path,
+                    "method": method,
+                    "operationId": operation.get('operationId'),
+                    "summary": operation.get('summary', ''),
+                    "security": security
+                })
+
+                if not security or {} in security:
+                    unauthenticated.append(position)
+
+                # Requirements are alternatives; index each scheme and scope once per operation
+                scopes_seen = set()
+                for requirement in security:
+                    for scheme, scopes in requirement.items():
+                        if scheme not in schemes:
+                            undefined.add(scheme)
+                        positions = by_scheme.setdefault(scheme, [])
+                        if not positions or positions[-1] != position:
+                            positions.append(position)
+                        for scope in scopes:
+                            if (scheme, scope) not in scopes_seen:
+                                scopes_seen.add((scheme, scope))
+                                by_scope.setdefault(scheme, {}).setdefault(scope, []).append(position)
+
+        return {
+            "schemes": schemes,
+            "operations": operations,
+            "by_scheme": by_scheme,
+            "by_scope": by_scope,
+            "unauthenticated": unauthenticated,
+            "undefined_schemes": sorted(undefined)
+        }
+
+    @staticmethod
+    def _requirements(security: Any) -> List[Dict[str, List[str]]]:
+        """
+        Normalize a security requirement list to plain {scheme: [scopes]} objects.
+        """
+        if not isinstance(security, Sequence) or isinstance(security, str):
+            return []
+
+        requirements = []
+        for requirement in security:
+            if not isinstance(requirement, Mapping):
+                continue
+            requirements.append({
+                str(scheme): [scope for scope in scopes if isinstance(scope, str)]
+                if isinstance(scopes, Sequence) and not isinstance(scopes, str) else []
+                for scheme, scopes in requirement.items()
+            })
+        return requirements
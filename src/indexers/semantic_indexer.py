@@ -0,0 +1,399 @@
+"""
+Offline semantic index of operations for natural-language endpoint search
+"""
+
+import re
+import zlib
+import threading
+import functools
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+from src.config import HTTP_METHODS, SEMANTIC_DIMENSIONS, SEMANTIC_FEATURE_CACHE_SIZE, SEMANTIC_SYNONYM_GROUPS
+
+if TYPE_CHECKING:
+    # NumPy is imported on first use rather than at server start-up
+    import numpy as np
+
+# Weight of each operation field in its vector
+FIELD_WEIGHTS = (
+    ('summary', 1.0),
+    ('operationId', 0.8),
+    ('path', 0.8),
+    ('tags', 0.6),
+    ('method', 0.5),
+    ('description', 0.4)
+)
+
+# Relative weight of synonym-group and character trigram features to the word itself
+SYNONYM_WEIGHT = 0.8
+TRIGRAM_WEIGHT = 0.25
+
+# Results less similar than this are hash-collision noise rather than matches
+MIN_SCORE = 0.15
+
+# Words carrying no meaning for endpoint search
+STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'of', 'to', 'for', 'by', 'in', 'on', 'at', 'with', 'from',
+    'and', 'or', 'is', 'are', 'be', 'it', 'its', 'this', 'that', 'my', 'me', 'i',
+    'how', 'do', 'can', 'which', 'what', 'endpoint', 'api', 'operation'
+})
+
+_WORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+
+def _stem(word: str) -> str:
+    """Strip the most common English inflections."""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 5 and word.endswith('ing'):
+        return word[:-3]
+    if len(word) > 4 and word.endswith('ed'):
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into stemmed lowercase words.
+
+    camelCase, snake_case and path separators all split words, so
+    "getUserById" and "/users/{id}" give ["get", "user", "by", "id"]
+    and ["user", "id"] before stop words are removed.
+
+    Args:
+        text: Free text, identifier or path
+
+    Returns:
+        List of stemmed words without stop words
+    """
+    words = []
+    for match in _WORD.findall(text):
+        word = _stem(match.lower())
+        if word not in STOP_WORDS:
+            words.append(word)
+    return words
+
+
+class HashingVectorizer:
+    """
+    Maps text to fixed-size vectors by feature hashing, with no fitted vocabulary.
+
+    Every word contributes itself, the synonym group it belongs to and its
+    character trigrams, each hashed to a signed column. Synonym groups let
+    "cancel a subscription" match "terminate plan"; trigrams let partial
+    and misspelled words overlap.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = SEMANTIC_DIMENSIONS,
+        synonym_groups: Sequence = SEMANTIC_SYNONYM_GROUPS,
+        cache_size: int = SEMANTIC_FEATURE_CACHE_SIZE
+    ):
+        """
+        Initialize HashingVectorizer.
+
+        Args:
+            dimensions: Vector size
+            synonym_groups: Lists of words treated as related
+            cache_size: Maximum number of features whose column is cached
+        """
+        self.dimensions = dimensions
+        self._groups: Dict[str, int] = {}
+        for position, group in enumerate(synonym_groups):
+            for word in group:
+                self._groups.setdefault(_stem(word), position)
+        # Column and sign of recently seen features; queries bring in arbitrary
+        # words, so the cache is bounded rather than growing with every one
+        self._column = functools.lru_cache(maxsize=cache_size)(self._hash_feature)
+
+    def _hash_feature(self, feature: str) -> Tuple[int, float]:
+        digest = zlib.crc32(feature.encode('utf-8'))
+        return digest % self.dimensions, 1.0 if digest & 0x80000000 else -1.0
+
+    def features(self, words: List[str], weight: float, out: Dict[int, float]) -> None:
+        """
+        Add the hashed features of some words to a sparse vector.
+
+        Args:
+            words: Words from tokenize()
+            weight: Weight of the field the words come from
+            out: Sparse vector (column -> value) updated in place
+        """
+        for word in words:
+            column, sign = self._column('w:' + word)
+            out[column] = out.get(column, 0.0) + sign * weight
+
+            group = self._groups.get(word)
+            if group is not None:
+                column, sign = self._column('g:%d' % group)
+                out[column] = out.get(column, 0.0) + sign * weight * SYNONYM_WEIGHT
+
+            padded = '#' + word + '#'
+            for start in range(len(padded) - 2):
+                column, sign = self._column('t:' + padded[start:start + 3])
+                out[column] = out.get(column, 0.0) + sign * weight * TRIGRAM_WEIGHT
+
+    def transform_query(self, query: str) -> 'np.ndarray':
+        """
+        Vectorize a search query.
+
+        Args:
+            query: Natural-language query
+
+        Returns:
+            Unit-length float32 vector (all zeros if the query has no words)
+        """
+        import numpy as np
+
+        sparse: Dict[int, float] = {}
+        self.features(tokenize(query), 1.0, sparse)
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        if sparse:
+            vector[list(sparse)] = list(sparse.values())
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector /= norm
+        return vector
+
+    def transform_operations(self, operations: List[Dict[str, Any]]) -> 'np.ndarray':
+        """
+        Vectorize operations into the rows of a matrix.
+
+        Args:
+            operations: Operation records with path, method, operationId,
+                        summary, description and tags
+
+        Returns:
+            float32 matrix with one unit-length row per operation
+        """
+        import numpy as np
+
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+
+        for row, operation in enumerate(operations):
+            sparse: Dict[int, float] = {}
+            for field, weight in FIELD_WEIGHTS:
+                value = operation.get(field)
+                if isinstance(value, list):
+                    value = ' '.join(str(item) for item in value)
+                if value:
+                    self.features(tokenize(str(value)), weight, sparse)
+            rows.extend([row] * len(sparse))
+            columns.extend(sparse)
+            values.extend(sparse.values())
+
+        matrix = np.zeros((len(operations), self.dimensions), dtype=np.float32)
+        matrix[rows, columns] = values
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+def extract_operations(paths: Mapping) -> List[Dict[str, Any]]:
+    """
+    Collect the searchable fields of every operation.
+
+    Args:
+        paths: The 'paths' section of an OpenAPI document
+
+    Returns:
+        One record per operation with path, method, operationId, summary,
+        description and tags
+    """
+    operations = []
+    for path, path_item in paths.items():
+        if not isinstance(path_item, Mapping):
+            continue
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, Mapping):
+                continue
+            tags = operation.get('tags')
+            operations.append({
+                "path": path,
+                "method": method,
+                "operationId": operation.get('operationId'),
+                "summary": operation.get('summary', '') or '',
+                "description": operation.get('description', '') or '',
+                "tags": [tag for tag in tags if isinstance(tag, str)]
+                if isinstance(tags, Sequence) and not isinstance(tags, str) else []
+            })
+    return operations
+
+
+class SemanticIndex:
+    """
+    Operation vectors of every loaded API, searchable with one matrix-vector product.
+
+    Each API's rows are vectorized once when it is added. Queries run
+    against one matrix holding the rows of all APIs, rebuilt only after
+    APIs were added or removed. Each API records the content hash it was
+    built from, so callers can tell when a stored API changed.
+    """
+
+    def __init__(self, vectorizer: Optional[HashingVectorizer] = None):
+        """
+        Initialize SemanticIndex.
+
+        Args:
+            vectorizer: Vectorizer shared by documents and queries (defaults to HashingVectorizer())
+        """
+        self.vectorizer = vectorizer or HashingVectorizer()
+        self._lock = threading.Lock()
+        # API name -> (content hash, operation records, row matrix)
+        self._apis: Dict[str, Tuple[Optional[str], List[Dict[str, Any]], 'np.ndarray']] = {}
+        self._snapshot: Optional[_Snapshot] = None
+
+    def add(self, name: str, paths: Mapping, content_hash: Optional[str] = None) -> int:
+        """
+        Vectorize and add (or replace) the operations of an API.
+
+        Args:
+            name: API name
+            paths: The 'paths' section of the document
+            content_hash: Hash of the document the rows are built from (optional)
+
+        Returns:
+            Number of operations indexed
+        """
+        operations = extract_operations(paths)
+        for operation in operations:
+            operation["api"] = name
+        matrix = self.vectorizer.transform_operations(operations)
+        # Descriptions are only needed for the vectors
+        for operation in operations:
+            del operation["description"]
+        with self._lock:
+            self._apis[name] = (content_hash, operations, matrix)
+            self._snapshot = None
+        return len(operations)
+
+    def remove(self, name: str) -> None:
+        """
+        Drop the rows of an API.
+
+        Args:
+            name: API name
+        """
+        with self._lock:
+            if self._apis.pop(name, None) is not None:
+                self._snapshot = None
+
+    def indexed(self) -> Dict[str, Optional[str]]:
+        """
+        Get the indexed APIs.
+
+        Returns:
+            Dictionary mapping API name to the content hash it was built from
+        """
+        with self._lock:
+            return {name: entry[0] for name, entry in self._apis.items()}
+
+    def _current(self) -> "_Snapshot":
+        """Get the combined matrix and row data of all APIs."""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = _Snapshot(self._apis, self.vectorizer.dimensions)
+            return self._snapshot
+
+    def search(
+        self,
+        query: str,
+        name: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the operations most similar to a query.
+
+        Args:
+            query: Natural-language query
+            name: Restrict to one API (optional)
+            method: Lowercase HTTP method filter (optional)
+            tag: Tag filter (optional)
+            limit: Maximum number of results
+
+        Returns:
+            Operation records with their cosine similarity, best first
+        """
+        import numpy as np
+
+        snapshot = self._current()
+        vector = self.vectorizer.transform_query(query)
+
+        start, end = 0, len(snapshot.records)
+        if name is not None:
+            start, end = snapshot.ranges.get(name, (0, 0))
+        if limit <= 0 or start == end or not vector.any():
+            return []
+
+        scores = snapshot.matrix[start:end] @ vector
+
+        # Filtered-out rows score 0, which is below MIN_SCORE
+        if method is not None:
+            code = HTTP_METHODS.index(method) if method in HTTP_METHODS else -1
+            scores[snapshot.methods[start:end] != code] = 0
+        if tag is not None:
+            keep = np.zeros(len(scores), dtype=bool)
+            rows = snapshot.tag_rows.get(tag, np.zeros(0, dtype=np.int64))
+            rows = rows[(rows >= start) & (rows < end)] - start
+            keep[rows] = True
+            scores[~keep] = 0
+
+        count = min(limit, len(scores))
+        top = np.argpartition(scores, len(scores) - count)[len(scores) - count:]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        results = []
+        for row in top:
+            score = float(scores[row])
+            if score < MIN_SCORE:
+                break
+            record = snapshot.records[start + row]
+            results.append({
+                "api": record['api'],
+                "path": record['path'],
+                "method": record['method'],
+                "operationId": record['operationId'],
+                "summary": record['summary'],
+                "tags": record['tags'],
+                "score": round(score, 4)
+            })
+        return results
+
+
+class _Snapshot:
+    """
+    Immutable combined view of all indexed APIs, rebuilt after adds and removes.
+
+    Holds the stacked row matrix, one record per row, each API's row
+    range, the HTTP method of every row (as its position in HTTP_METHODS)
+    and the rows of every tag, so filters are applied as array masks.
+    """
+
+    def __init__(self, apis: Dict[str, Tuple[Optional[str], List[Dict[str, Any]], 'np.ndarray']], dimensions: int):
+        import numpy as np
+
+        matrices = []
+        self.records: List[Dict[str, Any]] = []
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+        for name, (_, operations, matrix) in apis.items():
+            self.ranges[name] = (len(self.records), len(self.records) + len(operations))
+            self.records.extend(operations)
+            matrices.append(matrix)
+
+        self.matrix = np.vstack(matrices) if matrices else np.zeros((0, dimensions), dtype=np.float32)
+        self.methods = np.array(
+            [HTTP_METHODS.index(record['method']) for record in self.records], dtype=np.int8
+        )
+        tag_rows: Dict[str, List[int]] = {}
+        for row, record in enumerate(self.records):
+            for tag in record['tags']:
+                tag_rows.setdefault(tag, []).append(row)
+        self.tag_rows = {tag: np.array(rows, dtype=np.int64) for tag, rows in tag_rows.items()}
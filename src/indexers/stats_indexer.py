@@ -0,0 +1,145 @@
+"""
+Per-API statistics indexer
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, Set
+from src.config import HTTP_METHODS
+from src.utils.json_pointer import split_pointer, join_pointer, resolve_tokens
+
+# Schema keywords holding one nested schema (one level deeper)
+_NESTED_SCHEMA_KEYS = ('items', 'additionalProperties', 'not', 'contains')
+
+# Schema keywords holding schemas by name (one level deeper)
+_NAMED_SCHEMA_KEYS = ('properties', 'patternProperties')
+
+# Composition keywords: their schemas describe the same level
+_COMPOSED_SCHEMA_KEYS = ('allOf', 'anyOf', 'oneOf')
+
+
+class StatsIndexer:
+    """
+    Builds the statistics record stored with every loaded API.
+    """
+
+    @staticmethod
+    def build_api_stats(doc: Mapping) -> Dict[str, Any]:
+        """
+        Count the operations, tags and schemas of a document.
+
+        Args:
+            doc: Complete OpenAPI document
+
+        Returns:
+            Dictionary of document statistics
+
+        Example:
+            {
+                "operations_count": 12,
+                "operations_by_method": {"get": 7, "post": 3, "delete": 2},
+                "operations_by_tag": {"pets": 9, "store": 3},
+                "deprecated_count": 1,
+                "schema_count": 14,
+                "max_schema_depth": 5
+            }
+        """
+        by_method: Dict[str, int] = {}
+        by_tag: Dict[str, int] = {}
+        operations = 0
+        deprecated = 0
+
+        paths = doc.get('paths')
+        if isinstance(paths, Mapping):
+            for path_item in paths.values():
+                if not isinstance(path_item, Mapping):
+                    continue
+                for method in HTTP_METHODS:
+                    operation = path_item.get(method)
+                    if not isinstance(operation, Mapping):
+                        continue
+                    operations += 1
+                    by_method[method] = by_method.get(method, 0) + 1
+                    if operation.get('deprecated') is True:
+                        deprecated += 1
+                    tags = operation.get('tags')
+                    if isinstance(tags, Sequence) and not isinstance(tags, str):
+                        for tag in tags:
+                            if isinstance(tag, str):
+                                by_tag[tag] = by_tag.get(tag, 0) + 1
+
+        components = doc.get('components')
+        schemas = components.get('schemas') if isinstance(components, Mapping) else None
+        if not isinstance(schemas, Mapping):
+            schemas = {}
+
+        depth = _SchemaDepth(doc)
+        return {
+            "operations_count": operations,
+            "operations_by_method": by_method,
+            "operations_by_tag": dict(sorted(by_tag.items())),
+            "deprecated_count": deprecated,
+            "schema_count": len(schemas),
+            "max_schema_depth": max(
+                (depth.measure({'$ref': join_pointer(['components', 'schemas', name])}) for name in schemas),
+                default=0
+            )
+        }
+
+
+class _SchemaDepth:
+    """
+    Measures schema nesting depth, following local $refs.
+
+    Object properties, array items and similar keywords add a level;
+    allOf/anyOf/oneOf do not. Every reference is measured once, so the
+    walk stays linear in the document size; a reference that closes a
+    cycle counts as depth 0.
+    """
+
+    def __init__(self, doc: Mapping):
+        self.doc = doc
+        self._by_ref: Dict[str, int] = {}
+
+    def measure(self, schema: Any, _active: Set[str] = None) -> int:
+        if not isinstance(schema, Mapping):
+            return 0
+        if _active is None:
+            _active = set()
+
+        ref = schema.get('$ref')
+        if isinstance(ref, str):
+            return self._measure_ref(ref, _active)
+
+        deepest = 0
+        for key in _NESTED_SCHEMA_KEYS:
+            deepest = max(deepest, self.measure(schema.get(key), _active))
+        for key in _NAMED_SCHEMA_KEYS:
+            children = schema.get(key)
+            if isinstance(children, Mapping):
+                for child in children.values():
+                    deepest = max(deepest, self.measure(child, _active))
+
+        level = 1 + deepest
+        for key in _COMPOSED_SCHEMA_KEYS:
+            parts = schema.get(key)
+            if isinstance(parts, Sequence) and not isinstance(parts, str):
+                for part in parts:
+                    level = max(level, self.measure(part, _active))
+        return level
+
+    def _measure_ref(self, ref: str, active: Set[str]) -> int:
+        known = self._by_ref.get(ref)
+        if known is not None:
+            return known
+        if ref in active or not ref.startswith('#/'):
+            return 0
+        try:
+            target = resolve_tokens(self.doc, split_pointer(ref))
+        except (KeyError, ValueError):
+            return 0
+
+        active.add(ref)
+        depth = self.measure(target, active)
+        active.discard(ref)
+        self._by_ref[ref] = depth
+        return depth
@@ -0,0 +1,193 @@
+"""
+Shared cache for fetched documents with in-flight deduplication
+"""
+
+import time
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Any, Callable, Awaitable
+from src.config import EXTERNAL_REF_CACHE_SIZE, EXTERNAL_REF_CACHE_TTL, EXTERNAL_REF_CONCURRENCY
+
+
+class _SharedSemaphore:
+    """
+    Semaphore whose holders may run on any thread and event loop.
+
+    asyncio.Semaphore belongs to one event loop, but loads run on several:
+    the MCP server's, the preloader's, the file watcher's and one per load
+    coordinator connection. Waiters here are woken on their own loop.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        # Futures of waiting acquirers, each bound to its own event loop
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            future = loop.create_future()
+            self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+                    raise
+            # release() handed this waiter the slot as it was cancelled: pass it on
+            self.release()
+            raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """Hand the slot to the longest waiting acquirer, or free it."""
+        with self._lock:
+            while self._waiters:
+                future = self._waiters.popleft()
+                try:
+                    future.get_loop().call_soon_threadsafe(self._wake, future)
+                    return
+                except RuntimeError:
+                    # The waiter's loop is closed, so nobody is waiting on it
+                    continue
+            self._value += 1
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        # A cancelled waiter passes its slot on itself
+        if not future.done():
+            future.set_result(None)
+
+
+class FetchCache:
+    """
+    Caches parsed documents by URL.
+
+    Concurrent requests for the same URL share one fetch, the number of
+    fetches running at once is capped, and results are kept (LRU, with a
+    TTL) so later loads that share files reuse them. Cached documents are
+    shared and must be treated as read-only.
+
+    One cache serves loads running on several threads and event loops; the
+    fetch limit applies across all of them, while a fetch in flight is
+    shared with requests on its own loop only.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Any]],
+        max_entries: int = EXTERNAL_REF_CACHE_SIZE,
+        ttl: float = EXTERNAL_REF_CACHE_TTL,
+        concurrency: int = EXTERNAL_REF_CONCURRENCY
+    ):
+        """
+        Initialize FetchCache.
+
+        Args:
+            fetch: Coroutine function fetching and parsing one URL
+            max_entries: Maximum number of cached documents
+            ttl: Seconds a cached document stays valid
+            concurrency: Maximum number of fetches in flight
+        """
+        self._fetch = fetch
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._slots = _SharedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, url: str) -> Any:
+        """
+        Get a parsed document, fetching it at most once per cache lifetime.
+
+        Args:
+            url: Absolute document URL
+
+        Returns:
+            Parsed document
+
+        Raises:
+            Exception: Whatever the fetch raised; failures are not cached
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(url)
+                self.hits += 1
+                return entry[1]
+
+            shared = self._in_flight.get(url)
+            if shared is not None and shared.get_loop() is loop:
+                self.hits += 1
+            else:
+                shared = None
+                self.misses += 1
+                future = loop.create_future()
+                self._in_flight[url] = future
+
+        if shared is not None:
+            return await asyncio.shield(shared)
+
+        try:
+            async with self._slots:
+                document = await self._fetch(url)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark the exception as retrieved when nobody else was waiting
+                future.exception()
+            raise
+        else:
+            future.set_result(document)
+            with self._lock:
+                self._entries[url] = (time.monotonic(), document)
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return document
+        finally:
+            with self._lock:
+                if self._in_flight.get(url) is future:
+                    del self._in_flight[url]
+
+    def invalidate(self, url: str) -> bool:
+        """
+        Drop a cached document, e.g. because its file changed.
+
+        Args:
+            url: Absolute document URL
+
+        Returns:
+            True if the document was cached
+        """
+        with self._lock:
+            return self._entries.pop(url, None) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Entry count, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -2,54 +2,356 @@
 OpenAPI document loader and parser
 """
 
+import os
 import json
-import yaml
-import httpx
-from typing import Dict, Any
+import mmap
+import asyncio
+import hashlib
+import functools
+import importlib.util
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, AsyncIterator
 from src.config import (
-    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    MAX_DOCUMENT_BYTES,
+    STREAM_CHUNK_SIZE,
+    PROGRESS_INTERVAL_BYTES,
+    SPEC_FILE_EXTENSIONS,
     ERROR_INVALID_OPENAPI_MISSING_VERSION,
     ERROR_INVALID_OPENAPI_MISSING_INFO,
     ERROR_INVALID_OPENAPI_MISSING_PATHS
 )
+from src.loaders.streaming_parser import (
+    StreamingDocumentParser,
+    DocumentTooLargeError,
+    PathItemCallback,
+    ComponentCallback
+)
+
+
+# Called with (bytes downloaded, total bytes or None if unknown)
+ProgressCallback = Callable[[int, Optional[int]], Awaitable[None]]
 
 
 class OpenAPILoader:
     """
     Loads and parses OpenAPI documents from URLs.
     Supports both JSON and YAML formats with auto-detection.
+
+    JSON documents are parsed incrementally while they download; YAML
+    documents are buffered and parsed once complete. Downloads negotiate
+    gzip/deflate, plus brotli when a brotli decoder is installed. Local
+    files are read through a memory map.
     """
 
     @staticmethod
-    async def load_from_url(url: str) -> Dict[str, Any]:
+    def local_path(url: str) -> Optional[str]:
+        """
+        Get the local path of a file:// URL.
+
+        Args:
+            url: Document URL
+
+        Returns:
+            Filesystem path, or None for other schemes
+        """
+        if not url.startswith('file://'):
+            return None
+        return url2pathname(urlparse(url).path)
+
+    @staticmethod
+    def list_spec_files(directory: str) -> List[str]:
         """
-        Load an OpenAPI document from a URL.
+        List the document files under a directory, recursively.
+
+        Hidden files and directories are skipped.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            Sorted paths of files with a SPEC_FILE_EXTENSIONS extension
+        """
+        files = []
+        for root, dirs, names in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            files.extend(
+                os.path.join(root, name) for name in names
+                if not name.startswith('.') and name.lower().endswith(SPEC_FILE_EXTENSIONS)
+            )
+        return sorted(files)
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        """
+        Hash a local file without reading it into memory.
+
+        Args:
+            path: File path
+
+        Returns:
+            SHA-256 hex digest of the file content
+        """
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return hashlib.sha256().hexdigest()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+
+    @staticmethod
+    def parse_file(path: str, max_bytes: Optional[int] = None) -> Tuple[Dict[str, Any], int, str]:
+        """
+        Read and parse a complete local document.
+
+        A plain function of the path, so it can run in a worker process
+        when several files are parsed in parallel.
+
+        Args:
+            path: File path
+            max_bytes: Maximum file size (defaults to MAX_DOCUMENT_BYTES, 0 disables the limit)
+
+        Returns:
+            Tuple of (parsed document, size in bytes, SHA-256 hex digest)
+
+        Raises:
+            OSError: If the file cannot be read
+            DocumentTooLargeError: If the file exceeds max_bytes
+            json.JSONDecodeError: If JSON parsing fails
+            yaml.YAMLError: If YAML parsing fails
+        """
+        if max_bytes is None:
+            max_bytes = MAX_DOCUMENT_BYTES
+
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if max_bytes and size > max_bytes:
+                raise DocumentTooLargeError(max_bytes)
+            if size == 0:
+                content = b''
+                digest = hashlib.sha256().hexdigest()
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest = hashlib.sha256(mapped).hexdigest()
+                    content = mapped[:]
+
+        return OpenAPILoader._parse_content(content, '', path), size, digest
+
+    @staticmethod
+    async def load_from_url(
+        url: str,
+        on_path_item: Optional[PathItemCallback] = None,
+        on_component: Optional[ComponentCallback] = None,
+        max_bytes: Optional[int] = None,
+        on_bytes: Optional[Callable[[bytes], None]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Load an OpenAPI document from a URL (http(s):// or file://).
+
+        Path items and components are reported through the callbacks as
+        soon as they are parsed, so indexes can be built during the download.
+        For buffered formats they are reported after parsing, in document order.
 
         Args:
             url: URL of the OpenAPI document
+            on_path_item: Called with (path, path_item) for every path item (optional)
+            on_component: Called with (kind, name, component) for every component (optional)
+            max_bytes: Maximum decoded body size (defaults to MAX_DOCUMENT_BYTES, 0 disables the limit)
+            on_bytes: Called with every decoded body chunk as it is received (optional)
+            on_progress: Awaited with (bytes transferred, total bytes or None) about every
+                         PROGRESS_INTERVAL_BYTES and once the body is complete (optional)
 
         Returns:
             Parsed OpenAPI document as dictionary
 
         Raises:
             httpx.HTTPError: If HTTP request fails
+            OSError: If a file:// document cannot be read
+            DocumentTooLargeError: If the body exceeds max_bytes
             json.JSONDecodeError: If JSON parsing fails
             yaml.YAMLError: If YAML parsing fails
         """
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        if max_bytes is None:
+            max_bytes = MAX_DOCUMENT_BYTES
+
+        path = OpenAPILoader.local_path(url)
+        if path is not None:
+            size = os.path.getsize(path)
+            if max_bytes and size > max_bytes:
+                raise DocumentTooLargeError(max_bytes)
+            chunks = OpenAPILoader._file_chunks(path)
+            if on_bytes is not None:
+                chunks = OpenAPILoader._observed(chunks, on_bytes)
+            if on_progress is not None:
+                transferred = 0
+
+                def count(chunk: bytes) -> None:
+                    nonlocal transferred
+                    transferred += len(chunk)
 
-            # Determine format and parse
-            return OpenAPILoader._parse_response(response, url)
+                chunks = OpenAPILoader._reported(
+                    OpenAPILoader._observed(chunks, count), on_progress, lambda: transferred, size
+                )
+            return await OpenAPILoader._read_document(chunks, '', url, on_path_item, on_component, max_bytes)
+
+        # Imported on first load rather than at server start-up
+        import httpx
+
+        timeout = httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        headers = {'Accept-Encoding': OpenAPILoader._accept_encoding()}
+        async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
+            async with client.stream('GET', url) as response:
+                response.raise_for_status()
+
+                # Content-Length counts encoded bytes, a lower bound for the decoded size
+                content_length = response.headers.get('content-length')
+                total = int(content_length) if content_length and content_length.isdigit() else None
+                if max_bytes and total is not None and total > max_bytes:
+                    raise DocumentTooLargeError(max_bytes)
+
+                content_type = response.headers.get('content-type', '').lower()
+                chunks = response.aiter_bytes(STREAM_CHUNK_SIZE)
+                if on_bytes is not None:
+                    chunks = OpenAPILoader._observed(chunks, on_bytes)
+                if on_progress is not None:
+                    # Progress counts bytes on the wire, matching Content-Length
+                    chunks = OpenAPILoader._reported(
+                        chunks, on_progress, lambda: response.num_bytes_downloaded, total
+                    )
+                return await OpenAPILoader._read_document(
+                    chunks, content_type, url, on_path_item, on_component, max_bytes
+                )
+
+    @staticmethod
+    @functools.cache
+    def _accept_encoding() -> str:
+        """
+        Build the Accept-Encoding header from the decoders available to httpx.
+
+        Returns:
+            "br, gzip, deflate" with a brotli package installed, else "gzip, deflate"
+        """
+        encodings = ['gzip', 'deflate']
+        if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+            encodings.insert(0, 'br')
+        return ', '.join(encodings)
+
+    @staticmethod
+    async def _read_document(
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        url: str,
+        on_path_item: Optional[PathItemCallback],
+        on_component: Optional[ComponentCallback],
+        max_bytes: int
+    ) -> Dict[str, Any]:
+        """
+        Parse a document body, incrementally for JSON and buffered otherwise.
+
+        Args:
+            chunks: Body chunks
+            content_type: Lowercased Content-Type header ('' if unknown)
+            url: Original URL (for format detection)
+            on_path_item: Path item callback (optional)
+            on_component: Component callback (optional)
+            max_bytes: Maximum body size (0 disables the limit)
+
+        Returns:
+            Parsed document dictionary
+        """
+        # Read until the first significant byte to pick a parsing strategy
+        head = b''
+        async for chunk in chunks:
+            head += chunk
+            if head.lstrip():
+                break
+
+        if OpenAPILoader._is_streamable_json(head, content_type, url):
+            parser = StreamingDocumentParser(on_path_item, on_component, max_bytes)
+            parser.feed(head.lstrip().removeprefix(b'\xef\xbb\xbf'))
+            async for chunk in chunks:
+                parser.feed(chunk)
+            return parser.close()
+
+        body = bytearray(head)
+        async for chunk in chunks:
+            body += chunk
+            if max_bytes and len(body) > max_bytes:
+                raise DocumentTooLargeError(max_bytes)
+
+        def parse() -> Dict[str, Any]:
+            doc = OpenAPILoader._parse_content(bytes(body), content_type, url)
+            OpenAPILoader._replay(doc, on_path_item, on_component)
+            return doc
+
+        # A large YAML document takes seconds to parse, too long to hold the event loop
+        return await asyncio.to_thread(parse)
+
+    @staticmethod
+    async def _file_chunks(path: str) -> AsyncIterator[bytes]:
+        """Read a local file in STREAM_CHUNK_SIZE chunks from a memory map."""
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, len(mapped), STREAM_CHUNK_SIZE):
+                    yield mapped[offset:offset + STREAM_CHUNK_SIZE]
+                    # Let other tasks run between chunks, as a network download would
+                    await asyncio.sleep(0)
+
+    @staticmethod
+    async def _observed(chunks: AsyncIterator[bytes], on_bytes: Callable[[bytes], None]) -> AsyncIterator[bytes]:
+        """Pass body chunks through, reporting each one to on_bytes."""
+        async for chunk in chunks:
+            on_bytes(chunk)
+            yield chunk
+
+    @staticmethod
+    async def _reported(
+        chunks: AsyncIterator[bytes],
+        on_progress: ProgressCallback,
+        transferred: Callable[[], int],
+        total: Optional[int]
+    ) -> AsyncIterator[bytes]:
+        """Pass body chunks through, reporting progress every PROGRESS_INTERVAL_BYTES and at the end."""
+        reported = 0
+        async for chunk in chunks:
+            yield chunk
+            done = transferred()
+            if done - reported >= PROGRESS_INTERVAL_BYTES:
+                reported = done
+                await on_progress(done, total)
+        done = transferred()
+        if done != reported or not reported:
+            await on_progress(done, total)
 
     @staticmethod
-    def _parse_response(response: httpx.Response, url: str) -> Dict[str, Any]:
+    def _is_streamable_json(head: bytes, content_type: str, url: str) -> bool:
         """
-        Parse HTTP response content as JSON or YAML.
+        Check whether a body can go through the incremental JSON parser.
 
         Args:
-            response: HTTP response object
+            head: First bytes of the body
+            content_type: Lowercased Content-Type header
+            url: Original URL (for format detection)
+
+        Returns:
+            True for JSON objects not declared as YAML
+        """
+        if 'yaml' in content_type or url.endswith(('.yaml', '.yml')):
+            return False
+        return head.lstrip().removeprefix(b'\xef\xbb\xbf').startswith(b'{')
+
+    @staticmethod
+    def _parse_content(content: bytes, content_type: str, url: str) -> Dict[str, Any]:
+        """
+        Parse a complete body as JSON or YAML.
+
+        Args:
+            content: Raw body bytes
+            content_type: Lowercased Content-Type header
             url: Original URL (for format detection)
 
         Returns:
@@ -59,20 +361,44 @@ class OpenAPILoader:
             json.JSONDecodeError: If JSON parsing fails
             yaml.YAMLError: If YAML parsing fails
         """
-        content_type = response.headers.get('content-type', '').lower()
+        import yaml
 
         # Try to determine format by Content-Type
         if 'json' in content_type or url.endswith('.json'):
-            return response.json()
+            return json.loads(content)
 
         if 'yaml' in content_type or url.endswith(('.yaml', '.yml')):
-            return yaml.safe_load(response.text)
+            return yaml.safe_load(content)
 
         # Auto-detect format: try JSON first, then YAML
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            return yaml.safe_load(response.text)
+            return json.loads(content)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return yaml.safe_load(content)
+
+    @staticmethod
+    def _replay(
+        doc: Any,
+        on_path_item: Optional[PathItemCallback],
+        on_component: Optional[ComponentCallback]
+    ) -> None:
+        """
+        Report the path items and components of a fully parsed document.
+        """
+        if not isinstance(doc, dict):
+            return
+
+        paths = doc.get('paths')
+        if on_path_item and isinstance(paths, dict):
+            for path, path_item in paths.items():
+                on_path_item(path, path_item)
+
+        components = doc.get('components')
+        if on_component and isinstance(components, dict):
+            for kind, entries in components.items():
+                if isinstance(entries, dict):
+                    for name, component in entries.items():
+                        on_component(kind, name, component)
 
     @staticmethod
     def validate_document(doc: Dict[str, Any]) -> tuple[bool, str]:
@@ -0,0 +1,361 @@
+"""
+Bundler that inlines external and multi-file $ref targets into one document
+"""
+
+import copy
+import asyncio
+import posixpath
+from collections import deque
+from urllib.parse import urljoin, urldefrag, urlparse
+from urllib.request import url2pathname
+from typing import Dict, Any, List, Optional, Set, Callable
+from src.config import ERROR_EXTERNAL_REF_REFUSED, ERROR_LOCAL_REF_REFUSED
+from src.loaders.fetch_cache import FetchCache
+from src.utils.json_pointer import split_pointer, escape_token, resolve_pointer
+
+# Keys whose children ($ref objects in a map or list) target a component kind
+COLLECTION_KINDS = {
+    'parameters': 'parameters',
+    'responses': 'responses',
+    'headers': 'headers',
+    'examples': 'examples',
+    'links': 'links',
+    'callbacks': 'callbacks',
+    'properties': 'schemas',
+    'patternProperties': 'schemas',
+    'definitions': 'schemas',
+    'schemas': 'schemas',
+    'requestBodies': 'requestBodies',
+    'securitySchemes': 'securitySchemes',
+}
+
+# Keys whose own value is a $ref to a component kind other than schemas
+VALUE_KINDS = {
+    'requestBody': 'requestBodies',
+}
+
+# Where bundled components live in Swagger 2.0 documents
+SWAGGER_KIND_LOCATIONS = {
+    'schemas': 'definitions',
+    'parameters': 'parameters',
+    'responses': 'responses',
+}
+
+# Schemes an external ref may use, by the scheme of the root document. Remote
+# documents can never reach local files, whether by file:// URL or bare path.
+REF_SCHEMES = {
+    'http': ('http', 'https'),
+    'https': ('http', 'https'),
+    'file': ('file',),
+}
+
+
+class ExternalRefError(ValueError):
+    """Raised when a document references a location its root document may not reach."""
+
+
+class ExternalRefBundler:
+    """
+    Resolves refs such as './common.yaml#/Error' or 'https://host/shared.json#/X'.
+
+    External documents are discovered transitively, fetched concurrently
+    through a shared FetchCache, and every referenced node is copied into
+    the root document's components under a unique name. Refs are then
+    rewritten to local pointers, so the bundled document is resolvable by
+    RefResolver. Cycles across files terminate because each target is
+    assigned its local name before its own refs are rewritten.
+
+    Refs are only followed to the root document's own kind of location
+    (REF_SCHEMES): a spec fetched over http(s) cannot pull in local files.
+    Local refs can further be confined to allowed paths.
+    """
+
+    def __init__(self, cache: FetchCache):
+        """
+        Initialize ExternalRefBundler.
+
+        Args:
+            cache: Shared cache used to fetch external documents
+        """
+        self.cache = cache
+
+    async def bundle(
+        self,
+        doc: Dict[str, Any],
+        url: str,
+        allow_path: Optional[Callable[[str], bool]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bundle all external refs of a document in place.
+
+        Args:
+            doc: Parsed root document (modified in place)
+            url: URL the document was loaded from
+            allow_path: Whether file:// refs may read a local path (optional, default: any path)
+
+        Returns:
+            Bundling report, or None if the document has no external refs
+
+        Raises:
+            ExternalRefError: If the document or one it references has a ref
+                              to a scheme or path the root document may not reach
+        """
+        base_url = urldefrag(url)[0]
+        schemes = REF_SCHEMES.get(urlparse(base_url).scheme, ())
+        external_urls = self._collect_external(doc, base_url, schemes, allow_path)
+        if not external_urls:
+            return None
+
+        documents: Dict[str, Any] = {base_url: doc}
+        failed: Dict[str, str] = {}
+        pending = external_urls
+
+        # Fetch level by level; documents found in fetched files join the next level
+        while pending:
+            ordered = sorted(pending)
+            results = await asyncio.gather(*(self.cache.get(u) for u in ordered), return_exceptions=True)
+            discovered: Set[str] = set()
+            for fetched_url, result in zip(ordered, results):
+                if isinstance(result, Exception):
+                    failed[fetched_url] = str(result)
+                    continue
+                documents[fetched_url] = result
+                discovered |= self._collect_external(result, fetched_url, schemes, allow_path)
+            pending = discovered - documents.keys() - failed.keys()
+
+        # Copying the referenced nodes is CPU work, kept off the event loop
+        return await asyncio.to_thread(_BundleRun(doc, base_url, documents, failed).run)
+
+    @staticmethod
+    def _collect_external(
+        node: Any,
+        doc_url: str,
+        schemes: tuple,
+        allow_path: Optional[Callable[[str], bool]] = None
+    ) -> Set[str]:
+        """
+        Find the URLs of all documents referenced from a document.
+
+        Args:
+            node: Document or subtree
+            doc_url: URL of the document the refs are relative to
+            schemes: URL schemes the refs may use
+            allow_path: Whether file:// refs may read a local path (optional)
+
+        Returns:
+            Absolute document URLs other than doc_url
+
+        Raises:
+            ExternalRefError: If a ref resolves to a URL with another scheme,
+                              or to a local path allow_path refuses
+        """
+        urls: Set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get('$ref')
+                if isinstance(ref, str) and not ref.startswith('#'):
+                    target_url = urldefrag(urljoin(doc_url, ref))[0]
+                    if target_url != doc_url:
+                        if urlparse(target_url).scheme not in schemes:
+                            raise ExternalRefError(ERROR_EXTERNAL_REF_REFUSED.format(
+                                ref=ref,
+                                document=doc_url,
+                                scheme=urlparse(doc_url).scheme or 'an unknown scheme',
+                                allowed='/'.join(schemes) or 'no external'
+                            ))
+                        if allow_path is not None and urlparse(target_url).scheme == 'file':
+                            path = url2pathname(urlparse(target_url).path)
+                            if not allow_path(path):
+                                raise ExternalRefError(ERROR_LOCAL_REF_REFUSED.format(
+                                    ref=ref, document=doc_url, path=path
+                                ))
+                        urls.add(target_url)
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+        return urls
+
+
+class _BundleRun:
+    """
+    State of one bundling pass over fetched documents.
+    """
+
+    def __init__(self, root: Dict[str, Any], base_url: str, documents: Dict[str, Any], failed: Dict[str, str]):
+        self.root = root
+        self.base_url = base_url
+        self.documents = documents
+        self.failed = failed
+        self.is_swagger = 'swagger' in root
+        self.targets: Dict[tuple, str] = {}
+        self.used_names: Dict[str, Set[str]] = {}
+        self.bundled: Dict[str, Dict[str, Any]] = {}
+        self.unresolved: List[str] = []
+        self.queue: deque = deque()
+
+    def run(self) -> Dict[str, Any]:
+        paths = self.root.get('paths')
+        for key, value in self.root.items():
+            if key == 'paths' and isinstance(paths, dict):
+                self._inline_path_items(paths)
+            else:
+                self._walk(value, self.base_url, COLLECTION_KINDS.get(key, 'schemas'), key in COLLECTION_KINDS)
+
+        # Rewriting a bundled node may discover further targets
+        while self.queue:
+            node, doc_url, kind = self.queue.popleft()
+            self._walk(node, doc_url, kind)
+
+        for kind, entries in self.bundled.items():
+            container = self._container(kind)
+            container.update(entries)
+
+        return {
+            "documents_fetched": len(self.documents) - 1,
+            "bundled_refs": len(self.targets),
+            "unresolved_refs": sorted(set(self.unresolved)),
+            "failed_documents": self.failed
+        }
+
+    def _inline_path_items(self, paths: Dict[str, Any]) -> None:
+        """Path item refs are inlined so operations stay indexable."""
+        for path, path_item in list(paths.items()):
+            if isinstance(path_item, dict) and isinstance(path_item.get('$ref'), str) \
+                    and not path_item['$ref'].startswith('#'):
+                target_url, fragment = self._split(path_item['$ref'], self.base_url)
+                try:
+                    node = copy.deepcopy(resolve_pointer(self.documents[target_url], fragment))
+                except KeyError:
+                    self.unresolved.append(path_item['$ref'])
+                    continue
+                self._walk(node, target_url, 'schemas')
+                merged = {k: v for k, v in path_item.items() if k != '$ref'}
+                if isinstance(node, dict):
+                    merged.update(node)
+                paths[path] = merged
+                continue
+            self._walk(path_item, self.base_url, 'schemas')
+
+    def _walk(self, node: Any, doc_url: str, kind: str, is_collection: bool = False) -> None:
+        """
+        Rewrite refs in place below a node.
+
+        Args:
+            node: Subtree to rewrite
+            doc_url: URL of the document the subtree came from
+            kind: Component kind a $ref at this position targets
+            is_collection: True if node is a map/list whose children have that kind
+        """
+        if is_collection:
+            children = node.values() if isinstance(node, dict) else node if isinstance(node, list) else ()
+            for child in children:
+                self._walk(child, doc_url, kind)
+            return
+
+        if isinstance(node, list):
+            for item in node:
+                self._walk(item, doc_url, kind)
+            return
+
+        if not isinstance(node, dict):
+            return
+
+        ref = node.get('$ref')
+        if isinstance(ref, str):
+            local = self._localize(ref, doc_url, kind)
+            if local is not None:
+                node['$ref'] = local
+
+        for key, value in node.items():
+            if key == '$ref':
+                continue
+            if key in COLLECTION_KINDS:
+                self._walk(value, doc_url, COLLECTION_KINDS[key], True)
+            else:
+                self._walk(value, doc_url, VALUE_KINDS.get(key, 'schemas'))
+
+    def _split(self, ref: str, doc_url: str) -> tuple[str, str]:
+        target_url, fragment = urldefrag(urljoin(doc_url, ref))
+        return target_url, '#' + fragment
+
+    def _localize(self, ref: str, doc_url: str, kind: str) -> Optional[str]:
+        """
+        Map a ref to its pointer in the bundled root document.
+
+        Returns:
+            Local pointer, or None to leave the ref untouched
+        """
+        target_url, fragment = self._split(ref, doc_url)
+        if target_url == self.base_url:
+            return fragment
+        # Only documents fetched by bundle(), which checked their schemes, are inlined
+        if target_url not in self.documents:
+            self.unresolved.append(ref)
+            return urljoin(doc_url, ref)
+
+        key = (target_url, fragment)
+        if key in self.targets:
+            return self.targets[key]
+
+        try:
+            node = copy.deepcopy(resolve_pointer(self.documents[target_url], fragment))
+        except (KeyError, ValueError):
+            self.unresolved.append(ref)
+            return urljoin(doc_url, ref)
+
+        kind = self._kind_from_fragment(fragment) or kind
+        name = self._unique_name(kind, self._name_for(target_url, fragment))
+        local = self._pointer(kind, name)
+        self.targets[key] = local
+        self.bundled.setdefault(kind, {})[name] = node
+        self.queue.append((node, target_url, kind))
+        return local
+
+    def _kind_from_fragment(self, fragment: str) -> Optional[str]:
+        tokens = split_pointer(fragment)
+        if len(tokens) >= 3 and tokens[0] == 'components':
+            return tokens[1]
+        if len(tokens) >= 2 and tokens[0] in ('definitions', 'parameters', 'responses'):
+            return COLLECTION_KINDS[tokens[0]]
+        return None
+
+    @staticmethod
+    def _name_for(target_url: str, fragment: str) -> str:
+        tokens = split_pointer(fragment)
+        if tokens:
+            return tokens[-1]
+        stem = posixpath.splitext(posixpath.basename(urlparse(target_url).path))[0]
+        return stem or 'External'
+
+    def _unique_name(self, kind: str, name: str) -> str:
+        used = self.used_names.get(kind)
+        if used is None:
+            used = set(self._container(kind, create=False) or ())
+            self.used_names[kind] = used
+
+        candidate = name
+        suffix = 2
+        while candidate in used:
+            candidate = f"{name}_{suffix}"
+            suffix += 1
+        used.add(candidate)
+        return candidate
+
+    def _pointer(self, kind: str, name: str) -> str:
+        if self.is_swagger:
+            return f"#/{SWAGGER_KIND_LOCATIONS.get(kind, 'definitions')}/{escape_token(name)}"
+        return f"#/components/{kind}/{escape_token(name)}"
+
+    def _container(self, kind: str, create: bool = True) -> Optional[Dict[str, Any]]:
+        if self.is_swagger:
+            location = SWAGGER_KIND_LOCATIONS.get(kind, 'definitions')
+            if not create:
+                return self.root.get(location)
+            return self.root.setdefault(location, {})
+
+        components = self.root.get('components') if not create else self.root.setdefault('components', {})
+        if components is None:
+            return None
+        return components.get(kind) if not create else components.setdefault(kind, {})
@@ -0,0 +1,256 @@
+"""
+Incremental JSON parser that emits path items and components as they complete
+"""
+
+import re
+import json
+from typing import Dict, Any, List, Optional, Callable
+
+# Characters that change parser state outside strings
+STRUCTURAL_RE = re.compile(rb'["{}\[\],:]')
+# Characters that end or escape inside strings
+STRING_SPECIAL_RE = re.compile(rb'["\\]')
+
+# Top-level members that are split into smaller values instead of parsed whole
+SPLIT_ROOT_KEYS = ('paths', 'components')
+
+PathItemCallback = Callable[[str, Any], None]
+ComponentCallback = Callable[[str, str, Any], None]
+
+
+class DocumentTooLargeError(Exception):
+    """Raised when a document exceeds the configured maximum size."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Document exceeds the maximum size of {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class _Frame:
+    """An open JSON container on the parser stack."""
+
+    __slots__ = ('is_object', 'expecting_key', 'key')
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.expecting_key = is_object
+        self.key: Optional[str] = None
+
+
+class StreamingDocumentParser:
+    """
+    Parses a JSON OpenAPI document from byte chunks.
+
+    The parser only tracks structure (brackets, strings, keys) while bytes
+    arrive. Each value under 'paths', each entry under 'components/<kind>'
+    and every other top-level member is decoded with json.loads as soon as
+    its closing byte is seen, and the consumed bytes are released. Peak
+    memory is the parsed tree plus the largest single value, instead of
+    the whole body plus the tree.
+
+    Example:
+        parser = StreamingDocumentParser(on_path_item=index_path_item)
+        for chunk in chunks:
+            parser.feed(chunk)
+        doc = parser.close()
+    """
+
+    def __init__(
+        self,
+        on_path_item: Optional[PathItemCallback] = None,
+        on_component: Optional[ComponentCallback] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize StreamingDocumentParser.
+
+        Args:
+            on_path_item: Called with (path, path_item) as each path item completes
+            on_component: Called with (kind, name, component) as each component completes
+            max_bytes: Abort with DocumentTooLargeError beyond this many bytes (optional)
+        """
+        self.on_path_item = on_path_item
+        self.on_component = on_component
+        self.max_bytes = max_bytes
+        self.bytes_received = 0
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        # Python containers of the objects we descended into; _targets[d] is depth d + 1
+        self._targets: List[Dict[str, Any]] = []
+        self._in_string = False
+        self._string_start = 0
+        self._capture: Optional[tuple[int, int]] = None
+        self._pending_split: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            chunk: Raw bytes
+
+        Raises:
+            DocumentTooLargeError: If max_bytes is exceeded
+            json.JSONDecodeError: If a completed value is not valid JSON
+            ValueError: If the document is not a JSON object
+        """
+        self.bytes_received += len(chunk)
+        if self.max_bytes and self.bytes_received > self.max_bytes:
+            raise DocumentTooLargeError(self.max_bytes)
+
+        if self._done:
+            return
+
+        self._buf += chunk
+        self._scan()
+        self._compact()
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing.
+
+        Returns:
+            The complete document
+
+        Raises:
+            json.JSONDecodeError: If the document ended early
+        """
+        if not self._done:
+            raise json.JSONDecodeError("Unexpected end of JSON document", "", self.bytes_received)
+        return self._root
+
+    def _scan(self) -> None:
+        buf = self._buf
+        pos = self._pos
+
+        while not self._done:
+            if self._in_string:
+                match = STRING_SPECIAL_RE.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                index = match.start()
+                if buf[index] == 0x5C:  # backslash
+                    if index + 1 >= len(buf):
+                        pos = index
+                        break
+                    pos = index + 2
+                    continue
+
+                self._in_string = False
+                pos = index + 1
+                frame = self._stack[-1]
+                if self._capture is None and frame.is_object and frame.expecting_key:
+                    frame.key = json.loads(bytes(buf[self._string_start:pos]))
+                continue
+
+            match = STRUCTURAL_RE.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            index = match.start()
+            char = buf[index]
+            pos = index + 1
+
+            if self._pending_split is not None:
+                self._resolve_split(index, char)
+
+            if not self._stack and char != 0x7B:
+                raise ValueError("OpenAPI JSON document must be an object")
+
+            if char == 0x22:  # "
+                self._in_string = True
+                self._string_start = index
+            elif char == 0x7B or char == 0x5B:  # { [
+                self._open(char == 0x7B)
+            elif char == 0x7D or char == 0x5D:  # } ]
+                if self._capture is not None and len(self._stack) == self._capture[0]:
+                    self._finish_capture(index)
+                self._close_frame()
+            elif char == 0x2C:  # ,
+                if self._capture is not None and len(self._stack) == self._capture[0]:
+                    self._finish_capture(index)
+                frame = self._stack[-1]
+                if frame.is_object:
+                    frame.expecting_key = True
+            else:  # :
+                frame = self._stack[-1]
+                frame.expecting_key = False
+                if self._capture is None:
+                    self._start_member(pos)
+
+        self._pos = pos
+
+    def _open(self, is_object: bool) -> None:
+        if not self._stack:
+            self._root: Dict[str, Any] = {}
+            self._targets.append(self._root)
+        self._stack.append(_Frame(is_object))
+
+    def _close_frame(self) -> None:
+        depth = len(self._stack)
+        self._stack.pop()
+        if len(self._targets) == depth:
+            if depth > 1:
+                self._targets.pop()
+            else:
+                self._done = True
+
+    def _start_member(self, value_start: int) -> None:
+        """Decide whether the member value after a colon is split or captured whole."""
+        depth = len(self._stack)
+        root_key = self._stack[0].key
+        if (depth == 1 and root_key in SPLIT_ROOT_KEYS) or (depth == 2 and root_key == 'components'):
+            self._pending_split = value_start
+        else:
+            self._capture = (depth, value_start)
+
+    def _resolve_split(self, index: int, char: int) -> None:
+        """Descend into a split member if its value is an object, otherwise capture it."""
+        start = self._pending_split
+        self._pending_split = None
+        key = self._stack[-1].key
+
+        if char == 0x7B and not self._buf[start:index].strip():
+            container: Dict[str, Any] = {}
+            self._targets[-1][key] = container
+            self._targets.append(container)
+        else:
+            self._capture = (len(self._stack), start)
+
+    def _finish_capture(self, end: int) -> None:
+        depth, start = self._capture
+        self._capture = None
+        key = self._stack[depth - 1].key
+        value = json.loads(bytes(self._buf[start:end]))
+        self._targets[depth - 1][key] = value
+
+        root_key = self._stack[0].key
+        if depth == 2 and root_key == 'paths' and self.on_path_item:
+            self.on_path_item(key, value)
+        elif depth == 3 and root_key == 'components' and self.on_component:
+            self.on_component(self._stack[1].key, key, value)
+
+    def _compact(self) -> None:
+        """Drop bytes that no pending value or key still needs."""
+        keep_from = self._pos
+        if self._capture is not None:
+            keep_from = min(keep_from, self._capture[1])
+        if self._pending_split is not None:
+            keep_from = min(keep_from, self._pending_split)
+        if self._in_string and self._capture is None:
+            keep_from = min(keep_from, self._string_start)
+
+        if keep_from == 0:
+            return
+
+        del self._buf[:keep_from]
+        self._pos -= keep_from
+        self._string_start -= keep_from
+        if self._capture is not None:
+            self._capture = (self._capture[0], self._capture[1] - keep_from)
+        if self._pending_split is not None:
+            self._pending_split -= keep_from
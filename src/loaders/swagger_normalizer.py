@@ -0,0 +1,416 @@
+"""
+Normalizer that converts Swagger 2.0 documents into the OpenAPI 3.0 shape
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, List, Optional, Tuple
+from src.config import HTTP_METHODS
+from src.utils.json_pointer import split_pointer
+
+# The version written into normalized documents
+OPENAPI_VERSION = '3.0.3'
+
+# Swagger 2.0 sections and the components they become
+SECTION_KINDS = {
+    'definitions': 'schemas',
+    'parameters': 'parameters',
+    'responses': 'responses',
+    'securityDefinitions': 'securitySchemes',
+}
+
+# Local ref prefixes and their OpenAPI 3.0 equivalents
+REF_PREFIXES = tuple(
+    (f'#/{section}/', f'#/components/{kind}/') for section, kind in SECTION_KINDS.items()
+)
+
+# Top-level Swagger 2.0 fields replaced by servers and per-operation media types
+TRANSPORT_FIELDS = ('host', 'basePath', 'schemes', 'consumes', 'produces')
+
+# Fields of non-body parameters, items and headers that describe the value's schema
+SCHEMA_FIELDS = (
+    'type', 'format', 'items', 'default', 'maximum', 'exclusiveMaximum', 'minimum',
+    'exclusiveMinimum', 'maxLength', 'minLength', 'pattern', 'maxItems', 'minItems',
+    'uniqueItems', 'enum', 'multipleOf'
+)
+
+# Array serializations of query parameters as (style, explode)
+COLLECTION_STYLES = {
+    'csv': ('form', False),
+    'ssv': ('spaceDelimited', False),
+    'pipes': ('pipeDelimited', False),
+    'multi': ('form', True),
+}
+
+# Swagger 2.0 OAuth2 flow names and their OpenAPI 3.0 equivalents
+OAUTH2_FLOWS = {
+    'implicit': 'implicit',
+    'password': 'password',
+    'application': 'clientCredentials',
+    'accessCode': 'authorizationCode',
+}
+
+FORM_MEDIA_TYPES = ('application/x-www-form-urlencoded', 'multipart/form-data')
+DEFAULT_MEDIA_TYPES = ['application/json']
+
+
+class SwaggerNormalizer:
+    """
+    Converts a Swagger 2.0 document into an equivalent OpenAPI 3.0 document.
+
+    definitions, parameters, responses and securityDefinitions move under
+    components; body and formData parameters become request bodies, and
+    response schemas become content, for the consumes/produces media types
+    in effect; host, basePath and schemes become servers. Refs are
+    rewritten to their new locations. The result shares no mutable objects
+    with the input, which is left unchanged.
+    """
+
+    def __init__(self, doc: Mapping):
+        """
+        Initialize SwaggerNormalizer.
+
+        Args:
+            doc: Complete Swagger 2.0 document (external refs already bundled)
+        """
+        self.doc = doc
+
+    @staticmethod
+    def is_swagger(doc: Mapping) -> bool:
+        """
+        Check whether a document is Swagger 2.0.
+
+        Args:
+            doc: Parsed document
+
+        Returns:
+            True for documents with a 'swagger' version field and no 'openapi' field
+        """
+        return 'swagger' in doc and 'openapi' not in doc
+
+    def normalize(self) -> Dict[str, Any]:
+        """
+        Convert the document.
+
+        Returns:
+            OpenAPI 3.0 document
+        """
+        doc = self.doc
+        consumes = self._list(doc.get('consumes')) or DEFAULT_MEDIA_TYPES
+        produces = self._list(doc.get('produces')) or DEFAULT_MEDIA_TYPES
+
+        result: Dict[str, Any] = {'openapi': OPENAPI_VERSION}
+        if 'info' in doc:
+            result['info'] = doc['info']
+        servers = self._servers(doc.get('schemes'))
+        if servers:
+            result['servers'] = servers
+
+        for key, value in doc.items():
+            if key in ('swagger', 'info') or key in TRANSPORT_FIELDS or key in SECTION_KINDS:
+                continue
+            if key == 'paths' and isinstance(value, Mapping):
+                result['paths'] = {
+                    path: self._path_item(path_item, consumes, produces)
+                    for path, path_item in value.items()
+                }
+            else:
+                result[key] = value
+
+        components = {}
+        if isinstance(doc.get('definitions'), Mapping):
+            components['schemas'] = dict(doc['definitions'])
+        if isinstance(doc.get('parameters'), Mapping):
+            # Body and formData parameters are inlined where they are used
+            parameters = {
+                name: self._parameter(parameter)
+                for name, parameter in doc['parameters'].items()
+                if not self._is_body(parameter)
+            }
+            if parameters:
+                components['parameters'] = parameters
+        if isinstance(doc.get('responses'), Mapping):
+            components['responses'] = {
+                code: self._response(response, produces)
+                for code, response in doc['responses'].items()
+            }
+        if isinstance(doc.get('securityDefinitions'), Mapping):
+            components['securitySchemes'] = {
+                name: self._security_scheme(scheme)
+                for name, scheme in doc['securityDefinitions'].items()
+            }
+        if components:
+            result['components'] = components
+
+        return self._finish(result)
+
+    def _servers(self, schemes: Any) -> List[Dict[str, str]]:
+        """Build servers from host, basePath and schemes."""
+        host = self.doc.get('host')
+        base_path = self.doc.get('basePath') or ''
+        if not host:
+            return [{'url': base_path}] if base_path else []
+        return [{'url': f"{scheme}://{host}{base_path}"} for scheme in self._list(schemes) or ['https']]
+
+    def _path_item(self, path_item: Any, consumes: List[str], produces: List[str]) -> Any:
+        """Convert the parameters and operations of a path item."""
+        if not isinstance(path_item, Mapping):
+            return path_item
+
+        shared_params, shared_body = self._split_parameters(path_item.get('parameters'))
+        converted = {}
+        for key, value in path_item.items():
+            if key == 'parameters':
+                if shared_params:
+                    converted['parameters'] = shared_params
+            elif key in HTTP_METHODS and isinstance(value, Mapping):
+                converted[key] = self._operation(value, shared_body, consumes, produces)
+            else:
+                converted[key] = value
+        return converted
+
+    def _operation(
+        self,
+        operation: Mapping,
+        shared_body: List[Mapping],
+        consumes: List[str],
+        produces: List[str]
+    ) -> Dict[str, Any]:
+        """Convert one operation, moving body and formData parameters into its request body."""
+        consumes = self._list(operation.get('consumes')) or consumes
+        produces = self._list(operation.get('produces')) or produces
+        parameters, body = self._split_parameters(operation.get('parameters'))
+
+        # An operation's own body replaces the path's; form fields override by name
+        if not any(parameter.get('in') == 'body' for parameter in body):
+            overridden = {parameter.get('name') for parameter in body}
+            body = [parameter for parameter in shared_body if parameter.get('name') not in overridden] + body
+        request_body = self._request_body(body, consumes)
+
+        converted = {}
+        for key, value in operation.items():
+            if key in ('consumes', 'produces'):
+                continue
+            if key == 'schemes':
+                servers = self._servers(value)
+                if servers:
+                    converted['servers'] = servers
+            elif key == 'parameters':
+                if parameters:
+                    converted['parameters'] = parameters
+                if request_body is not None:
+                    converted['requestBody'] = request_body
+            elif key == 'responses' and isinstance(value, Mapping):
+                converted['responses'] = {
+                    code: self._response(response, produces) for code, response in value.items()
+                }
+            else:
+                converted[key] = value
+
+        if request_body is not None and 'requestBody' not in converted:
+            # Only path-level parameters carried a body
+            converted['requestBody'] = request_body
+        return converted
+
+    def _split_parameters(self, parameters: Any) -> Tuple[List[Any], List[Mapping]]:
+        """
+        Separate converted non-body parameters from body and formData ones.
+
+        Refs to body or formData parameters are resolved, since those do
+        not exist as parameter components in OpenAPI 3.0.
+        """
+        plain, body = [], []
+        for parameter in self._list(parameters):
+            target = self._local_parameter(parameter)
+            if self._is_body(target):
+                body.append(target)
+            else:
+                plain.append(self._parameter(parameter))
+        return plain, body
+
+    def _local_parameter(self, parameter: Any) -> Any:
+        """Follow a #/parameters/<name> ref, or return the parameter itself."""
+        if not isinstance(parameter, Mapping) or not isinstance(parameter.get('$ref'), str):
+            return parameter
+        ref = parameter['$ref']
+        if not ref.startswith('#/parameters/'):
+            return parameter
+        tokens = split_pointer(ref)
+        parameters = self.doc.get('parameters')
+        if len(tokens) != 2 or not isinstance(parameters, Mapping):
+            return parameter
+        return parameters.get(tokens[1], parameter)
+
+    @staticmethod
+    def _is_body(parameter: Any) -> bool:
+        """Whether a parameter is a body or formData parameter."""
+        return isinstance(parameter, Mapping) and parameter.get('in') in ('body', 'formData')
+
+    def _parameter(self, parameter: Any) -> Any:
+        """Convert a non-body parameter, moving its value fields into a schema."""
+        if not isinstance(parameter, Mapping) or '$ref' in parameter:
+            return parameter
+
+        converted = {
+            key: value for key, value in parameter.items()
+            if key not in SCHEMA_FIELDS and key != 'collectionFormat'
+        }
+        schema = self._value_schema(parameter)
+        converted['schema'] = schema
+
+        if schema.get('type') == 'array':
+            collection_format = parameter.get('collectionFormat', 'csv')
+            if parameter.get('in') == 'query' and collection_format in COLLECTION_STYLES:
+                converted['style'], converted['explode'] = COLLECTION_STYLES[collection_format]
+            elif collection_format != 'csv':
+                # tsv and the non-query uses of ssv/pipes/multi have no 3.0 style
+                converted['x-collectionFormat'] = collection_format
+        return converted
+
+    def _value_schema(self, value: Mapping) -> Dict[str, Any]:
+        """Build the schema of a non-body parameter, header or items object."""
+        schema = {key: value[key] for key in SCHEMA_FIELDS if key in value}
+        if isinstance(schema.get('items'), Mapping):
+            schema['items'] = self._value_schema(schema['items'])
+        return schema
+
+    def _request_body(self, parameters: List[Mapping], consumes: List[str]) -> Optional[Dict[str, Any]]:
+        """Build a request body from body or formData parameters."""
+        body = next((parameter for parameter in parameters if parameter.get('in') == 'body'), None)
+        if body is not None:
+            request_body = {}
+            if 'description' in body:
+                request_body['description'] = body['description']
+            request_body['content'] = {
+                media_type: {'schema': body.get('schema', {})} for media_type in consumes
+            }
+            if body.get('required'):
+                request_body['required'] = True
+            if 'name' in body:
+                request_body['x-body-name'] = body['name']
+            return request_body
+
+        fields = [parameter for parameter in parameters if parameter.get('in') == 'formData']
+        if not fields:
+            return None
+
+        properties = {}
+        required = []
+        for field in fields:
+            schema = self._value_schema(field)
+            if 'description' in field:
+                schema['description'] = field['description']
+            properties[field.get('name', '')] = schema
+            if field.get('required'):
+                required.append(field.get('name', ''))
+        schema = {'type': 'object', 'properties': properties}
+        if required:
+            schema['required'] = required
+
+        has_file = any(field.get('type') == 'file' for field in fields)
+        media_types = [media_type for media_type in consumes if media_type in FORM_MEDIA_TYPES]
+        if not media_types:
+            media_types = ['multipart/form-data' if has_file else 'application/x-www-form-urlencoded']
+
+        request_body = {'content': {media_type: {'schema': schema} for media_type in media_types}}
+        if required:
+            request_body['required'] = True
+        return request_body
+
+    def _response(self, response: Any, produces: List[str]) -> Any:
+        """Convert a response, moving its schema and examples into content."""
+        if not isinstance(response, Mapping) or '$ref' in response:
+            return response
+
+        converted = {
+            key: value for key, value in response.items()
+            if key not in ('schema', 'examples', 'headers')
+        }
+        converted.setdefault('description', '')
+
+        headers = response.get('headers')
+        if isinstance(headers, Mapping):
+            converted['headers'] = {
+                name: self._header(header) for name, header in headers.items()
+            }
+
+        examples = response.get('examples')
+        examples = examples if isinstance(examples, Mapping) else {}
+        if 'schema' in response:
+            content = {}
+            for media_type in produces:
+                content[media_type] = {'schema': response['schema']}
+                if media_type in examples:
+                    content[media_type]['example'] = examples[media_type]
+            converted['content'] = content
+        elif examples:
+            converted['content'] = {media_type: {'example': example} for media_type, example in examples.items()}
+        return converted
+
+    def _header(self, header: Any) -> Any:
+        """Convert a response header, moving its value fields into a schema."""
+        if not isinstance(header, Mapping):
+            return header
+        converted = {
+            key: value for key, value in header.items()
+            if key not in SCHEMA_FIELDS and key != 'collectionFormat'
+        }
+        converted['schema'] = self._value_schema(header)
+        return converted
+
+    @staticmethod
+    def _security_scheme(scheme: Any) -> Any:
+        """Convert a security definition into a security scheme."""
+        if not isinstance(scheme, Mapping):
+            return scheme
+
+        scheme_type = scheme.get('type')
+        extras = {key: value for key, value in scheme.items() if key == 'description' or key.startswith('x-')}
+        if scheme_type == 'basic':
+            return {'type': 'http', 'scheme': 'basic', **extras}
+        if scheme_type == 'oauth2':
+            flow = {
+                key: scheme[key] for key in ('authorizationUrl', 'tokenUrl') if key in scheme
+            }
+            flow['scopes'] = scheme.get('scopes', {})
+            flow_name = OAUTH2_FLOWS.get(scheme.get('flow'), scheme.get('flow', 'implicit'))
+            return {'type': 'oauth2', 'flows': {flow_name: flow}, **extras}
+        return dict(scheme)
+
+    def _finish(self, node: Any) -> Any:
+        """
+        Copy the converted document, rewriting refs and Swagger-only schema keywords.
+
+        type: file becomes a binary string, x-nullable becomes nullable and
+        a discriminator property name becomes a discriminator object.
+        """
+        if isinstance(node, Mapping):
+            converted = {}
+            for key, value in node.items():
+                if key == '$ref' and isinstance(value, str):
+                    converted[key] = self._rewrite_ref(value)
+                else:
+                    converted[key] = self._finish(value)
+            if converted.get('type') == 'file':
+                converted['type'] = 'string'
+                converted['format'] = 'binary'
+            if isinstance(converted.get('x-nullable'), bool):
+                converted['nullable'] = converted.pop('x-nullable')
+            if isinstance(converted.get('discriminator'), str):
+                converted['discriminator'] = {'propertyName': converted['discriminator']}
+            return converted
+        if isinstance(node, Sequence) and not isinstance(node, str):
+            return [self._finish(item) for item in node]
+        return node
+
+    @staticmethod
+    def _rewrite_ref(ref: str) -> str:
+        """Point a Swagger 2.0 section ref at its component."""
+        for old, new in REF_PREFIXES:
+            if ref.startswith(old):
+                return new + ref[len(old):]
+        return ref
+
+    @staticmethod
+    def _list(value: Any) -> List[Any]:
+        """A list value, or an empty list for anything else."""
+        return list(value) if isinstance(value, Sequence) and not isinstance(value, str) else []
@@ -19,7 +19,7 @@ class OpenAPIDocument(BaseModel):
     """
 
     raw: Dict[str, Any] = Field(
-        description="Complete original OpenAPI document"
+        description="Complete OpenAPI 3.x document (Swagger 2.0 sources are converted at load)"
     )
 
     info: Dict[str, Any] = Field(
@@ -52,6 +52,41 @@ class OpenAPIDocument(BaseModel):
         description="Fast lookup index: operationId -> {path, method}"
     )
 
+    pointer_table: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Fast lookup index: JSON pointer -> path tokens of every referenceable node"
+    )
+
+    path_tree: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Path segment tree with per-node operation ranges"
+    )
+
+    security_index: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Effective security of every operation, indexed by scheme and scope"
+    )
+
+    ngram_index: Dict[str, Dict[str, List[int]]] = Field(
+        default_factory=dict,
+        description="N-gram posting lists over path tree operations, per searchable field"
+    )
+
+    original: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="The Swagger 2.0 document as loaded, when raw holds its OpenAPI 3.0 conversion"
+    )
+
+    dedup_stats: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Structural deduplication counters from hash-consing at load time"
+    )
+
+    stats: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Statistics computed at load time (operation and schema counts, size, timings)"
+    )
+
     class Config:
         # Allow arbitrary types for flexibility with OpenAPI structures
         arbitrary_types_allowed = True
@@ -61,7 +96,14 @@ class OpenAPIDocument(BaseModel):
         cls,
         raw: Dict[str, Any],
         operation_index: Dict[str, Dict[str, str]],
-        tags: List[Dict[str, Any]]
+        tags: List[Dict[str, Any]],
+        pointer_table: Dict[str, List[str]] = None,
+        dedup_stats: Dict[str, Any] = None,
+        stats: Dict[str, Any] = None,
+        security_index: Dict[str, Any] = None,
+        path_tree: Dict[str, Any] = None,
+        ngram_index: Dict[str, Dict[str, List[int]]] = None,
+        original: Dict[str, Any] = None
     ) -> "OpenAPIDocument":
         """
         Create an OpenAPIDocument from a raw OpenAPI specification.
@@ -70,6 +112,13 @@ class OpenAPIDocument(BaseModel):
             raw: The complete OpenAPI document
             operation_index: Pre-built operation index
             tags: Extracted tags list
+            pointer_table: Pre-built JSON pointer table (optional)
+            dedup_stats: Hash-consing counters (optional)
+            stats: Load-time statistics (optional)
+            security_index: Pre-built effective-security index (optional)
+            path_tree: Pre-built path segment tree (optional)
+            ngram_index: Pre-built n-gram index for pattern search (optional)
+            original: Source document raw was converted from (optional)
 
         Returns:
             OpenAPIDocument instance
@@ -81,7 +130,14 @@ class OpenAPIDocument(BaseModel):
             paths=raw.get('paths', {}),
             components=raw.get('components', {}),
             tags=tags,
-            operation_index=operation_index
+            operation_index=operation_index,
+            pointer_table=pointer_table or {},
+            dedup_stats=dedup_stats or {},
+            stats=stats or {},
+            security_index=security_index or {},
+            path_tree=path_tree or {},
+            ngram_index=ngram_index or {},
+            original=original or {}
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -98,5 +154,12 @@ class OpenAPIDocument(BaseModel):
             'paths': self.paths,
             'components': self.components,
             'tags': self.tags,
-            'operation_index': self.operation_index
+            'operation_index': self.operation_index,
+            'pointer_table': self.pointer_table,
+            'security_index': self.security_index,
+            'path_tree': self.path_tree,
+            'ngram_index': self.ngram_index,
+            'original': self.original,
+            'dedup_stats': self.dedup_stats,
+            'stats': self.stats
         }
@@ -0,0 +1,89 @@
+"""
+Data models for the startup preload manifest
+"""
+
+from pathlib import Path
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+class PreloadEntry(BaseModel):
+    """One API to load at startup"""
+
+    name: str = Field(
+        description="API name for later queries"
+    )
+
+    url: Optional[str] = Field(
+        default=None,
+        description="URL of the OpenAPI document"
+    )
+
+    path: Optional[str] = Field(
+        default=None,
+        description="Local file path of the OpenAPI document (relative to the manifest)"
+    )
+
+    required: bool = Field(
+        default=True,
+        description="Whether the server reports ready only once this API is indexed"
+    )
+
+    refresh_seconds: float = Field(
+        default=0,
+        ge=0,
+        description="Reload the API this often; 0 loads it once at startup"
+    )
+
+    @model_validator(mode='after')
+    def _one_source(self) -> "PreloadEntry":
+        if (self.url is None) == (self.path is None):
+            raise ValueError(f"API '{self.name}' needs exactly one of 'url' or 'path'")
+        return self
+
+    def source(self, base_dir: str) -> str:
+        """
+        Get the URL to load this API from.
+
+        Args:
+            base_dir: Directory relative paths are resolved against
+
+        Returns:
+            The entry's URL, or a file:// URL for its path
+        """
+        if self.url is not None:
+            return self.url
+        return (Path(base_dir) / Path(self.path).expanduser()).resolve().as_uri()
+
+
+class PreloadManifest(BaseModel):
+    """
+    APIs to load when the server starts.
+
+    Example (JSON or YAML):
+        {
+            "apis": [
+                {"name": "petstore", "url": "https://petstore3.swagger.io/api/v3/openapi.json"},
+                {"name": "billing", "path": "specs/billing.yaml", "refresh_seconds": 3600},
+                {"name": "legacy", "url": "https://legacy.example.com/swagger.json", "required": false}
+            ]
+        }
+    """
+
+    apis: List[PreloadEntry] = Field(
+        default_factory=list,
+        description="APIs to load"
+    )
+
+    base_dir: str = Field(
+        default='.',
+        description="Directory relative file paths are resolved against"
+    )
+
+    @model_validator(mode='after')
+    def _unique_names(self) -> "PreloadManifest":
+        names = [entry.name for entry in self.apis]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate API names in manifest: {', '.join(duplicates)}")
+        return self
@@ -0,0 +1,175 @@
+"""
+Startup preloading of the APIs listed in a manifest
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Optional
+from src.config import PRELOAD_CONCURRENCY
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.models.preload_manifest import PreloadManifest, PreloadEntry
+
+
+logger = logging.getLogger(__name__)
+
+
+def load_manifest(path: str) -> PreloadManifest:
+    """
+    Read a preload manifest from a JSON or YAML file.
+
+    Relative file paths in the manifest are resolved against the
+    manifest's own directory.
+
+    Args:
+        path: Manifest file path
+
+    Returns:
+        Validated manifest
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the manifest is malformed
+    """
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    if path.endswith(('.yaml', '.yml')):
+        import yaml
+        data = yaml.safe_load(content)
+    else:
+        data = json.loads(content)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"Preload manifest '{path}' must be an object with an 'apis' list")
+    data.setdefault('base_dir', os.path.dirname(os.path.abspath(path)))
+    return PreloadManifest.model_validate(data)
+
+
+class Preloader:
+    """
+    Loads the APIs of a manifest concurrently and tracks their readiness.
+
+    Loading runs on its own thread and event loop, so the server starts
+    answering (and reporting "loading" on /health) immediately.
+    """
+
+    def __init__(
+        self,
+        api_service: ApiService,
+        manifest: PreloadManifest,
+        concurrency: int = PRELOAD_CONCURRENCY
+    ):
+        """
+        Initialize Preloader.
+
+        Args:
+            api_service: ApiService to load through
+            manifest: APIs to load
+            concurrency: Maximum number of APIs loading at the same time
+        """
+        self.api_service = api_service
+        self.manifest = manifest
+        self.concurrency = max(1, concurrency)
+        self._states: Dict[str, Dict[str, Any]] = {
+            entry.name: {"state": "pending", "load_ms": None, "error": None}
+            for entry in manifest.apis
+        }
+
+    def start(self) -> threading.Thread:
+        """
+        Start loading in a background thread.
+
+        Returns:
+            The started daemon thread
+        """
+        thread = threading.Thread(target=asyncio.run, args=(self.run(),), name="preloader", daemon=True)
+        thread.start()
+        return thread
+
+    async def run(self) -> None:
+        """Load every API once, then keep refreshing those with a refresh interval."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+
+        async def load(entry: PreloadEntry) -> None:
+            async with semaphore:
+                await self._load(entry)
+
+        await asyncio.gather(*(load(entry) for entry in self.manifest.apis))
+        logger.info(
+            "Preloaded %d APIs in %.1f ms",
+            len(self.manifest.apis), (time.perf_counter() - started) * 1000
+        )
+
+        refreshing = [entry for entry in self.manifest.apis if entry.refresh_seconds > 0]
+        if refreshing:
+            await asyncio.gather(*(self._refresh(entry, semaphore) for entry in refreshing))
+
+    async def _refresh(self, entry: PreloadEntry, semaphore: asyncio.Semaphore) -> None:
+        """Reload one API every refresh_seconds."""
+        while True:
+            await asyncio.sleep(entry.refresh_seconds)
+            async with semaphore:
+                await self._load(entry)
+
+    async def _load(self, entry: PreloadEntry) -> None:
+        """Load one API and record its state and timing."""
+        state = self._states[entry.name]
+        source = entry.source(self.manifest.base_dir)
+        # A failed refresh keeps serving the previously loaded document
+        if state["state"] != "ready":
+            state["state"] = "loading"
+
+        started = time.perf_counter()
+        try:
+            # The manifest is server configuration, so it may name any local file
+            result = await self.api_service.load_openapi(entry.name, source, trusted=True)
+        except Exception as e:
+            result = {"error": True, "message": f"Unexpected error: {str(e)}"}
+        load_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if result.get("error"):
+            logger.warning("Failed to preload API '%s' from %s: %s", entry.name, source, result["message"])
+            state["error"] = result["message"]
+            if state["state"] != "ready":
+                state["state"] = "failed"
+            return
+
+        logger.info("Preloaded API '%s' from %s in %.1f ms", entry.name, source, load_ms)
+        state.update({"state": "ready", "load_ms": load_ms, "error": None})
+
+    def status(self, storage: Optional[OpenAPIStorage] = None) -> Dict[str, Any]:
+        """
+        Report the readiness of the manifest's APIs.
+
+        The overall status is "ready" once every required API is indexed,
+        "failed" if a required API could not be loaded, and "loading" otherwise.
+
+        Args:
+            storage: Storage to check for APIs indexed elsewhere, e.g. by the
+                     coordinator of a multi-worker deployment (optional)
+
+        Returns:
+            Overall status and per-API state, load time and error
+        """
+        apis = {}
+        overall = "ready"
+        for entry in self.manifest.apis:
+            api = dict(self._states[entry.name])
+            if api["state"] != "ready" and storage is not None and storage.exists(entry.name):
+                api["state"] = "ready"
+            api["required"] = entry.required
+            apis[entry.name] = api
+
+            if entry.required and api["state"] != "ready":
+                if api["state"] == "failed":
+                    overall = "failed"
+                elif overall == "ready":
+                    overall = "loading"
+
+        return {"status": overall, "apis": apis}
@@ -0,0 +1,276 @@
+"""
+Adaptive pre-warming of frequently requested resolved operations
+"""
+
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Any, Optional, Tuple
+from src.config import PREWARM_BUDGET_BYTES, PREWARM_REPLAN_MISSES, PREWARM_MAX_TRACKED
+from src.storage import OpenAPIStorage
+from src.utils.ref_resolver import RefResolver
+from src.utils.json_fragments import Fragment
+
+
+logger = logging.getLogger(__name__)
+
+
+class OperationPrewarmer:
+    """
+    Serves the hottest get_operation_by_id lookups from pre-resolved results.
+
+    Every lookup is counted per (API, operationId). A background thread
+    resolves the most requested operations, hottest first, until their
+    serialized size fills the memory budget. It runs after every load or
+    reload, when a lookup finds its API's cached generation outdated, and
+    after every `replan_misses` cache misses, so the warm set follows the
+    traffic. Cached results are tied to a document generation and are
+    never served for another one.
+
+    At most `max_tracked` operations are counted: past that, every count
+    is halved and operations left at zero are forgotten. A removed API's
+    counts and cached results are dropped with it.
+    """
+
+    def __init__(
+        self,
+        storage: OpenAPIStorage,
+        budget_bytes: int = PREWARM_BUDGET_BYTES,
+        replan_misses: int = PREWARM_REPLAN_MISSES,
+        max_tracked: int = PREWARM_MAX_TRACKED
+    ):
+        """
+        Initialize OperationPrewarmer.
+
+        Args:
+            storage: OpenAPIStorage to read documents from
+            budget_bytes: Memory budget for pre-resolved operations (0 disables pre-warming)
+            replan_misses: Cache misses before the warm set is recomputed (0: only after loads)
+            max_tracked: Operations whose lookups are counted before counts decay
+        """
+        self.storage = storage
+        self.budget_bytes = budget_bytes
+        self.replan_misses = replan_misses
+        self.max_tracked = max_tracked
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Counter] = {}
+        self._tracked = 0
+        # API name -> (generation, {operationId: (resolved operation, size in bytes)})
+        self._cache: Dict[str, Tuple[int, Dict[str, Tuple[Dict[str, Any], int]]]] = {}
+        self._used_bytes = 0
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._misses_since_plan = 0
+        self._plans = 0
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def lookup(self, name: str, generation: int, operation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Count a lookup and return the pre-resolved operation if it is warm.
+
+        The returned operation is shared between callers and must not be modified.
+
+        Args:
+            name: API name
+            generation: Generation of the document being queried
+            operation_id: operationId (must exist in that generation)
+
+        Returns:
+            Resolved operation, or None if it has to be resolved by the caller
+        """
+        if self.budget_bytes <= 0:
+            return None
+
+        with self._lock:
+            counts = self._counts.setdefault(name, Counter())
+            if operation_id not in counts:
+                if self._tracked >= self.max_tracked:
+                    self._decay()
+                    counts = self._counts.setdefault(name, Counter())
+                self._tracked += 1
+            counts[operation_id] += 1
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == generation and operation_id in cached[1]:
+                self._hits[name] += 1
+                return cached[1][operation_id][0]
+
+            self._misses[name] += 1
+            self._misses_since_plan += 1
+            replan = (
+                (cached is not None and cached[0] != generation) or
+                (self.replan_misses > 0 and self._misses_since_plan >= self.replan_misses)
+            )
+
+        if replan:
+            self.schedule()
+        return None
+
+    def remove(self, name: str) -> None:
+        """
+        Forget an API's lookup counts, statistics and pre-resolved operations.
+
+        Args:
+            name: API name
+        """
+        with self._lock:
+            counts = self._counts.pop(name, None)
+            if counts is not None:
+                self._tracked -= len(counts)
+            cached = self._cache.pop(name, None)
+            if cached is not None:
+                self._used_bytes -= sum(size for _, size in cached[1].values())
+            self._hits.pop(name, None)
+            self._misses.pop(name, None)
+
+    def _decay(self) -> None:
+        """
+        Halve every lookup count until at most half of max_tracked operations remain.
+        Must be called with the lock held.
+        """
+        while self._tracked > self.max_tracked // 2:
+            for name in list(self._counts):
+                decayed = Counter({op: count // 2 for op, count in self._counts[name].items() if count > 1})
+                if decayed:
+                    self._counts[name] = decayed
+                else:
+                    del self._counts[name]
+            self._tracked = sum(len(counts) for counts in self._counts.values())
+
+    def schedule(self) -> None:
+        """Ask the background thread to recompute the warm set."""
+        if self.budget_bytes <= 0:
+            return
+
+        with self._lock:
+            # Reset here so the misses that triggered this plan do not trigger another
+            self._misses_since_plan = 0
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="prewarmer", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        """Background loop: recompute the warm set whenever scheduled."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                self.warm()
+            except Exception:
+                logger.exception("Pre-warming resolved operations failed")
+
+    def warm(self) -> None:
+        """
+        Recompute the warm set from the current access counts.
+
+        Operations are taken hottest first until the next one no longer
+        fits in the budget. Results still valid for the current document
+        generation are reused; the others are resolved again.
+        """
+        with self._lock:
+            ranked = sorted(
+                ((count, name, operation_id)
+                 for name, counts in self._counts.items()
+                 for operation_id, count in counts.items()),
+                key=lambda item: (-item[0], item[1], item[2])
+            )
+            previous = dict(self._cache)
+
+        start = time.perf_counter()
+        snapshots = {}
+        cache: Dict[str, Tuple[int, Dict[str, Tuple[Dict[str, Any], int]]]] = {}
+        used_bytes = 0
+        resolved_count = 0
+
+        for _, name, operation_id in ranked:
+            if name not in snapshots:
+                snapshots[name] = self.storage.snapshot(name)
+            snapshot = snapshots[name]
+            if snapshot is None:
+                continue
+
+            entry = None
+            cached = previous.get(name)
+            if cached is not None and cached[0] == snapshot.generation:
+                entry = cached[1].get(operation_id)
+            if entry is None:
+                entry = self._resolve(snapshot.document, operation_id)
+                if entry is None:
+                    # The operation no longer exists in this generation
+                    continue
+                resolved_count += 1
+                # Let query threads run between resolutions
+                time.sleep(0)
+
+            if used_bytes + entry[1] > self.budget_bytes:
+                break
+            used_bytes += entry[1]
+            cache.setdefault(name, (snapshot.generation, {}))[1][operation_id] = entry
+
+        with self._lock:
+            self._cache = cache
+            self._used_bytes = used_bytes
+            self._plans += 1
+
+        logger.info(
+            "Pre-warmed %d operations (%d newly resolved, %d bytes) in %.1f ms",
+            sum(len(entries) for _, entries in cache.values()), resolved_count, used_bytes,
+            (time.perf_counter() - start) * 1000
+        )
+
+    @staticmethod
+    def _resolve(doc_data: Dict[str, Any], operation_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Resolve one operation the way get_operation_by_id does.
+
+        Returns:
+            Tuple of (resolved operation with its serialized JSON, serialized size),
+            or None if the operationId is unknown
+        """
+        index_entry = doc_data.get('operation_index', {}).get(operation_id)
+        if index_entry is None:
+            return None
+
+        operation = doc_data.get('paths', {})[index_entry['path']][index_entry['method']]
+        resolver = RefResolver(doc_data.get('raw', {}), doc_data.get('pointer_table'))
+        resolved = Fragment(resolver.resolve_operation(operation))
+        return resolved, len(resolved.json)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pre-warm coverage and hit rates.
+
+        Coverage is the share of counted lookups that went to operations
+        currently warm, i.e. the hit rate the warm set would have had over
+        the traffic seen so far.
+
+        Returns:
+            Budget usage and, per API, warm operations, coverage, hits and misses
+        """
+        with self._lock:
+            apis = {}
+            for name in sorted(set(self._counts) | set(self._cache)):
+                counts = self._counts.get(name, Counter())
+                generation, entries = self._cache.get(name, (None, {}))
+                lookups = sum(counts.values())
+                hits, misses = self._hits[name], self._misses[name]
+                apis[name] = {
+                    "generation": generation,
+                    "warm_operations": len(entries),
+                    "tracked_operations": len(counts),
+                    "coverage": round(sum(counts[op] for op in entries) / lookups, 3) if lookups else 0.0,
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0
+                }
+
+            return {
+                "enabled": self.budget_bytes > 0,
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": self._used_bytes,
+                "warm_operations": sum(len(entries) for _, entries in self._cache.values()),
+                "plans": self._plans,
+                "apis": apis
+            }
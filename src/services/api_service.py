@@ -2,14 +2,44 @@
 API management service
 """
 
+import os
 import json
-import yaml
-import httpx
-from typing import Dict, Any
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple
 from src.storage import OpenAPIStorage
-from src.loaders.openapi_loader import OpenAPILoader
+from src.loaders.openapi_loader import OpenAPILoader, ProgressCallback
+from src.loaders.streaming_parser import DocumentTooLargeError
+from src.loaders.fetch_cache import FetchCache
+from src.loaders.ref_bundler import ExternalRefBundler, ExternalRefError
+from src.loaders.swagger_normalizer import SwaggerNormalizer
 from src.indexers.operation_indexer import OperationIndexer
+from src.indexers.pointer_indexer import PointerIndexer
+from src.indexers.stats_indexer import StatsIndexer
+from src.indexers.security_indexer import SecurityIndexer
+from src.indexers.path_tree_indexer import PathTreeIndexer
+from src.indexers.ngram_indexer import NgramIndexer
+from src.indexers.semantic_indexer import SemanticIndex
+from src.prewarmer import OperationPrewarmer
 from src.models.openapi_document import OpenAPIDocument
+from src.utils.hash_consing import HashConsTable
+from src.config import (
+    API_SORT_KEYS,
+    ERROR_UNKNOWN_SORT_KEY,
+    ERROR_LOCAL_FILE_REFUSED,
+    FILE_PARSE_WORKERS,
+    LOCAL_ROOTS
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class ApiService:
@@ -17,102 +47,631 @@ class ApiService:
     Service for loading and managing OpenAPI documents.
     """
 
-    def __init__(self, storage: OpenAPIStorage):
+    def __init__(
+        self,
+        storage: OpenAPIStorage,
+        semantic_index: Optional[SemanticIndex] = None,
+        prewarmer: Optional[OperationPrewarmer] = None,
+        local_roots: Optional[List[str]] = None
+    ):
         """
         Initialize ApiService.
 
         Args:
             storage: OpenAPIStorage instance
+            semantic_index: Operation vectors to update on every load (optional)
+            prewarmer: Hot operation cache to re-warm after every load (optional)
+            local_roots: Directories untrusted loads may read local files from (default: LOCAL_ROOTS)
         """
         self.storage = storage
+        self.semantic_index = semantic_index
+        self.prewarmer = prewarmer
         self.loader = OpenAPILoader()
         self.indexer = OperationIndexer()
+        self.pointer_indexer = PointerIndexer()
+        self.stats_indexer = StatsIndexer()
+        self.security_indexer = SecurityIndexer()
+        self.path_tree_indexer = PathTreeIndexer()
+        self.ngram_indexer = NgramIndexer()
+        # Files referenced by several documents are fetched once across loads
+        self.ref_cache = FetchCache(self.loader.load_from_url)
+        self.ref_bundler = ExternalRefBundler(self.ref_cache)
+        # Watched local sources: name -> {path, directory, files: {path: (API name, (mtime, size), hash)}}
+        self._file_sources: Dict[str, Dict[str, Any]] = {}
+        self._sources_lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.local_roots = [os.path.realpath(root) for root in (LOCAL_ROOTS if local_roots is None else local_roots)]
 
-    async def load_openapi(self, name: str, url: str) -> Dict[str, Any]:
+    async def load_openapi(
+        self,
+        name: str,
+        url: str,
+        on_progress: Optional[ProgressCallback] = None,
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """
         Load an OpenAPI document from URL and save to storage.
 
+        A file:// URL of a directory loads every document file under it, see
+        load_directory(). Local files stay watched for changes. Unless the
+        load is trusted, local files, including those reached through
+        $refs, must be under one of the local roots.
+
         Args:
             name: API name for later queries
             url: URL of the OpenAPI document
+            on_progress: Awaited with (bytes downloaded, total bytes or None) as the document downloads (optional)
+            trusted: Whether local files outside the local roots may be read, as for the preload manifest
 
         Returns:
             Loading status and document basic info
         """
+        path = self.loader.local_path(url)
+        if path is not None and not trusted and not self.is_local_allowed(path):
+            return {
+                "error": True,
+                "message": ERROR_LOCAL_FILE_REFUSED.format(path=path, roots=', '.join(self.local_roots) or 'none set')
+            }
+        if path is not None and os.path.isdir(path):
+            return await self.load_directory(name, path, trusted)
+
         try:
-            # Load document from URL
-            doc = await self.loader.load_from_url(url)
-
-            # Validate document structure
-            is_valid, error_message = self.loader.validate_document(doc)
-            if not is_valid:
-                return {
-                    "error": True,
-                    "message": error_message
+            # Load document from URL, indexing operations as path items arrive
+            operation_index = {}
+            body_hash = hashlib.sha256()
+            raw_bytes = 0
+
+            def on_bytes(chunk: bytes) -> None:
+                nonlocal raw_bytes
+                raw_bytes += len(chunk)
+                body_hash.update(chunk)
+
+            # Parse time includes the download, which the streaming parser overlaps with
+            start = time.perf_counter()
+            doc = await self.loader.load_from_url(
+                url,
+                on_path_item=lambda path, path_item: self.indexer.index_path_item(operation_index, path, path_item),
+                on_bytes=on_bytes,
+                on_progress=on_progress
+            )
+            parse_ms = (time.perf_counter() - start) * 1000
+
+            result = await self._index_and_store(
+                name, url, doc, operation_index, raw_bytes, body_hash.hexdigest(), parse_ms, trusted
+            )
+        except Exception as e:
+            return self._load_error(e)
+
+        with self._sources_lock:
+            if path is None:
+                self._file_sources.pop(name, None)
+            elif not result.get("error"):
+                self._file_sources[name] = {
+                    "path": path,
+                    "directory": False,
+                    "trusted": trusted,
+                    "files": {path: (name, self._fingerprint(path), body_hash.hexdigest())}
                 }
+        return result
 
-            # Build indexes
-            operation_index = self.indexer.build_operation_index(doc.get('paths', {}))
-            tags = self.indexer.extract_tags(doc)
+    async def load_directory(self, name: str, directory: str, trusted: bool = False) -> Dict[str, Any]:
+        """
+        Load every document file under a directory.
 
-            # Create document model
-            openapi_doc = OpenAPIDocument.from_raw_document(doc, operation_index, tags)
+        Each file becomes an API named "<name>/<relative path without
+        extension>". Files that are not complete OpenAPI documents, such
+        as shared component files referenced by the others, are skipped.
+        Files are parsed in parallel worker processes, and the directory
+        stays watched: added, changed and deleted files are picked up by
+        refresh_files().
 
-            # Save to storage
-            self.storage.add(name, openapi_doc.to_dict())
+        Args:
+            name: Name prefix of the loaded APIs
+            directory: Directory path
+            trusted: Whether files outside the local roots may be read (default: False)
 
-            # Return success info
-            return {
-                "status": "success",
-                "message": f"API '{name}' loaded successfully",
-                "info": {
-                    "title": doc['info'].get('title', 'N/A'),
-                    "version": doc['info'].get('version', 'N/A'),
-                    "description": doc['info'].get('description', '')
-                },
-                "servers": [s.get('url') if isinstance(s, dict) else str(s) for s in doc.get('servers', [])],
-                "paths_count": len(doc.get('paths', {})),
-                "tags_count": len(tags)
-            }
+        Returns:
+            Loading status, per-API results and skipped files
+        """
+        directory = os.path.abspath(directory)
+        with self._sources_lock:
+            self._file_sources[name] = {"path": directory, "directory": True, "trusted": trusted, "files": {}}
 
-        except httpx.HTTPError as e:
+        result = await self._sync_source(name)
+        if result is None:
             return {
                 "error": True,
-                "message": f"Failed to fetch URL: {str(e)}"
+                "message": f"Directory '{directory}' was replaced by another load of API '{name}'"
             }
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+
+        loaded = [api for api, status in result["apis"].items() if not status.get("error")]
+        if result["apis"] and not loaded:
             return {
                 "error": True,
-                "message": f"Failed to parse document: {str(e)}"
+                "message": f"Failed to load any API from directory '{directory}'",
+                **result
             }
-        except Exception as e:
+        return {
+            "status": "success",
+            "message": f"Loaded {len(loaded)} of {len(result['apis'])} APIs from directory '{directory}'",
+            "directory": directory,
+            **result
+        }
+
+    async def refresh_files(self) -> Dict[str, Any]:
+        """
+        Reload the local files and directories that changed since they were loaded.
+
+        Files are checked by modification time and size, and only those
+        whose content hash also changed are parsed again. APIs of files
+        deleted from a watched directory are removed.
+
+        Returns:
+            Per-source results for the sources where anything changed
+        """
+        with self._sources_lock:
+            names = list(self._file_sources)
+
+        changes = {}
+        for name in names:
+            result = await self._sync_source(name)
+            if result is not None and any(result.values()):
+                changes[name] = result
+        return {"sources": len(names), "changed": changes}
+
+    def is_local_allowed(self, path: str) -> bool:
+        """
+        Check whether an untrusted load may read a local path.
+
+        Symlinks are resolved first, so a link under a local root cannot
+        point outside it.
+
+        Args:
+            path: File or directory path
+
+        Returns:
+            True if the path is one of the local roots or under one
+        """
+        real = os.path.realpath(path)
+        return any(os.path.commonpath([real, root]) == root for root in self.local_roots)
+
+    def _fingerprint(self, path: str) -> Optional[Tuple[int, int]]:
+        """Get the (modification time, size) of a file, or None if it is gone."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    async def _sync_source(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Bring the APIs of one watched file or directory up to date.
+
+        Args:
+            name: Name the source was loaded under
+
+        Returns:
+            Results of the reloaded files, skipped files and removed APIs,
+            or None if the source is not watched
+        """
+        with self._sources_lock:
+            source = self._file_sources.get(name)
+            if source is None:
+                return None
+            known = dict(source["files"])
+
+        if source["directory"]:
+            try:
+                current = self.loader.list_spec_files(source["path"])
+            except OSError:
+                current = []
+        else:
+            current = [source["path"]] if os.path.isfile(source["path"]) else []
+        if not source["trusted"]:
+            current = [path for path in current if self.is_local_allowed(path)]
+
+        # Cheap check first: only files with a new mtime or size are hashed
+        files = {}
+        changed = []
+        for path in current:
+            fingerprint = self._fingerprint(path)
+            entry = known.get(path)
+            if entry is not None and entry[1] == fingerprint:
+                files[path] = entry
+                continue
+            api_name = self._api_name(name, source, path)
+            try:
+                digest = await asyncio.to_thread(self.loader.file_digest, path)
+            except OSError:
+                continue
+            if entry is not None and entry[2] == digest:
+                files[path] = (entry[0], fingerprint, digest)
+                continue
+            files[path] = (api_name, fingerprint, digest)
+            changed.append(path)
+
+        removed = []
+        for path, (api_name, _, _) in known.items():
+            if path in files:
+                continue
+            if not source["directory"]:
+                # A deleted single file keeps serving its last loaded version
+                files[path] = known[path]
+            elif api_name is not None and self._remove_api(api_name):
+                removed.append(api_name)
+
+        # Documents cached as $ref targets of other files must be read again
+        for path in changed + [path for path in known if path not in files]:
+            self.ref_cache.invalidate(Path(path).as_uri())
+
+        apis = {}
+        skipped = []
+
+        async def load(paths: List[str]) -> None:
+            parsed, parse_ms = await self._parse_files(paths)
+            for path, outcome in zip(paths, parsed):
+                api_name, fingerprint, digest = files[path]
+                if isinstance(outcome, BaseException):
+                    result = self._load_error(outcome)
+                else:
+                    doc, raw_bytes, digest = outcome
+                    is_valid, error_message = self.loader.validate_document(doc)
+                    if source["directory"] and not is_valid:
+                        # Not an OpenAPI document, e.g. shared components: remember its hash only
+                        files[path] = (None, fingerprint, digest)
+                        if path in known and known[path][0] is not None and self._remove_api(api_name):
+                            removed.append(api_name)
+                        skipped.append({"file": path, "message": error_message})
+                        continue
+                    try:
+                        # Files of one batch are parsed together, so each reports the batch's parse time
+                        result = await self._index_and_store(
+                            api_name, Path(path).as_uri(), doc, None, raw_bytes, digest, parse_ms,
+                            source["trusted"]
+                        )
+                    except Exception as e:
+                        result = self._load_error(e)
+
+                # A failed file is retried once it changes again
+                apis[api_name] = result
+                if result.get("error"):
+                    logger.warning("Failed to load file %s as API '%s': %s", path, api_name, result["message"])
+                else:
+                    logger.info("Loaded file %s as API '%s'", path, api_name)
+
+        await load(changed)
+
+        # A changed or deleted non-API file may be referenced by the directory's
+        # documents, so those are bundled again as well
+        if known and (skipped or any(entry[0] is None for path, entry in known.items() if path not in files)):
+            await load([
+                path for path, entry in files.items()
+                if entry[0] is not None and entry[0] not in apis
+            ])
+
+        with self._sources_lock:
+            if self._file_sources.get(name) is source:
+                source["files"] = files
+
+        return {"apis": apis, "skipped": skipped, "removed": removed}
+
+    def _remove_api(self, name: str) -> bool:
+        """Remove an API from storage and drop what the semantic index and prewarmer hold for it."""
+        if not self.storage.remove(name):
+            return False
+        if self.semantic_index is not None:
+            self.semantic_index.remove(name)
+        if self.prewarmer is not None:
+            self.prewarmer.remove(name)
+        return True
+
+    @staticmethod
+    def _api_name(name: str, source: Dict[str, Any], path: str) -> str:
+        """Name of the API loaded from a file of a watched source."""
+        if not source["directory"]:
+            return name
+        relative = Path(path).relative_to(source["path"]).with_suffix('')
+        return f"{name}/{relative.as_posix()}"
+
+    async def _parse_files(self, paths: List[str]) -> Tuple[List[Any], float]:
+        """
+        Parse several local files, in parallel worker processes when there is more than one.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Per path, the (document, size, hash) tuple or the exception raised,
+            and the milliseconds spent parsing them all
+        """
+        start = time.perf_counter()
+        parsed = None
+        if len(paths) > 1 and FILE_PARSE_WORKERS > 1:
+            loop = asyncio.get_running_loop()
+            pool = self._parse_pool()
+            try:
+                parsed = await asyncio.gather(
+                    *(loop.run_in_executor(pool, OpenAPILoader.parse_file, path) for path in paths),
+                    return_exceptions=True
+                )
+            except BrokenProcessPool:
+                pass
+            if parsed is None or any(isinstance(outcome, BrokenProcessPool) for outcome in parsed):
+                # A worker died: start a new pool next time and parse this batch here
+                logger.warning("File parser process pool broke, parsing in threads")
+                with self._sources_lock:
+                    if self._pool is pool:
+                        self._pool = None
+                parsed = None
+        if parsed is None:
+            parsed = await asyncio.gather(
+                *(asyncio.to_thread(OpenAPILoader.parse_file, path) for path in paths),
+                return_exceptions=True
+            )
+        return parsed, (time.perf_counter() - start) * 1000
+
+    def _parse_pool(self) -> ProcessPoolExecutor:
+        """Get the parser process pool, starting it on first use."""
+        with self._sources_lock:
+            if self._pool is None:
+                # Spawned rather than forked: the server process runs several threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=FILE_PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
+
+    async def _index_and_store(
+        self,
+        name: str,
+        url: str,
+        doc: Any,
+        operation_index: Optional[Dict[str, Any]],
+        raw_bytes: int,
+        content_hash: str,
+        parse_ms: float,
+        trusted: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate a parsed document, build its indexes and save it to storage.
+
+        Args:
+            name: API name
+            url: URL the document was loaded from (base of its relative $refs)
+            doc: Parsed document
+            operation_index: Operations indexed while parsing, or None to index them here
+            raw_bytes: Size of the document body
+            content_hash: SHA-256 hex digest of the document body
+            parse_ms: Time spent fetching and parsing
+            trusted: Whether $refs may read local files outside the local roots (default: False)
+
+        Returns:
+            Loading status and document basic info
+        """
+        # Validate document structure
+        is_valid, error_message = self.loader.validate_document(doc)
+        if not is_valid:
             return {
                 "error": True,
-                "message": f"Unexpected error: {str(e)}"
+                "message": error_message
             }
 
-    def list_apis(self) -> Dict[str, Any]:
+        # Bundle external and multi-file $refs into the document
+        external_refs = await self.ref_bundler.bundle(doc, url, None if trusted else self.is_local_allowed)
+
+        # The rest is CPU and storage work: run it off the event loop, so
+        # other sessions' tool calls are served while a large document loads
+        result = await asyncio.to_thread(
+            self._build_and_store, name, doc, operation_index, raw_bytes, content_hash, parse_ms, external_refs
+        )
+
+        # Re-resolve the hottest operations in the background
+        if self.prewarmer is not None:
+            self.prewarmer.schedule()
+        return result
+
+    def _build_and_store(
+        self,
+        name: str,
+        doc: Dict[str, Any],
+        operation_index: Optional[Dict[str, Any]],
+        raw_bytes: int,
+        content_hash: str,
+        parse_ms: float,
+        external_refs: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """
-        List all loaded APIs with basic information.
+        Normalize a validated, bundled document, build its indexes and save it to storage.
+
+        Runs in a worker thread.
+
+        Args:
+            name: API name
+            doc: Validated document with external refs bundled
+            operation_index: Operations indexed while parsing, or None to index them here
+            raw_bytes: Size of the document body
+            content_hash: SHA-256 hex digest of the document body
+            parse_ms: Time spent fetching and parsing
+            external_refs: Bundling report, or None if the document has no external refs
 
         Returns:
-            List of all loaded APIs
+            Loading status and document basic info
         """
+        if operation_index is None or (external_refs is not None and external_refs['bundled_refs']):
+            # Path item refs were inlined, so index the final paths
+            operation_index = self.indexer.build_operation_index(doc.get('paths', {}))
+
+        start = time.perf_counter()
+
+        # Queries only handle the OpenAPI 3.x shape, so Swagger 2.0 is converted
+        # once here; the document as loaded is kept alongside
+        original = None
+        if SwaggerNormalizer.is_swagger(doc):
+            original = doc
+            doc = SwaggerNormalizer(original).normalize()
+
+        # Share one object between structurally identical subtrees
+        hash_cons = HashConsTable()
+        hash_cons.intern(doc)
+        if original is not None:
+            hash_cons.intern(original)
+
+        # Build remaining indexes
+        tags = self.indexer.extract_tags(doc)
+        pointer_table = self.pointer_indexer.build_pointer_table(doc)
+        security_index = self.security_indexer.build_security_index(doc)
+        path_tree = self.path_tree_indexer.build_path_tree(doc.get('paths', {}))
+        ngram_index = self.ngram_indexer.build_ngram_index(path_tree['operations'])
+        stats = self.stats_indexer.build_api_stats(doc)
+        stats.update({
+            "raw_bytes": raw_bytes,
+            "content_hash": content_hash,
+            "parse_ms": round(parse_ms, 3),
+            "index_ms": round((time.perf_counter() - start) * 1000, 3)
+        })
+
+        # Create document model
+        openapi_doc = OpenAPIDocument.from_raw_document(
+            doc, operation_index, tags, pointer_table, hash_cons.stats(), stats,
+            security_index, path_tree, ngram_index, original
+        )
+
+        # Save to storage
+        generation = self.storage.add(name, openapi_doc.to_dict())
+
+        # Embed operations for semantic search
+        if self.semantic_index is not None:
+            self.semantic_index.add(name, doc.get('paths', {}), stats['content_hash'])
+
+        # Return success info
+        result = {
+            "status": "success",
+            "message": f"API '{name}' loaded successfully",
+            "generation": generation,
+            "info": {
+                "title": doc['info'].get('title', 'N/A'),
+                "version": doc['info'].get('version', 'N/A'),
+                "description": doc['info'].get('description', '')
+            },
+            "servers": [s.get('url') if isinstance(s, dict) else str(s) for s in doc.get('servers', [])],
+            "paths_count": len(doc.get('paths', {})),
+            "tags_count": len(tags),
+            "operations_count": stats['operations_count'],
+            "schema_count": stats['schema_count'],
+            "dedup": hash_cons.stats()
+        }
+        if external_refs is not None:
+            result["external_refs"] = external_refs
+        if original is not None:
+            result["normalized_from"] = f"swagger {original['swagger']}"
+        return result
+
+    @staticmethod
+    def _load_error(e: BaseException) -> Dict[str, Any]:
+        """Describe a failed load."""
+        # Imported on first load rather than at server start-up
+        import httpx
+        import yaml
+
+        if isinstance(e, httpx.HTTPError):
+            message = f"Failed to fetch URL: {str(e)}"
+        elif isinstance(e, OSError):
+            message = f"Failed to read file: {str(e)}"
+        elif isinstance(e, (DocumentTooLargeError, ExternalRefError)):
+            message = f"Failed to load document: {str(e)}"
+        elif isinstance(e, yaml.MarkedYAMLError):
+            # The full message quotes the offending lines, which may come from any local file
+            mark = e.problem_mark or e.context_mark
+            position = f" at line {mark.line + 1}, column {mark.column + 1}" if mark is not None else ""
+            message = f"Failed to parse document: {e.problem or e.context or 'invalid YAML'}{position}"
+        elif isinstance(e, (json.JSONDecodeError, yaml.YAMLError)):
+            message = f"Failed to parse document: {str(e)}"
+        else:
+            message = f"Unexpected error: {str(e)}"
+        return {
+            "error": True,
+            "message": message
+        }
+
+    def list_apis(
+        self,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        keyword: Optional[str] = None,
+        tag: Optional[str] = None,
+        method: Optional[str] = None,
+        min_operations: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        List all loaded APIs with basic information and load-time statistics.
+
+        Reads only the summaries kept in memory for every API, so no
+        document is loaded or scanned.
+
+        Args:
+            sort_by: Field to sort by (name, title, operations_count, raw_bytes, ...)
+            descending: Sort from largest to smallest
+            keyword: Keep APIs whose name, title or description contains this (optional)
+            tag: Keep APIs with operations under this tag (optional)
+            method: Keep APIs with operations using this HTTP method (optional)
+            min_operations: Keep APIs with at least this many operations (optional)
+
+        Returns:
+            List of matching APIs
+        """
+        if sort_by is not None and sort_by not in API_SORT_KEYS:
+            return {
+                "error": True,
+                "message": ERROR_UNKNOWN_SORT_KEY.format(key=sort_by, available=', '.join(API_SORT_KEYS))
+            }
+
+        keyword_lower = keyword.lower() if keyword else None
+        method_lower = method.lower() if method else None
         apis = []
 
-        for name, data in self.storage.list_all().items():
-            info = data.get('info', {})
-            apis.append({
+        for name, summary in self.storage.list_summaries().items():
+            info = summary['info']
+            stats = summary.get('stats', {})
+            api = {
                 "name": name,
                 "title": info.get('title', 'N/A'),
                 "version": info.get('version', 'N/A'),
                 "description": info.get('description', ''),
-                "servers": [s.get('url') if isinstance(s, dict) else str(s) for s in data.get('servers', [])],
-                "paths_count": len(data.get('paths', {})),
-                "tags_count": len(data.get('tags', []))
-            })
+                "servers": summary['servers'],
+                "paths_count": summary['paths_count'],
+                "tags_count": summary['tags_count'],
+                "stats": stats
+            }
+
+            if keyword_lower and not any(
+                keyword_lower in str(api[field]).lower() for field in ('name', 'title', 'description')
+            ):
+                continue
+            if tag and not stats.get('operations_by_tag', {}).get(tag):
+                continue
+            if method_lower and not stats.get('operations_by_method', {}).get(method_lower):
+                continue
+            if min_operations is not None and stats.get('operations_count', 0) < min_operations:
+                continue
+
+            apis.append(api)
+
+        if sort_by is not None:
+            def sort_key(api: Dict[str, Any]) -> Any:
+                value = api[sort_by] if sort_by in api else api['stats'].get(sort_by, 0)
+                return str(value).lower() if sort_by in ('name', 'title') else value
+
+            apis.sort(key=sort_key, reverse=descending)
 
         return {
             "count": len(apis),
             "apis": apis
         }
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Get memory budget usage and per-API residency statistics.
+
+        Returns:
+            Budget totals plus residency, hit counts and rehydration latency per API
+        """
+        return self.storage.get_residency_stats()
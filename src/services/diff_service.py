@@ -0,0 +1,471 @@
+"""
+API version diff service
+"""
+
+from collections import deque
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, List, Optional, Set, Tuple
+from src.storage import OpenAPIStorage
+from src.config import HTTP_METHODS
+from src.indexers.merkle_indexer import MerkleIndexer
+from src.utils.ref_resolver import RefResolver
+from src.utils.compiled_tree import materialize
+from src.execution import check_deadline
+
+# Deepest schema nesting compared; deeper differences are reported at this level
+MAX_SCHEMA_DEPTH = 32
+
+# Refs that point at schema components (field-level diffs are reported for these)
+SCHEMA_POINTER_PREFIX = '#/components/schemas/'
+
+REQUEST = 'request'
+RESPONSE = 'response'
+
+
+def _change(change: str, location: str, breaking: bool, before: Any = None, after: Any = None) -> Dict[str, Any]:
+    """Build one change entry."""
+    entry = {"change": change, "location": location, "breaking": breaking}
+    if before is not None:
+        entry["from"] = materialize(before)
+    if after is not None:
+        entry["to"] = materialize(after)
+    return entry
+
+
+class _Side:
+    """One document version: raw tree, ref resolver and Merkle index."""
+
+    def __init__(self, doc_data: Dict[str, Any]):
+        self.raw = doc_data.get('raw', {})
+        self.resolver = RefResolver(self.raw, doc_data.get('pointer_table'))
+        self.merkle = doc_data.get('merkle') or MerkleIndexer.build_merkle_index(self.raw)
+
+    def deref(self, node: Any) -> Tuple[Any, Optional[str]]:
+        """Follow $ref chains; returns the node and the last pointer followed."""
+        pointer = None
+        seen = set()
+        while isinstance(node, Mapping) and isinstance(node.get('$ref'), str) and node['$ref'] not in seen:
+            seen.add(node['$ref'])
+            try:
+                target = self.resolver.lookup(node['$ref'])
+            except (KeyError, ValueError):
+                break
+            pointer = node['$ref']
+            node = target
+        return node, pointer
+
+    def component_hash(self, pointer: Optional[str]) -> Optional[str]:
+        entry = self.merkle['components'].get(pointer) if pointer else None
+        return entry['hash'] if entry else None
+
+
+class DiffService:
+    """
+    Service for comparing two loaded versions of an API.
+    """
+
+    def __init__(self, storage: OpenAPIStorage):
+        """
+        Initialize DiffService.
+
+        Args:
+            storage: OpenAPIStorage instance
+        """
+        self.storage = storage
+
+    def diff_apis(self, base: str, target: str, breaking_only: bool = False) -> Dict[str, Any]:
+        """
+        Compare two loaded APIs and classify breaking changes.
+
+        Operations and components whose Merkle hashes match, and that only
+        reference components that are unchanged (transitively), are skipped
+        without being walked.
+
+        Args:
+            base: Name of the older API version
+            target: Name of the newer API version
+            breaking_only: If True, report only breaking changes
+
+        Returns:
+            Added, removed and changed operations and components, with per-change
+            breaking classification and a summary
+        """
+        base_snapshot, error = self.storage.get_snapshot_or_error(base)
+        if error:
+            return error
+        target_snapshot, error = self.storage.get_snapshot_or_error(target)
+        if error:
+            return error
+
+        old, new = _Side(base_snapshot.document), _Side(target_snapshot.document)
+
+        if old.merkle['root'] == new.merkle['root']:
+            return {
+                "base": base,
+                "target": target,
+                "base_generation": base_snapshot.generation,
+                "target_generation": target_snapshot.generation,
+                "identical": True,
+                "summary": self._summary([], [], [], [], 0, 0)
+            }
+
+        dirty = self._dirty_components(old.merkle, new.merkle)
+
+        added, removed, changed = [], [], []
+        compared = skipped = 0
+        old_ops, new_ops = old.merkle['operations'], new.merkle['operations']
+
+        for path in dict.fromkeys(list(old_ops) + list(new_ops)):
+            old_methods, new_methods = old_ops.get(path, {}), new_ops.get(path, {})
+            old_item, new_item = old.merkle['path_items'].get(path), new.merkle['path_items'].get(path)
+
+            for method in HTTP_METHODS:
+                if method not in old_methods and method not in new_methods:
+                    continue
+                if method not in old_methods:
+                    added.append(self._operation_ref(new, path, method))
+                    continue
+                if method not in new_methods:
+                    removed.append(self._operation_ref(old, path, method))
+                    continue
+
+                # Identical subtrees that only reference unchanged components are skipped
+                refs = set(old_item['refs']) | set(new_item['refs'])
+                unchanged = old_item['hash'] == new_item['hash'] or (
+                    old_methods[method]['hash'] == new_methods[method]['hash']
+                    and materialize(old.raw['paths'][path].get('parameters'))
+                    == materialize(new.raw['paths'][path].get('parameters'))
+                )
+                if unchanged and not refs & dirty:
+                    skipped += 1
+                    continue
+
+                check_deadline()
+                compared += 1
+                changes = self._diff_operation(old, new, path, method, dirty)
+                if breaking_only:
+                    changes = [c for c in changes if c['breaking']]
+                if changes:
+                    entry = self._operation_ref(new, path, method)
+                    entry["breaking"] = any(c['breaking'] for c in changes)
+                    entry["changes"] = changes
+                    changed.append(entry)
+
+        components = self._diff_components(old, new, dirty, breaking_only)
+
+        return {
+            "base": base,
+            "target": target,
+            "base_generation": base_snapshot.generation,
+            "target_generation": target_snapshot.generation,
+            "identical": False,
+            "summary": self._summary(added, removed, changed, components['changed'], compared, skipped),
+            "operations": {
+                "added": [] if breaking_only else added,
+                "removed": removed,
+                "changed": changed
+            },
+            "components": components
+        }
+
+    @staticmethod
+    def _summary(added: List, removed: List, changed: List, components_changed: List,
+                 compared: int, skipped: int) -> Dict[str, Any]:
+        breaking = len(removed) + sum(
+            sum(1 for c in entry['changes'] if c['breaking']) for entry in changed
+        )
+        return {
+            "operations_added": len(added),
+            "operations_removed": len(removed),
+            "operations_changed": len(changed),
+            "components_changed": len(components_changed),
+            "breaking_changes": breaking,
+            "operations_compared": compared,
+            "operations_skipped_by_hash": skipped
+        }
+
+    @staticmethod
+    def _operation_ref(side: _Side, path: str, method: str) -> Dict[str, Any]:
+        operation = side.raw['paths'][path][method]
+        operation_id = operation.get('operationId') if isinstance(operation, Mapping) else None
+        return {"path": path, "method": method, "operation_id": operation_id}
+
+    @staticmethod
+    def _dirty_components(old_merkle: Dict[str, Any], new_merkle: Dict[str, Any]) -> Set[str]:
+        """
+        Components that changed, plus every component that references one of them.
+        """
+        old_components, new_components = old_merkle['components'], new_merkle['components']
+        dirty = {
+            pointer for pointer in set(old_components) | set(new_components)
+            if (old_components.get(pointer) or {}).get('hash') != (new_components.get(pointer) or {}).get('hash')
+        }
+
+        referenced_by: Dict[str, Set[str]] = {}
+        for components in (old_components, new_components):
+            for pointer, entry in components.items():
+                for ref in entry['refs']:
+                    referenced_by.setdefault(ref, set()).add(pointer)
+
+        queue = deque(dirty)
+        while queue:
+            for parent in referenced_by.get(queue.popleft(), ()):
+                if parent not in dirty:
+                    dirty.add(parent)
+                    queue.append(parent)
+        return dirty
+
+    def _diff_components(self, old: _Side, new: _Side, dirty: Set[str], breaking_only: bool) -> Dict[str, Any]:
+        old_components, new_components = old.merkle['components'], new.merkle['components']
+        added = [p for p in new_components if p not in old_components]
+        removed = [p for p in old_components if p not in new_components]
+        changed = []
+
+        for pointer, entry in old_components.items():
+            new_entry = new_components.get(pointer)
+            if new_entry is None or new_entry['hash'] == entry['hash']:
+                continue
+            item = {"pointer": pointer}
+            if pointer.startswith(SCHEMA_POINTER_PREFIX):
+                # A component's role is unknown here, so apply both directions' rules
+                changes = self._diff_schema(
+                    old, new, old.resolver.lookup(pointer), new.resolver.lookup(pointer),
+                    pointer, None, dirty, set(), 0
+                )
+                if breaking_only:
+                    changes = [c for c in changes if c['breaking']]
+                if not changes and breaking_only:
+                    continue
+                item["changes"] = changes
+            elif breaking_only:
+                continue
+            changed.append(item)
+
+        return {
+            "added": [] if breaking_only else added,
+            "removed": [] if breaking_only else removed,
+            "changed": changed
+        }
+
+    def _diff_operation(self, old: _Side, new: _Side, path: str, method: str, dirty: Set[str]) -> List[Dict[str, Any]]:
+        old_item, new_item = old.raw['paths'][path], new.raw['paths'][path]
+        old_op, new_op = old_item[method], new_item[method]
+        changes = []
+
+        if not old_op.get('deprecated') and new_op.get('deprecated'):
+            changes.append(_change("operation_deprecated", "deprecated", False))
+        if old_op.get('operationId') != new_op.get('operationId'):
+            changes.append(_change("operation_id_changed", "operationId", False,
+                                   old_op.get('operationId'), new_op.get('operationId')))
+        if materialize(old_op.get('security')) != materialize(new_op.get('security')):
+            changes.append(_change("security_changed", "security", True,
+                                   old_op.get('security'), new_op.get('security')))
+
+        changes.extend(self._diff_parameters(old, new, old_item, new_item, old_op, new_op, dirty))
+        changes.extend(self._diff_request_body(old, new, old_op, new_op, dirty))
+        changes.extend(self._diff_responses(old, new, old_op, new_op, dirty))
+        return changes
+
+    @staticmethod
+    def _effective_parameters(side: _Side, path_item: Mapping, operation: Mapping) -> Dict[Tuple[str, str], Mapping]:
+        """Path-level parameters overridden by operation-level ones, keyed by (in, name)."""
+        parameters = {}
+        for source in (path_item.get('parameters'), operation.get('parameters')):
+            if not isinstance(source, Sequence):
+                continue
+            for parameter in source:
+                parameter, _ = side.deref(parameter)
+                if isinstance(parameter, Mapping):
+                    parameters[(str(parameter.get('in')), str(parameter.get('name')))] = parameter
+        return parameters
+
+    def _diff_parameters(self, old: _Side, new: _Side, old_item: Mapping, new_item: Mapping,
+                         old_op: Mapping, new_op: Mapping, dirty: Set[str]) -> List[Dict[str, Any]]:
+        old_params = self._effective_parameters(old, old_item, old_op)
+        new_params = self._effective_parameters(new, new_item, new_op)
+        changes = []
+
+        for key, parameter in new_params.items():
+            location = f"parameters.{key[0]}.{key[1]}"
+            if key not in old_params:
+                required = bool(parameter.get('required'))
+                changes.append(_change("required_parameter_added" if required else "optional_parameter_added",
+                                       location, required))
+                continue
+
+            before = old_params[key]
+            if not before.get('required') and parameter.get('required'):
+                changes.append(_change("parameter_became_required", location, True))
+            elif before.get('required') and not parameter.get('required'):
+                changes.append(_change("parameter_became_optional", location, False))
+
+            if 'schema' in before or 'schema' in parameter:
+                changes.extend(self._diff_schema(old, new, before.get('schema'), parameter.get('schema'),
+                                                 location, REQUEST, dirty, set(), 0))
+
+        for key in old_params:
+            if key not in new_params:
+                changes.append(_change("parameter_removed", f"parameters.{key[0]}.{key[1]}", True))
+
+        return changes
+
+    def _diff_request_body(self, old: _Side, new: _Side, old_op: Mapping, new_op: Mapping,
+                           dirty: Set[str]) -> List[Dict[str, Any]]:
+        before, _ = old.deref(old_op.get('requestBody'))
+        after, _ = new.deref(new_op.get('requestBody'))
+        if not isinstance(before, Mapping) and not isinstance(after, Mapping):
+            return []
+        if not isinstance(before, Mapping):
+            required = bool(after.get('required'))
+            return [_change("request_body_added", "requestBody", required)]
+        if not isinstance(after, Mapping):
+            return [_change("request_body_removed", "requestBody", True)]
+
+        changes = []
+        if not before.get('required') and after.get('required'):
+            changes.append(_change("request_body_became_required", "requestBody", True))
+        changes.extend(self._diff_content(old, new, before.get('content'), after.get('content'),
+                                          "requestBody", REQUEST, dirty))
+        return changes
+
+    def _diff_responses(self, old: _Side, new: _Side, old_op: Mapping, new_op: Mapping,
+                        dirty: Set[str]) -> List[Dict[str, Any]]:
+        old_responses = old_op.get('responses') if isinstance(old_op.get('responses'), Mapping) else {}
+        new_responses = new_op.get('responses') if isinstance(new_op.get('responses'), Mapping) else {}
+        changes = []
+
+        for code in new_responses:
+            if code not in old_responses:
+                changes.append(_change("response_added", f"responses.{code}", False))
+
+        for code, response in old_responses.items():
+            location = f"responses.{code}"
+            if code not in new_responses:
+                changes.append(_change("response_removed", location, str(code).startswith('2')))
+                continue
+
+            before, _ = old.deref(response)
+            after, _ = new.deref(new_responses[code])
+            if not isinstance(before, Mapping) or not isinstance(after, Mapping):
+                continue
+            changes.extend(self._diff_content(old, new, before.get('content'), after.get('content'),
+                                              location, RESPONSE, dirty))
+
+        return changes
+
+    def _diff_content(self, old: _Side, new: _Side, before: Any, after: Any, location: str,
+                      direction: str, dirty: Set[str]) -> List[Dict[str, Any]]:
+        before = before if isinstance(before, Mapping) else {}
+        after = after if isinstance(after, Mapping) else {}
+        changes = []
+
+        for media_type in after:
+            if media_type not in before:
+                changes.append(_change("media_type_added", f"{location}.{media_type}", False))
+        for media_type, media in before.items():
+            media_location = f"{location}.{media_type}"
+            if media_type not in after:
+                changes.append(_change("media_type_removed", media_location, True))
+                continue
+            old_schema = media.get('schema') if isinstance(media, Mapping) else None
+            new_schema = after[media_type].get('schema') if isinstance(after[media_type], Mapping) else None
+            changes.extend(self._diff_schema(old, new, old_schema, new_schema, media_location,
+                                             direction, dirty, set(), 0))
+        return changes
+
+    def _diff_schema(self, old: _Side, new: _Side, before: Any, after: Any, location: str,
+                     direction: Optional[str], dirty: Set[str], seen: Set[Tuple], depth: int) -> List[Dict[str, Any]]:
+        """
+        Compare two schemas field by field.
+
+        Args:
+            direction: REQUEST or RESPONSE, which decides what breaks clients;
+                       None applies the rules of both (used for components)
+            seen: (old pointer, new pointer) pairs already being compared (cycle guard)
+        """
+        check_deadline()
+        before, old_pointer = old.deref(before)
+        after, new_pointer = new.deref(after)
+
+        if old_pointer and new_pointer:
+            if old_pointer == new_pointer and old_pointer not in dirty:
+                return []
+            if old.component_hash(old_pointer) == new.component_hash(new_pointer) \
+                    and old_pointer not in dirty and new_pointer not in dirty:
+                return []
+            if (old_pointer, new_pointer) in seen:
+                return []
+            seen = seen | {(old_pointer, new_pointer)}
+
+        if not isinstance(before, Mapping) or not isinstance(after, Mapping):
+            if materialize(before) != materialize(after):
+                return [_change("schema_changed", location, True)]
+            return []
+        if depth >= MAX_SCHEMA_DEPTH:
+            return []
+
+        request = direction in (REQUEST, None)
+        response = direction in (RESPONSE, None)
+        changes = []
+
+        if before.get('type') != after.get('type'):
+            changes.append(_change("type_changed", location, True, before.get('type'), after.get('type')))
+            return changes
+        if before.get('format') != after.get('format'):
+            changes.append(_change("format_changed", location, True, before.get('format'), after.get('format')))
+
+        old_enum, new_enum = before.get('enum'), after.get('enum')
+        if old_enum is None and new_enum is not None:
+            changes.append(_change("enum_added", location, request))
+        elif old_enum is not None and new_enum is None:
+            changes.append(_change("enum_removed", location, response))
+        elif old_enum is not None:
+            old_values = set(map(repr, materialize(old_enum)))
+            new_values = set(map(repr, materialize(new_enum)))
+            # Clients may send values that were removed, or receive values that were added
+            if old_values - new_values:
+                changes.append(_change("enum_values_removed", location, request))
+            if new_values - old_values:
+                changes.append(_change("enum_values_added", location, response))
+
+        old_props = before.get('properties') if isinstance(before.get('properties'), Mapping) else {}
+        new_props = after.get('properties') if isinstance(after.get('properties'), Mapping) else {}
+        old_required = set(materialize(before.get('required')) or [])
+        new_required = set(materialize(after.get('required')) or [])
+
+        for prop in new_props:
+            if prop not in old_props:
+                required = prop in new_required
+                changes.append(_change(
+                    "required_property_added" if required else "optional_property_added",
+                    f"{location}.{prop}", required and request
+                ))
+        for prop, prop_schema in old_props.items():
+            prop_location = f"{location}.{prop}"
+            if prop not in new_props:
+                changes.append(_change("property_removed", prop_location, response))
+                continue
+            if prop not in old_required and prop in new_required:
+                changes.append(_change("property_became_required", prop_location, request))
+            elif prop in old_required and prop not in new_required:
+                changes.append(_change("property_became_optional", prop_location, response))
+            changes.extend(self._diff_schema(old, new, prop_schema, new_props[prop], prop_location,
+                                             direction, dirty, seen, depth + 1))
+
+        if 'items' in before or 'items' in after:
+            changes.extend(self._diff_schema(old, new, before.get('items'), after.get('items'),
+                                             f"{location}[]", direction, dirty, seen, depth + 1))
+
+        for keyword in ('allOf', 'oneOf', 'anyOf'):
+            old_parts, new_parts = before.get(keyword), after.get(keyword)
+            if old_parts is None and new_parts is None:
+                continue
+            if not isinstance(old_parts, Sequence) or not isinstance(new_parts, Sequence) \
+                    or len(old_parts) != len(new_parts):
+                changes.append(_change("composition_changed", f"{location}.{keyword}", True))
+                continue
+            for index, (old_part, new_part) in enumerate(zip(old_parts, new_parts)):
+                changes.extend(self._diff_schema(old, new, old_part, new_part, f"{location}.{keyword}[{index}]",
+                                                 direction, dirty, seen, depth + 1))
+
+        return changes
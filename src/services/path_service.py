@@ -2,10 +2,26 @@
 Path and operation query service
 """
 
-from typing import Dict, Any
+from functools import partial
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Tuple
 from src.storage import OpenAPIStorage
-from src.config import HTTP_METHODS, ERROR_PATH_NOT_FOUND, ERROR_OPERATION_NOT_FOUND
+from src.prewarmer import OperationPrewarmer
+from src.config import (
+    HTTP_METHODS,
+    PROJECTION_LEVELS,
+    ERROR_PATH_NOT_FOUND,
+    ERROR_OPERATION_NOT_FOUND,
+    ERROR_PATH_PREFIX_NOT_FOUND,
+    ERROR_UNKNOWN_PROJECTION_LEVEL
+)
+from src.indexers.path_tree_indexer import PathTreeIndexer, split_path
 from src.utils.ref_resolver import RefResolver
+from src.utils.compiled_tree import materialize
+from src.utils.projection import Projection, build_projection, project
+from src.utils.hash_consing import fold_repeats
+from src.utils.json_pointer import join_pointer
+from src.utils.json_fragments import FragmentCache
 
 
 class PathService:
@@ -13,30 +29,74 @@ class PathService:
     Service for querying paths and operations.
     """
 
-    def __init__(self, storage: OpenAPIStorage):
+    def __init__(
+        self,
+        storage: OpenAPIStorage,
+        prewarmer: Optional[OperationPrewarmer] = None,
+        fragments: Optional[FragmentCache] = None
+    ):
         """
         Initialize PathService.
 
         Args:
             storage: OpenAPIStorage instance
+            prewarmer: Pre-resolved hot operations shared with ApiService (optional)
+            fragments: Cache of serialized operations (optional)
         """
         self.storage = storage
+        self.prewarmer = prewarmer or OperationPrewarmer(storage, budget_bytes=0)
+        self.fragments = fragments or FragmentCache(max_bytes=0)
 
-    def get_path_details(self, name: str, path: str) -> Dict[str, Any]:
+    @staticmethod
+    def _projection_or_error(
+        level: Optional[str],
+        fields: Optional[List[str]]
+    ) -> Tuple[Optional[Projection], Optional[Dict[str, Any]]]:
+        """
+        Build the requested projection.
+
+        Returns:
+            Tuple of (projection or None for everything, error dict or None)
+        """
+        try:
+            return build_projection(level, fields), None
+        except ValueError:
+            return None, {
+                "error": True,
+                "message": ERROR_UNKNOWN_PROJECTION_LEVEL.format(
+                    level=level,
+                    available=', '.join(PROJECTION_LEVELS)
+                )
+            }
+
+    def get_path_details(
+        self,
+        name: str,
+        path: str,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Get complete documentation for a specific path.
 
         Args:
             name: API name
             path: API path like /users/{id}
+            level: Projection level: 'summary', 'signature' or 'full' (default: full)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"] (optional)
 
         Returns:
             All HTTP methods and details for the path
         """
-        doc_data, error = self.storage.get_or_error(name)
+        projection, error = self._projection_or_error(level, fields)
         if error:
             return error
 
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
         paths = doc_data.get('paths', {})
 
         if path not in paths:
@@ -49,12 +109,21 @@ class PathService:
         methods = {}
 
         for method in HTTP_METHODS:
-            if method in path_item:
-                methods[method] = path_item[method]
+            if method not in path_item:
+                continue
+            if projection is None:
+                # Full operations are encoded once per generation
+                methods[method] = self.fragments.get(
+                    name, snapshot.generation, join_pointer(['paths', path, method]),
+                    partial(materialize, path_item[method])
+                )
+            else:
+                methods[method] = project(path_item[method], projection)
 
         return {
             "path": path,
-            "methods": methods
+            "methods": methods,
+            "generation": snapshot.generation
         }
 
     def list_all_paths(self, name: str) -> Dict[str, Any]:
@@ -67,15 +136,16 @@ class PathService:
         Returns:
             All paths and supported HTTP methods
         """
-        doc_data, error = self.storage.get_or_error(name)
+        snapshot, error = self.storage.get_snapshot_or_error(name)
         if error:
             return error
+        doc_data = snapshot.document
 
         paths = doc_data.get('paths', {})
         result = []
 
         for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+            if not isinstance(path_item, Mapping):
                 continue
 
             methods = [m for m in HTTP_METHODS if m in path_item]
@@ -86,25 +156,139 @@ class PathService:
 
         return {
             "count": len(result),
-            "paths": result
+            "paths": result,
+            "generation": snapshot.generation
+        }
+
+    def _find_prefix(
+        self,
+        name: str,
+        prefix: str
+    ) -> Tuple[Optional[int], Optional[Mapping], Optional[Mapping], Optional[Dict[str, Any]]]:
+        """
+        Find the path tree node of a prefix.
+
+        Returns:
+            Tuple of (document generation, path tree, node, error dict or None)
+        """
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return None, None, None, error
+        doc_data = snapshot.document
+
+        tree = doc_data.get('path_tree')
+        if not tree:
+            tree = PathTreeIndexer.build_path_tree(doc_data.get('paths', {}))
+
+        node = tree['root']
+        for segment in split_path(prefix):
+            children = node['children']
+            if segment not in children:
+                return None, None, None, {
+                    "error": True,
+                    "message": ERROR_PATH_PREFIX_NOT_FOUND.format(prefix=prefix, name=name)
+                }
+            node = children[segment]
+        return snapshot.generation, tree, node, None
+
+    def browse_paths(self, name: str, prefix: str = '/') -> Dict[str, Any]:
+        """
+        List the next path segments under a prefix, with operation counts.
+
+        Answered from the path tree built at load time, so the cost depends
+        on the number of children, not on the number of paths in the API.
+
+        Args:
+            name: API name
+            prefix: Path prefix like /v1/billing (default: the root)
+
+        Returns:
+            Paths ending at the prefix and its child segments with their counts
+        """
+        generation, tree, node, error = self._find_prefix(name, prefix)
+        if error:
+            return error
+
+        base = '/' + '/'.join(split_path(prefix))
+        children = []
+        for segment, child in node['children'].items():
+            children.append({
+                "segment": segment,
+                "prefix": base.rstrip('/') + '/' + segment,
+                "operations_count": child['end'] - child['start'],
+                "children_count": len(child['children'])
+            })
+
+        return {
+            "prefix": base,
+            "operations_count": node['end'] - node['start'],
+            "paths": materialize(node['paths']),
+            "children": children,
+            "generation": generation
         }
 
-    def get_operation_by_id(self, name: str, operation_id: str, resolve_refs: bool = True) -> Dict[str, Any]:
+    def get_operations_under_prefix(self, name: str, prefix: str) -> Dict[str, Any]:
+        """
+        List every operation whose path starts with a prefix.
+
+        The operations under a path tree node are stored contiguously, so
+        the cost depends only on the number of operations returned.
+
+        Args:
+            name: API name
+            prefix: Path prefix like /v1/billing or /v1/billing/*
+
+        Returns:
+            Path, method, operationId and summary of every operation under the prefix
+        """
+        generation, tree, node, error = self._find_prefix(name, prefix)
+        if error:
+            return error
+
+        operations = [materialize(operation) for operation in tree['operations'][node['start']:node['end']]]
+        return {
+            "prefix": '/' + '/'.join(split_path(prefix)),
+            "count": len(operations),
+            "operations": operations,
+            "generation": generation
+        }
+
+    def get_operation_by_id(
+        self,
+        name: str,
+        operation_id: str,
+        resolve_refs: bool = True,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        dedupe: bool = False
+    ) -> Dict[str, Any]:
         """
         Quickly query endpoint by operationId.
 
+        The projection is applied before references are resolved, so
+        unselected parts of the operation are never copied or resolved.
+
         Args:
             name: API name
             operation_id: operationId like getUserById
             resolve_refs: If True, automatically resolve all $ref schema references (default: True)
+            level: Projection level: 'summary', 'signature' or 'full' (default: full)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"] (optional)
+            dedupe: If True, subtrees repeated in the resolved operation are returned once
+                    under 'shared' and replaced by {"x-shared": hash} (default: False)
 
         Returns:
             Complete operation information with optional schema resolution
         """
-        doc_data, error = self.storage.get_or_error(name)
+        projection, error = self._projection_or_error(level, fields)
         if error:
             return error
 
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
         operation_index = doc_data.get('operation_index', {})
 
         if operation_id not in operation_index:
@@ -120,15 +304,118 @@ class PathService:
         paths = doc_data.get('paths', {})
         operation = paths[path][method]
 
+        # Hot operations are served pre-resolved (full operations only)
+        warm = None
+        if resolve_refs and projection is None:
+            warm = self.prewarmer.lookup(name, snapshot.generation, operation_id)
+
+        if projection is not None:
+            operation = project(operation, projection)
+
         # Resolve schema references if requested
-        if resolve_refs:
+        if warm is not None:
+            operation = warm
+        elif resolve_refs:
             raw_doc = doc_data.get('raw', {})
-            resolver = RefResolver(raw_doc)
-            operation = resolver.resolve_operation(operation)
+            resolver = RefResolver(raw_doc, doc_data.get('pointer_table'))
+            if projection is None:
+                operation = self.fragments.get(
+                    name, snapshot.generation, join_pointer(['paths', path, method]),
+                    partial(resolver.resolve_operation, operation), resolved=True
+                )
+            else:
+                operation = resolver.resolve_operation(operation)
+        else:
+            operation = materialize(operation)
 
-        return {
+        result = {
             "operation_id": operation_id,
             "path": path,
             "method": method,
-            "details": operation
+            "details": operation,
+            "generation": snapshot.generation
+        }
+        if dedupe:
+            result["details"], result["shared"] = fold_repeats(operation)
+        return result
+
+    def get_prewarm_stats(self) -> Dict[str, Any]:
+        """
+        Get pre-warm coverage and hit rates of get_operation_by_id, and JSON fragment cache usage.
+
+        Returns:
+            Budget usage and, per API, warm operations, coverage, hits and misses,
+            plus fragment cache size and hit rate under 'fragment_cache'
+        """
+        stats = self.prewarmer.stats()
+        stats["fragment_cache"] = self.fragments.stats()
+        return stats
+
+    def get_operations_by_ids(
+        self,
+        name: str,
+        operation_ids: List[str],
+        resolve_refs: bool = True,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Query several endpoints by operationId in one call.
+
+        All operations are resolved in a single pass with one resolver.
+        Schema references are kept as $ref and each referenced schema is
+        resolved once into a shared 'definitions' section keyed by pointer.
+
+        Args:
+            name: API name
+            operation_ids: operationIds like ["getUserById", "updateUser"]
+            resolve_refs: If True, resolve references and return shared definitions (default: True)
+            level: Projection level: 'summary', 'signature' or 'full' (default: full)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"] (optional)
+
+        Returns:
+            Operations in request order, shared schema definitions, and unknown operationIds
+        """
+        projection, error = self._projection_or_error(level, fields)
+        if error:
+            return error
+
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
+        operation_index = doc_data.get('operation_index', {})
+        paths = doc_data.get('paths', {})
+
+        entries = []
+        not_found = []
+        for operation_id in dict.fromkeys(operation_ids):
+            if operation_id not in operation_index:
+                not_found.append(operation_id)
+                continue
+            index_entry = operation_index[operation_id]
+            entries.append((operation_id, index_entry['path'], index_entry['method']))
+
+        operations = [project(paths[path][method], projection) for _, path, method in entries]
+
+        definitions = {}
+        if resolve_refs:
+            resolver = RefResolver(doc_data.get('raw', {}), doc_data.get('pointer_table'))
+            operations, definitions = resolver.resolve_many(operations)
+
+        return {
+            "count": len(entries),
+            "operations": [
+                {
+                    "operation_id": operation_id,
+                    "path": path,
+                    "method": method,
+                    "details": operation
+                }
+                for (operation_id, path, method), operation in zip(entries, operations)
+            ],
+            "definitions": definitions,
+            "not_found": not_found,
+            "generation": snapshot.generation
         }
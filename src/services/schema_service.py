@@ -2,9 +2,14 @@
 Schema and authentication query service
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.storage import OpenAPIStorage
-from src.config import ERROR_SCHEMA_NOT_FOUND
+from src.config import ERROR_SCHEMA_NOT_FOUND, ERROR_POINTER_NOT_FOUND, ERROR_SECURITY_SCHEME_NOT_FOUND
+from src.indexers.security_indexer import SecurityIndexer
+from src.utils.ref_resolver import RefResolver
+from src.utils.compiled_tree import materialize
+from src.utils.json_pointer import join_pointer
+from src.utils.json_fragments import FragmentCache, merge
 
 
 class SchemaService:
@@ -12,14 +17,16 @@ class SchemaService:
     Service for querying schemas and authentication info.
     """
 
-    def __init__(self, storage: OpenAPIStorage):
+    def __init__(self, storage: OpenAPIStorage, fragments: Optional[FragmentCache] = None):
         """
         Initialize SchemaService.
 
         Args:
             storage: OpenAPIStorage instance
+            fragments: Cache of serialized schemas (optional)
         """
         self.storage = storage
+        self.fragments = fragments or FragmentCache(max_bytes=0)
 
     def get_schema_details(self, name: str, schema_name: str) -> Dict[str, Any]:
         """
@@ -30,12 +37,31 @@ class SchemaService:
             schema_name: Schema name like User, Pet
 
         Returns:
-            Detailed schema definition
+            Detailed schema definition (serialized schemas are cached per generation)
         """
-        doc_data, error = self.storage.get_or_error(name)
+        error = self.storage.check_exists(name)
         if error:
             return error
 
+        # Let an indexed backend answer the query without loading the document.
+        # A cached fragment is served under the generation it was read from;
+        # otherwise the backend returns the generation read with the schema.
+        pointer = join_pointer(['components', 'schemas', schema_name])
+        generation = self.storage.generation(name)
+        schema = self.fragments.lookup(name, generation, pointer)
+        if schema is None:
+            found = self.storage.get_schema(name, schema_name)
+            if found is not None:
+                generation, value = found
+                schema = self.fragments.get(name, generation, pointer, lambda: value)
+        if schema is not None:
+            return merge({"schema_name": schema_name}, schema, {"generation": generation})
+
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
         components = doc_data.get('components', {})
         schemas = components.get('schemas', {})
 
@@ -50,11 +76,62 @@ class SchemaService:
                 )
             }
 
-        schema = schemas[schema_name]
+        schema = self.fragments.get(name, snapshot.generation, pointer, lambda: materialize(schemas[schema_name]))
+
+        return merge({"schema_name": schema_name}, schema, {"generation": snapshot.generation})
+
+    def get_by_pointer(
+        self,
+        name: str,
+        pointer: str,
+        resolve_refs: bool = False,
+        original: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get any node of a document by JSON pointer.
+
+        Component, path item and operation pointers are answered from the
+        pointer table built at load time; other pointers are walked token by token.
+
+        Args:
+            name: API name
+            pointer: JSON pointer like #/components/responses/NotFound or /paths/~1users/get
+            resolve_refs: If True, resolve $ref references inside the returned node
+            original: If True, read the Swagger 2.0 document as loaded instead of its
+                      OpenAPI 3.0 conversion (e.g. #/definitions/Pet); other APIs are
+                      unaffected
+
+        Returns:
+            The pointer and the node it refers to
+        """
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
+        if pointer.startswith('/'):
+            pointer = '#' + pointer
+
+        if original and doc_data.get('original'):
+            resolver = RefResolver(doc_data['original'])
+        else:
+            resolver = RefResolver(doc_data['raw'], doc_data.get('pointer_table'))
+        try:
+            node = resolver.lookup(pointer)
+        except (KeyError, ValueError):
+            return {
+                "error": True,
+                "message": ERROR_POINTER_NOT_FOUND.format(pointer=pointer, name=name)
+            }
+
+        node = materialize(node)
+        if resolve_refs:
+            node = resolver.resolve(node)
 
         return {
-            "schema_name": schema_name,
-            **schema
+            "pointer": pointer,
+            "value": node,
+            "generation": snapshot.generation
         }
 
     def get_auth_info(self, name: str) -> Dict[str, Any]:
@@ -67,17 +144,98 @@ class SchemaService:
         Returns:
             Detailed security schemes configuration
         """
-        doc_data, error = self.storage.get_or_error(name)
+        snapshot, error = self.storage.get_snapshot_or_error(name)
         if error:
             return error
+        doc_data = snapshot.document
 
-        raw_doc = doc_data['raw']
-        components = doc_data.get('components', {})
+        security_schemes = doc_data.get('components', {}).get('securitySchemes', {})
+        global_security = doc_data['raw'].get('security', [])
+
+        return {
+            "security_schemes": materialize(security_schemes),
+            "global_security": materialize(global_security),
+            "generation": snapshot.generation
+        }
 
-        security_schemes = components.get('securitySchemes', {})
-        global_security = raw_doc.get('security', [])
+    def find_operations_by_security(
+        self,
+        name: str,
+        scheme: Optional[str] = None,
+        scope: Optional[str] = None,
+        unauthenticated: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Find operations by their effective security requirements.
+
+        Answered from the security index built at load time, so the cost
+        depends on the number of matching operations, not the API size.
+        An operation matches a scheme or scope if any of its alternative
+        requirements uses it.
+
+        Args:
+            name: API name
+            scheme: Security scheme name like oauth, api_key (optional)
+            scope: OAuth scope like pets:write; with no scheme, any scheme granting it matches (optional)
+            unauthenticated: If True, return operations callable without credentials
+                             (scheme and scope are ignored)
+
+        Returns:
+            Matching operations with their effective security, or, with no
+            criteria, operation counts per scheme and scope
+        """
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
+        index = doc_data.get('security_index')
+        if not index:
+            index = SecurityIndexer.build_security_index(doc_data['raw'])
+
+        by_scheme = index['by_scheme']
+        by_scope = index['by_scope']
+
+        if unauthenticated:
+            positions = index['unauthenticated']
+        elif scheme is not None:
+            if scheme not in index['schemes'] and scheme not in by_scheme:
+                available = ', '.join(index['schemes'].keys()) or 'none'
+                return {
+                    "error": True,
+                    "message": ERROR_SECURITY_SCHEME_NOT_FOUND.format(scheme=scheme, name=name, available=available)
+                }
+            if scope is not None:
+                positions = by_scope.get(scheme, {}).get(scope, [])
+            else:
+                positions = by_scheme.get(scheme, [])
+        elif scope is not None:
+            matched = set()
+            for scopes in by_scope.values():
+                matched.update(scopes.get(scope, []))
+            positions = sorted(matched)
+        else:
+            return {
+                "schemes": {
+                    scheme_name: {
+                        "type": index['schemes'].get(scheme_name, ''),
+                        "operations_count": len(by_scheme.get(scheme_name, [])),
+                        "scopes": {
+                            scope_name: len(scope_positions)
+                            for scope_name, scope_positions in by_scope.get(scheme_name, {}).items()
+                        }
+                    }
+                    for scheme_name in list(index['schemes']) + [s for s in by_scheme if s not in index['schemes']]
+                },
+                "unauthenticated_count": len(index['unauthenticated']),
+                "undefined_schemes": materialize(index['undefined_schemes']),
+                "generation": snapshot.generation
+            }
 
+        operations = index['operations']
+        results = [materialize(operations[position]) for position in positions]
         return {
-            "security_schemes": security_schemes,
-            "global_security": global_security
+            "count": len(results),
+            "operations": results,
+            "generation": snapshot.generation
         }
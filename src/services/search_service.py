@@ -2,9 +2,25 @@
 Endpoint search service
 """
 
+from collections.abc import Mapping
 from typing import Dict, Any, Optional
 from src.storage import OpenAPIStorage
-from src.config import HTTP_METHODS
+from src.config import (
+    HTTP_METHODS,
+    PATTERN_FIELDS,
+    PATTERN_SYNTAXES,
+    ERROR_UNKNOWN_PATTERN_FIELD,
+    ERROR_UNKNOWN_PATTERN_SYNTAX,
+    ERROR_INVALID_PATTERN,
+    ERROR_PATTERN_TIMEOUT,
+    PATTERN_MATCH_TIMEOUT
+)
+from src.indexers.semantic_indexer import SemanticIndex
+from src.indexers.path_tree_indexer import PathTreeIndexer
+from src.indexers.ngram_indexer import NgramIndexer, field_text
+from src.utils.patterns import PatternError, compile_pattern
+from src.utils.compiled_tree import materialize
+from src.execution import check_deadline, time_remaining
 
 
 class SearchService:
@@ -12,14 +28,16 @@ class SearchService:
     Service for searching endpoints by various criteria.
     """
 
-    def __init__(self, storage: OpenAPIStorage):
+    def __init__(self, storage: OpenAPIStorage, semantic_index: Optional[SemanticIndex] = None):
         """
         Initialize SearchService.
 
         Args:
             storage: OpenAPIStorage instance
+            semantic_index: Operation vectors shared with ApiService (optional)
         """
         self.storage = storage
+        self.semantic_index = semantic_index or SemanticIndex()
 
     def search_endpoints(
         self,
@@ -40,19 +58,35 @@ class SearchService:
         Returns:
             List of matching endpoints
         """
-        doc_data, error = self.storage.get_or_error(name)
+        error = self.storage.check_exists(name)
         if error:
             return error
 
-        paths = doc_data.get('paths', {})
-        results = []
-
         # Normalize method parameter
         if method:
             method = method.lower()
 
+        # Let an indexed backend answer the query without loading the document
+        found = self.storage.search_operations(name, keyword, method, tag)
+        if found is not None:
+            generation, results = found
+            return {
+                "count": len(results),
+                "results": results,
+                "generation": generation
+            }
+
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
+        paths = doc_data.get('paths', {})
+        results = []
+
         for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+            check_deadline()
+            if not isinstance(path_item, Mapping):
                 continue
 
             for http_method in HTTP_METHODS:
@@ -60,7 +94,7 @@ class SearchService:
                     continue
 
                 operation = path_item[http_method]
-                if not isinstance(operation, dict):
+                if not isinstance(operation, Mapping):
                     continue
 
                 # Apply filters
@@ -92,10 +126,186 @@ class SearchService:
                     "method": http_method,
                     "operationId": operation.get('operationId', ''),
                     "summary": operation.get('summary', ''),
-                    "tags": operation.get('tags', [])
+                    "tags": materialize(operation.get('tags', []))
                 })
 
         return {
+            "count": len(results),
+            "results": results,
+            "generation": snapshot.generation
+        }
+
+    def pattern_search(
+        self,
+        name: str,
+        pattern: str,
+        field: str = 'path',
+        syntax: str = 'regex',
+        method: Optional[str] = None,
+        ignore_case: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Search endpoints whose path, operationId or summary matches a regex or glob.
+
+        The literal fragments every match must contain are looked up in the
+        n-gram index built at load time, and only the operations containing
+        all of them are matched against the pattern. With the `regex`
+        package installed, each match is also limited to
+        PATTERN_MATCH_TIMEOUT seconds and to the request's remaining time.
+
+        Args:
+            name: API name
+            pattern: Regular expression (matched anywhere, e.g. ^list.*Invoices$)
+                     or glob (matched in full, e.g. /v*/accounts/{id}/*)
+            field: Field to match: path, operationId or summary (default: path)
+            syntax: "regex" or "glob" (default: regex)
+            method: HTTP method filter like GET, POST (optional)
+            ignore_case: Match case-insensitively (default: False)
+
+        Returns:
+            List of matching endpoints, with the number of operations the
+            prefilter left to match
+        """
+        if field not in PATTERN_FIELDS:
+            return {
+                "error": True,
+                "message": ERROR_UNKNOWN_PATTERN_FIELD.format(field=field, available=', '.join(PATTERN_FIELDS))
+            }
+        if syntax not in PATTERN_SYNTAXES:
+            return {
+                "error": True,
+                "message": ERROR_UNKNOWN_PATTERN_SYNTAX.format(syntax=syntax, available=', '.join(PATTERN_SYNTAXES))
+            }
+        try:
+            compiled = compile_pattern(pattern, syntax, ignore_case)
+        except PatternError as e:
+            return {
+                "error": True,
+                "message": ERROR_INVALID_PATTERN.format(pattern=pattern, reason=str(e))
+            }
+
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
+        tree = doc_data.get('path_tree')
+        if not tree:
+            tree = PathTreeIndexer.build_path_tree(doc_data.get('paths', {}))
+        operations = tree['operations']
+        index = doc_data.get('ngram_index')
+        if not index:
+            index = NgramIndexer.build_ngram_index(operations)
+
+        positions = NgramIndexer.candidates(index[field], compiled.literals)
+        if positions is None:
+            positions = range(len(operations))
+
+        method_lower = method.lower() if method else None
+        paths = doc_data.get('paths', {})
+        results = []
+        for position in positions:
+            check_deadline()
+            operation = operations[position]
+            if method_lower and operation['method'] != method_lower:
+                continue
+            timeout = self._match_timeout()
+            try:
+                if not compiled.search(field_text(operation, field), timeout):
+                    continue
+            except TimeoutError:
+                # Stopped by the request deadline, or by the per-match limit
+                check_deadline()
+                return {
+                    "error": True,
+                    "message": ERROR_PATTERN_TIMEOUT.format(pattern=pattern, timeout=round(timeout, 3), field=field)
+                }
+            path, http_method = operation['path'], operation['method']
+            results.append({
+                "path": path,
+                "method": http_method,
+                "operationId": operation.get('operationId') or '',
+                "summary": operation.get('summary') or '',
+                "tags": materialize(paths[path][http_method].get('tags', []))
+            })
+
+        return {
+            "count": len(results),
+            "results": results,
+            "candidates": len(positions),
+            "operations_count": len(operations),
+            "generation": snapshot.generation
+        }
+
+    @staticmethod
+    def _match_timeout() -> Optional[float]:
+        """Seconds the next pattern match may run: the per-match limit or the time left, whichever is shorter."""
+        limits = [limit for limit in (PATTERN_MATCH_TIMEOUT or None, time_remaining()) if limit is not None]
+        return min(limits) if limits else None
+
+    def semantic_search(
+        self,
+        query: str,
+        name: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Search endpoints by meaning rather than exact substrings.
+
+        Operations are embedded offline with a hashing vectorizer that knows
+        common API synonyms, so "cancel a subscription" also finds
+        "terminate plan". One matrix-vector product scores every operation.
+
+        Args:
+            query: Natural-language description of the wanted endpoint
+            name: API name; searches every loaded API when omitted (optional)
+            method: HTTP method filter like GET, POST (optional)
+            tag: Tag filter (optional)
+            limit: Maximum number of results (default: 10)
+
+        Returns:
+            Best matching endpoints with similarity scores, best first
+        """
+        if name is not None:
+            error = self.storage.check_exists(name)
+            if error:
+                return error
+
+        self._sync_semantic_index(name)
+        results = self.semantic_index.search(query, name, method.lower() if method else None, tag, limit)
+
+        return {
+            "query": query,
             "count": len(results),
             "results": results
         }
+
+    def _sync_semantic_index(self, name: Optional[str] = None) -> None:
+        """
+        Bring the semantic index in line with storage.
+
+        APIs loaded by another process, reloaded with different content or
+        removed since they were indexed are (re)indexed or dropped.
+
+        Args:
+            name: Only sync this API (optional)
+        """
+        summaries = self.storage.list_summaries()
+        indexed = self.semantic_index.indexed()
+
+        if name is None:
+            for stale in [n for n in indexed if n not in summaries]:
+                self.semantic_index.remove(stale)
+            names = summaries
+        else:
+            names = [name] if name in summaries else []
+
+        for api_name in names:
+            content_hash = summaries[api_name].get('stats', {}).get('content_hash')
+            if api_name in indexed and indexed[api_name] == content_hash:
+                continue
+            doc_data = self.storage.get(api_name)
+            if doc_data is not None:
+                self.semantic_index.add(api_name, doc_data.get('paths', {}), content_hash)
@@ -2,9 +2,11 @@
 Tag query service
 """
 
+from collections.abc import Mapping
 from typing import Dict, Any
 from src.storage import OpenAPIStorage
 from src.config import HTTP_METHODS
+from src.utils.compiled_tree import materialize
 
 
 class TagService:
@@ -31,15 +33,17 @@ class TagService:
         Returns:
             List of all tags with names and descriptions
         """
-        doc_data, error = self.storage.get_or_error(name)
+        snapshot, error = self.storage.get_snapshot_or_error(name)
         if error:
             return error
+        doc_data = snapshot.document
 
-        tags = doc_data.get('tags', [])
+        tags = materialize(doc_data.get('tags', []))
 
         return {
             "count": len(tags),
-            "tags": tags
+            "tags": tags,
+            "generation": snapshot.generation
         }
 
     def get_endpoints_by_tag(self, name: str, tag: str) -> Dict[str, Any]:
@@ -53,15 +57,31 @@ class TagService:
         Returns:
             Overview of all endpoints under the tag
         """
-        doc_data, error = self.storage.get_or_error(name)
+        error = self.storage.check_exists(name)
         if error:
             return error
 
+        # Let an indexed backend answer the query without loading the document
+        found = self.storage.find_operations_by_tag(name, tag)
+        if found is not None:
+            generation, endpoints = found
+            return {
+                "tag": tag,
+                "count": len(endpoints),
+                "endpoints": endpoints,
+                "generation": generation
+            }
+
+        snapshot, error = self.storage.get_snapshot_or_error(name)
+        if error:
+            return error
+        doc_data = snapshot.document
+
         paths = doc_data.get('paths', {})
         endpoints = []
 
         for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+            if not isinstance(path_item, Mapping):
                 continue
 
             for method in HTTP_METHODS:
@@ -69,7 +89,7 @@ class TagService:
                     continue
 
                 operation = path_item[method]
-                if not isinstance(operation, dict):
+                if not isinstance(operation, Mapping):
                     continue
 
                 operation_tags = operation.get('tags', [])
@@ -84,5 +104,6 @@ class TagService:
         return {
             "tag": tag,
             "count": len(endpoints),
-            "endpoints": endpoints
+            "endpoints": endpoints,
+            "generation": snapshot.generation
         }
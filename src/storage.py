@@ -2,28 +2,145 @@
 In-memory storage for OpenAPI documents
 """
 
-from typing import Dict, Any, Optional, List
-from src.config import ERROR_API_NOT_FOUND
+import time
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
+from src.config import ERROR_API_NOT_FOUND, MEMORY_BUDGET_BYTES, SPILL_DIR
+from src.backends.base import StorageBackend
+from src.backends.spill_store import SpillStore
+from src.indexers.merkle_indexer import MerkleIndexer
+from src.utils.memory_size import estimate_memory_bytes
+
+
+class DocumentSnapshot(NamedTuple):
+    """One immutable generation of a stored document"""
+    generation: int
+    document: Dict[str, Any]
+
+
+@dataclass
+class ApiResidency:
+    """Access statistics and residency state for one stored API"""
+    # Stored size in the backend
+    size_bytes: int = 0
+    # Estimated memory while resident, charged to the memory budget
+    memory_bytes: int = 0
+    generation: int = 0
+    resident: bool = True
+    hits: int = 0
+    rehydrations: int = 0
+    evictions: int = 0
+    last_rehydration_ms: float = 0.0
+    total_rehydration_ms: float = 0.0
+    # Timestamps of the two most recent accesses (LRU-2 history)
+    history: deque = field(default_factory=lambda: deque(maxlen=2))
+
+    def touch(self) -> None:
+        """Record an access."""
+        self.hits += 1
+        self.history.append(time.monotonic())
+
+    def eviction_key(self) -> tuple:
+        """
+        Sort key for eviction: APIs with fewer than two accesses go first,
+        then the oldest second-to-last access (LRU-2), then the oldest last access.
+        """
+        if len(self.history) < 2:
+            return (0, self.history[-1] if self.history else 0.0)
+        return (1, self.history[0])
 
 
 class OpenAPIStorage:
     """
     In-memory storage for OpenAPI documents.
     Provides CRUD operations and unified error handling.
+
+    Documents are written through to a pluggable backend when one is set.
+    When a memory budget is configured, least-recently-queried APIs are
+    evicted from memory and transparently rehydrated from the backend on
+    access. Each resident document is charged its estimated in-memory size
+    (see estimate_memory_bytes), not its smaller stored size. Without an explicit backend, an on-disk spill store is used.
+
+    Every add publishes a new generation of the document as an immutable
+    snapshot, swapped in with a single assignment (read-copy-update). A
+    query holds on to the snapshot it started with, so a concurrent reload
+    never changes a document underneath it, and reads of resident documents
+    take no lock. A shared backend's catalog is cached and only re-read when
+    its version changes.
     """
 
-    def __init__(self):
-        self._storage: Dict[str, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        backend: Optional[StorageBackend] = None,
+        memory_budget_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None
+    ):
+        """
+        Initialize OpenAPIStorage.
+
+        Args:
+            backend: Persistent backend (defaults to a spill store when a memory budget is set)
+            memory_budget_bytes: Budget for resident documents (defaults to MEMORY_BUDGET_BYTES, 0 disables eviction)
+            spill_dir: Directory for spilled documents (defaults to SPILL_DIR or a temporary directory)
+        """
+        self._storage: Dict[str, DocumentSnapshot] = {}
+        self._residency: Dict[str, ApiResidency] = {}
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        # Local generations are unique across APIs, so a removed and re-added
+        # API never repeats a (name, generation) pair
+        self._generations = itertools.count(1)
+        # Version of the shared backend's catalog last reconciled by _sync()
+        self._catalog_version: Any = None
 
-    def add(self, name: str, document_data: Dict[str, Any]) -> None:
+        self.memory_budget_bytes = MEMORY_BUDGET_BYTES if memory_budget_bytes is None else memory_budget_bytes
+        if backend is None and self.memory_budget_bytes > 0:
+            backend = SpillStore(spill_dir or SPILL_DIR)
+        self._backend = backend
+
+    def add(self, name: str, document_data: Dict[str, Any]) -> int:
         """
         Add or update an OpenAPI document in storage.
 
+        Merkle hashes of the document's path items, operations and components
+        are computed here and stored with it under 'merkle', for version diffs.
+        The document must not be modified once added.
+
         Args:
             name: API name
             document_data: Parsed and indexed OpenAPI document data
+
+        Returns:
+            Generation number of the published document
         """
-        self._storage[name] = document_data
+        if 'merkle' not in document_data:
+            document_data['merkle'] = MerkleIndexer.build_merkle_index(document_data.get('raw', {}))
+
+        # Only needed for the budget, here or in processes sharing the backend
+        memory_bytes = 0
+        if self.memory_budget_bytes > 0 or (self._backend is not None and self._backend.shared):
+            memory_bytes = estimate_memory_bytes(document_data)
+
+        with self._lock:
+            residency = ApiResidency(memory_bytes=memory_bytes)
+            summary = self._summarize(document_data)
+            summary['memory_bytes'] = memory_bytes
+            if self._backend is not None:
+                residency.size_bytes = self._backend.save(name, document_data, summary)
+                if self._backend.shared:
+                    residency.generation = self._backend.catalog()[name]['generation']
+            if not residency.generation:
+                residency.generation = next(self._generations)
+
+            residency.touch()
+            self._storage[name] = DocumentSnapshot(residency.generation, document_data)
+            self._residency[name] = residency
+            self._summaries[name] = summary
+            self._enforce_budget(keep=name)
+            return residency.generation
 
     def get(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -35,7 +152,48 @@ class OpenAPIStorage:
         Returns:
             Document data or None if not found
         """
-        return self._storage.get(name)
+        snapshot = self.snapshot(name)
+        return snapshot.document if snapshot is not None else None
+
+    def snapshot(self, name: str) -> Optional[DocumentSnapshot]:
+        """
+        Get the current generation of a document.
+
+        Resident documents are returned without taking the lock, once a
+        shared backend's catalog is known to be unchanged; a spilled
+        document is rehydrated under the lock.
+
+        Args:
+            name: API name
+
+        Returns:
+            Snapshot with the generation and document, or None if not found
+        """
+        self._sync()
+        snapshot = self._storage.get(name)
+        residency = self._residency.get(name)
+        if snapshot is not None and residency is not None:
+            residency.touch()
+            return snapshot
+
+        with self._lock:
+            if name not in self._residency:
+                return None
+            return self._access(name)
+
+    def generation(self, name: str) -> Optional[int]:
+        """
+        Get the current generation number of an API without loading its document.
+
+        Args:
+            name: API name
+
+        Returns:
+            Generation number or None if not found
+        """
+        self._sync()
+        residency = self._residency.get(name)
+        return residency.generation if residency is not None else None
 
     def exists(self, name: str) -> bool:
         """
@@ -47,16 +205,32 @@ class OpenAPIStorage:
         Returns:
             True if exists, False otherwise
         """
-        return name in self._storage
+        self._sync()
+        return name in self._residency
 
     def list_all(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all stored OpenAPI documents.
 
+        Spilled documents are rehydrated, so prefer list_summaries() for listings.
+
         Returns:
             Dictionary of all documents
         """
-        return self._storage
+        self._sync()
+        with self._lock:
+            return {name: self._access(name).document for name in list(self._residency)}
+
+    def list_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the always-resident summaries of all stored documents.
+
+        Returns:
+            Dictionary mapping API name to its summary (info, servers, paths_count, tags_count, stats)
+        """
+        self._sync()
+        with self._lock:
+            return dict(self._summaries)
 
     def remove(self, name: str) -> bool:
         """
@@ -68,10 +242,16 @@ class OpenAPIStorage:
         Returns:
             True if removed, False if not found
         """
-        if name in self._storage:
-            del self._storage[name]
+        with self._lock:
+            if name not in self._residency:
+                return False
+
+            self._storage.pop(name, None)
+            del self._residency[name]
+            del self._summaries[name]
+            if self._backend is not None:
+                self._backend.delete(name)
             return True
-        return False
 
     def get_available_apis(self) -> str:
         """
@@ -80,9 +260,25 @@ class OpenAPIStorage:
         Returns:
             Comma-separated API names or 'none' if empty
         """
-        if not self._storage:
-            return 'none'
-        return ', '.join(sorted(self._storage.keys()))
+        self._sync()
+        with self._lock:
+            if not self._residency:
+                return 'none'
+            return ', '.join(sorted(self._residency.keys()))
+
+    def check_exists(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Check that an API exists without loading its document.
+
+        Args:
+            name: API name
+
+        Returns:
+            None if the API exists, otherwise an error dict
+        """
+        if self.exists(name):
+            return None
+        return self._not_found(name)
 
     def get_or_error(self, name: str) -> tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
         """
@@ -96,12 +292,252 @@ class OpenAPIStorage:
             If found: (document_data, None)
             If not found: (None, error_dict)
         """
-        if name not in self._storage:
-            return None, {
-                "error": True,
-                "message": ERROR_API_NOT_FOUND.format(
-                    name=name,
-                    available=self.get_available_apis()
-                )
+        snapshot, error = self.get_snapshot_or_error(name)
+        if error:
+            return None, error
+        return snapshot.document, None
+
+    def get_snapshot_or_error(self, name: str) -> tuple[Optional[DocumentSnapshot], Optional[Dict[str, Any]]]:
+        """
+        Get the current generation of a document or return an error response.
+
+        Queries should read everything from the one snapshot they get here
+        and report its generation, so results never mix two versions.
+
+        Args:
+            name: API name
+
+        Returns:
+            Tuple of (snapshot, error_dict)
+            If found: (snapshot, None)
+            If not found: (None, error_dict)
+        """
+        snapshot = self.snapshot(name)
+        if snapshot is None:
+            return None, self._not_found(name)
+        return snapshot, None
+
+    def _not_found(self, name: str) -> Dict[str, Any]:
+        """Error response for an API that is not in storage."""
+        return {
+            "error": True,
+            "message": ERROR_API_NOT_FOUND.format(
+                name=name,
+                available=self.get_available_apis()
+            )
+        }
+
+    def search_operations(
+        self,
+        name: str,
+        keyword: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None
+    ) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Push an endpoint search down into the backend.
+
+        Args:
+            name: API name (must exist)
+            keyword: Keyword matching path, summary, description (optional)
+            method: Lowercase HTTP method filter (optional)
+            tag: Tag filter (optional)
+
+        Returns:
+            Tuple of (generation the rows were read from, matching endpoints),
+            or None if the backend cannot answer the query
+        """
+        if self._backend is None:
+            return None
+        return self._backend.search_operations(name, keyword, method, tag)
+
+    def find_operations_by_tag(self, name: str, tag: str) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Push a tag lookup down into the backend.
+
+        Args:
+            name: API name (must exist)
+            tag: Tag name
+
+        Returns:
+            Tuple of (generation the rows were read from, matching endpoints),
+            or None if the backend cannot answer the query
+        """
+        if self._backend is None:
+            return None
+        return self._backend.find_operations_by_tag(name, tag)
+
+    def get_schema(self, name: str, schema_name: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Push a schema lookup down into the backend.
+
+        Args:
+            name: API name (must exist)
+            schema_name: Schema name
+
+        Returns:
+            Tuple of (generation the schema was read from, schema definition),
+            or None if missing or the backend cannot answer the query
+        """
+        if self._backend is None:
+            return None
+        return self._backend.get_schema(name, schema_name)
+
+    def get_residency_stats(self) -> Dict[str, Any]:
+        """
+        Get memory budget usage and per-API residency statistics.
+
+        Returns:
+            Budget totals and, per API, residency, size, hit and rehydration latency figures.
+            resident_bytes and each API's memory_bytes are estimated in-memory sizes, the
+            figures charged to the budget; size_bytes is the size stored in the backend.
+        """
+        self._sync()
+        with self._lock:
+            apis = {}
+            for name, residency in sorted(self._residency.items()):
+                apis[name] = {
+                    "generation": residency.generation,
+                    "resident": residency.resident,
+                    "size_bytes": residency.size_bytes,
+                    "memory_bytes": residency.memory_bytes,
+                    "hits": residency.hits,
+                    "evictions": residency.evictions,
+                    "rehydrations": residency.rehydrations,
+                    "last_rehydration_ms": round(residency.last_rehydration_ms, 3),
+                    "avg_rehydration_ms": round(
+                        residency.total_rehydration_ms / residency.rehydrations, 3
+                    ) if residency.rehydrations else 0.0,
+                    "dedup_ratio": self._summaries.get(name, {}).get('dedup_ratio', 0.0)
+                }
+
+            return {
+                "backend": type(self._backend).__name__ if self._backend is not None else "memory",
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "resident_bytes": self._resident_bytes(),
+                "resident_count": len(self._storage),
+                "total_count": len(self._residency),
+                "apis": apis
             }
-        return self._storage[name], None
+
+    def _access(self, name: str) -> DocumentSnapshot:
+        """
+        Return a document snapshot, rehydrating it from the backend if it is not resident.
+        Must be called with the lock held.
+        """
+        residency = self._residency[name]
+        residency.touch()
+
+        snapshot = self._storage.get(name)
+        if snapshot is not None:
+            return snapshot
+
+        start = time.perf_counter()
+        document_data = self._backend.load(name)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if not isinstance(document_data, dict):
+            # Compiled documents decode nodes from their mapped file on access
+            residency.memory_bytes = residency.size_bytes
+        elif not residency.memory_bytes:
+            residency.memory_bytes = estimate_memory_bytes(document_data)
+
+        residency.resident = True
+        residency.rehydrations += 1
+        residency.last_rehydration_ms = elapsed_ms
+        residency.total_rehydration_ms += elapsed_ms
+        snapshot = DocumentSnapshot(residency.generation, document_data)
+        self._storage[name] = snapshot
+        self._enforce_budget(keep=name)
+
+        return snapshot
+
+    def _resident_bytes(self) -> int:
+        """Total estimated memory of resident documents."""
+        return sum(self._residency[name].memory_bytes for name in self._storage)
+
+    def _enforce_budget(self, keep: str) -> None:
+        """
+        Evict cold APIs until resident documents fit in the memory budget.
+
+        The API named by `keep` is never evicted, so a single document larger
+        than the budget stays resident until another API is accessed.
+        """
+        if self._backend is None or self.memory_budget_bytes <= 0:
+            return
+
+        resident_bytes = self._resident_bytes()
+        while resident_bytes > self.memory_budget_bytes:
+            candidates = [n for n in self._storage if n != keep]
+            if not candidates:
+                break
+
+            victim = min(candidates, key=lambda n: self._residency[n].eviction_key())
+            del self._storage[victim]
+            residency = self._residency[victim]
+            residency.resident = False
+            residency.evictions += 1
+            resident_bytes -= residency.memory_bytes
+
+    def _sync(self) -> None:
+        """
+        Reconcile the local catalog with a shared backend.
+
+        Picks up APIs added or removed by other processes and drops resident
+        copies whose generation changed. The catalog is only re-read when the
+        backend's catalog version changed, and that check takes no lock, so
+        concurrent readers of an unchanged catalog do not serialize.
+        """
+        if self._backend is None or not self._backend.shared:
+            return
+
+        version = self._backend.catalog_version()
+        if version == self._catalog_version:
+            return
+
+        with self._lock:
+            if version != self._catalog_version:
+                self._reconcile(self._backend.catalog())
+                self._catalog_version = version
+
+    def _reconcile(self, catalog: Dict[str, Dict[str, Any]]) -> None:
+        """Bring the local catalog in line with a shared backend's. Must be called with the lock held."""
+        for name in [n for n in self._residency if n not in catalog]:
+            self._storage.pop(name, None)
+            del self._residency[name]
+            del self._summaries[name]
+
+        for name, entry in catalog.items():
+            residency = self._residency.get(name)
+            if residency is not None and residency.generation == entry['generation']:
+                continue
+
+            if residency is None:
+                residency = ApiResidency()
+                self._residency[name] = residency
+            self._storage.pop(name, None)
+            residency.resident = False
+            residency.generation = entry['generation']
+            residency.size_bytes = entry['size_bytes']
+            residency.memory_bytes = entry['summary'].get('memory_bytes', 0)
+            self._summaries[name] = entry['summary']
+
+    @staticmethod
+    def _summarize(document_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the lightweight summary kept in memory for every API.
+
+        Args:
+            document_data: Parsed and indexed OpenAPI document data
+
+        Returns:
+            Summary with info, server URLs, path count, tag count, dedup ratio and load-time statistics
+        """
+        return {
+            "info": document_data.get('info', {}),
+            "servers": [s.get('url') if isinstance(s, dict) else str(s) for s in document_data.get('servers', [])],
+            "paths_count": len(document_data.get('paths', {})),
+            "tags_count": len(document_data.get('tags', [])),
+            "dedup_ratio": document_data.get('dedup_stats', {}).get('dedup_ratio', 0.0),
+            "stats": document_data.get('stats', {})
+        }
@@ -0,0 +1,35 @@
+"""
+MCP tools for comparing API versions
+"""
+
+from typing import Dict, Any
+from src.services.diff_service import DiffService
+from src.execution import ToolExecutor
+
+
+def register_diff_tools(mcp, diff_service: DiffService, executor: ToolExecutor):
+    """
+    Register version diff MCP tools.
+
+    Args:
+        mcp: FastMCP instance
+        diff_service: DiffService instance
+        executor: ToolExecutor running the tool bodies
+    """
+
+    @mcp.tool()
+    async def diff_apis(base: str, target: str, breaking_only: bool = False) -> Dict[str, Any]:
+        """
+        Compare two loaded versions of an API and classify breaking changes
+
+        Args:
+            base: Name of the older version, e.g. payments-v1
+            target: Name of the newer version, e.g. payments-v2
+            breaking_only: If True, report only breaking changes (default: False)
+
+        Returns:
+            Added, removed and changed operations (parameters, request bodies,
+            responses and schema fields) and components, each change marked
+            breaking or not, plus a summary
+        """
+        return await executor.run('diff_apis', diff_service.diff_apis, base, target, breaking_only)
@@ -2,7 +2,8 @@
 MCP tools for loading and listing APIs
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from fastmcp import Context
 from src.services.api_service import ApiService
 
 
@@ -16,25 +17,55 @@ def register_loading_tools(mcp, api_service: ApiService):
     """
 
     @mcp.tool()
-    async def load_openapi(name: str, url: str) -> Dict[str, Any]:
+    async def load_openapi(name: str, url: str, ctx: Context) -> Dict[str, Any]:
         """
         Load OpenAPI document from URL and save to memory
 
         Args:
             name: API name for later queries
-            url: URL of the OpenAPI document
+            url: URL of the OpenAPI document (http(s):// or file:// under OPENAPI_LOCAL_ROOTS); a
+                 file:// directory loads every spec file under it as "<name>/<relative path>"
 
         Returns:
             Loading status and document basic info
         """
-        return await api_service.load_openapi(name, url)
+        async def report_progress(downloaded: int, total: Optional[int]) -> None:
+            await ctx.report_progress(downloaded, total, f"Downloaded {downloaded / (1024 * 1024):.1f} MB")
+
+        return await api_service.load_openapi(name, url, report_progress)
+
+    @mcp.tool()
+    def list_apis(
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        keyword: Optional[str] = None,
+        tag: Optional[str] = None,
+        method: Optional[str] = None,
+        min_operations: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        List all loaded APIs with basic info and statistics
+
+        Args:
+            sort_by: Sort by name, title, paths_count, tags_count, operations_count, deprecated_count,
+                     schema_count, max_schema_depth, raw_bytes, parse_ms or index_ms (optional)
+            descending: Sort from largest to smallest (default: false)
+            keyword: Keep APIs whose name, title or description contains this (optional)
+            tag: Keep APIs with operations under this tag (optional)
+            method: Keep APIs with operations using this HTTP method (optional)
+            min_operations: Keep APIs with at least this many operations (optional)
+
+        Returns:
+            List of matching APIs with operation, schema, size and timing statistics
+        """
+        return api_service.list_apis(sort_by, descending, keyword, tag, method, min_operations)
 
     @mcp.tool()
-    def list_apis() -> Dict[str, Any]:
+    def get_storage_stats() -> Dict[str, Any]:
         """
-        List all loaded APIs with basic info
+        Get memory budget usage and per-API residency statistics
 
         Returns:
-            List of all loaded APIs
+            Budget totals plus residency, hit counts and rehydration latency per API
         """
-        return api_service.list_apis()
+        return api_service.get_storage_stats()
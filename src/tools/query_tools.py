@@ -2,15 +2,37 @@
 MCP tools for querying paths, operations, schemas, and auth
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
 from src.services.path_service import PathService
 from src.services.schema_service import SchemaService
+from src.execution import ToolExecutor
+from src.utils.json_fragments import encode_response
+
+
+# Output schema FastMCP derives for the Dict[str, Any] results of the other tools
+RESULT_SCHEMA = {"type": "object", "additionalProperties": True}
+
+
+def _json_result(result: Dict[str, Any]) -> ToolResult:
+    """
+    Return a response as structured content plus JSON text spliced from cached serialized fragments.
+
+    Clients reading structuredContent get the same result as from every
+    other tool; only the text copy is built from the cached bytes.
+    """
+    return ToolResult(
+        content=[TextContent(type="text", text=encode_response(result).decode())],
+        structured_content=result
+    )
 
 
 def register_query_tools(
     mcp,
     path_service: PathService,
-    schema_service: SchemaService
+    schema_service: SchemaService,
+    executor: ToolExecutor
 ):
     """
     Register query-related MCP tools.
@@ -19,24 +41,37 @@ def register_query_tools(
         mcp: FastMCP instance
         path_service: PathService instance
         schema_service: SchemaService instance
+        executor: ToolExecutor running the tool bodies
     """
 
-    @mcp.tool()
-    def get_path_details(name: str, path: str) -> Dict[str, Any]:
+    @mcp.tool(output_schema=RESULT_SCHEMA)
+    async def get_path_details(
+        name: str,
+        path: str,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> ToolResult:
         """
         Get complete documentation for a specific path
 
         Args:
             name: API name
             path: API path like /users/{id}
+            level: How much of each operation to return: "summary" (id, summary, tags),
+                   "signature" (plus parameters, requestBody, 2xx responses, security)
+                   or "full" (default)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"];
+                    added to the level's fields, '*' wildcards allowed
 
         Returns:
             All HTTP methods and details for the path
         """
-        return path_service.get_path_details(name, path)
+        return _json_result(
+            await executor.run('get_path_details', path_service.get_path_details, name, path, level, fields)
+        )
 
     @mcp.tool()
-    def list_all_paths(name: str) -> Dict[str, Any]:
+    async def list_all_paths(name: str) -> Dict[str, Any]:
         """
         List all API paths
 
@@ -46,10 +81,50 @@ def register_query_tools(
         Returns:
             All paths and supported HTTP methods
         """
-        return path_service.list_all_paths(name)
+        return await executor.run('list_all_paths', path_service.list_all_paths, name)
+
+    @mcp.tool()
+    async def browse_paths(name: str, prefix: str = '/') -> Dict[str, Any]:
+        """
+        List the path segments directly under a prefix, with operation counts
+
+        Use this to drill down into large APIs level by level instead of
+        listing every path.
+
+        Args:
+            name: API name
+            prefix: Path prefix like /v1/billing (default: /)
+
+        Returns:
+            Paths ending at the prefix and child segments with operation counts
+        """
+        return await executor.run('browse_paths', path_service.browse_paths, name, prefix)
 
     @mcp.tool()
-    def get_operation_by_id(name: str, operation_id: str, resolve_refs: bool = True) -> Dict[str, Any]:
+    async def get_operations_under_prefix(name: str, prefix: str) -> Dict[str, Any]:
+        """
+        List all operations whose path starts with a prefix
+
+        Args:
+            name: API name
+            prefix: Path prefix like /v1/billing or /v1/billing/*
+
+        Returns:
+            Path, method, operationId and summary of each operation under the prefix
+        """
+        return await executor.run(
+            'get_operations_under_prefix', path_service.get_operations_under_prefix, name, prefix
+        )
+
+    @mcp.tool(output_schema=RESULT_SCHEMA)
+    async def get_operation_by_id(
+        name: str,
+        operation_id: str,
+        resolve_refs: bool = True,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        dedupe: bool = False
+    ) -> ToolResult:
         """
         Quickly query endpoint by operationId
 
@@ -59,14 +134,66 @@ def register_query_tools(
             resolve_refs: If True (default), automatically resolve all $ref schema references inline.
                          This provides complete schema definitions in one call, reducing the need
                          for additional get_schema_details calls. Set to False to keep $ref as-is.
+            level: How much of the operation to return: "summary" (id, summary, tags),
+                   "signature" (plus parameters, requestBody, 2xx responses, security)
+                   or "full" (default)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"];
+                    added to the level's fields, '*' wildcards allowed
+            dedupe: If True, subtrees that repeat in the resolved operation (a shared Error or
+                    Money object, say) are returned once under 'shared' and replaced by
+                    {"x-shared": "<hash>"} where they occur (default: False)
 
         Returns:
             Complete operation information with optional schema resolution
         """
-        return path_service.get_operation_by_id(name, operation_id, resolve_refs)
+        return _json_result(await executor.run(
+            'get_operation_by_id', path_service.get_operation_by_id,
+            name, operation_id, resolve_refs, level, fields, dedupe
+        ))
 
     @mcp.tool()
-    def get_schema_details(name: str, schema_name: str) -> Dict[str, Any]:
+    def get_prewarm_stats() -> Dict[str, Any]:
+        """
+        Get how often get_operation_by_id is served from pre-resolved hot operations,
+        and how often large responses reuse cached serialized fragments
+
+        Returns:
+            Pre-warm budget usage and, per API, warm operations, coverage of the
+            lookups seen so far, hits, misses and hit rate; fragment cache size,
+            entries and hit rate under 'fragment_cache'
+        """
+        return path_service.get_prewarm_stats()
+
+    @mcp.tool()
+    async def get_operations_by_ids(
+        name: str,
+        operation_ids: List[str],
+        resolve_refs: bool = True,
+        level: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Query several endpoints by operationId in one call
+
+        Args:
+            name: API name
+            operation_ids: List of operationIds like ["getUserById", "updateUser"]
+            resolve_refs: If True (default), resolve references in one shared pass. Parameters,
+                         responses and request bodies are inlined; schemas are kept as $ref and
+                         each one is returned once in 'definitions', keyed by its $ref pointer.
+            level: How much of each operation to return: "summary", "signature" or "full" (default)
+            fields: Operation fields to return, e.g. ["parameters", "responses.200"]
+
+        Returns:
+            Operations in request order, shared schema definitions, and unknown operationIds
+        """
+        return await executor.run(
+            'get_operations_by_ids', path_service.get_operations_by_ids,
+            name, operation_ids, resolve_refs, level, fields
+        )
+
+    @mcp.tool(output_schema=RESULT_SCHEMA)
+    async def get_schema_details(name: str, schema_name: str) -> ToolResult:
         """
         Get data model definition from components/schemas
 
@@ -77,10 +204,12 @@ def register_query_tools(
         Returns:
             Detailed schema definition
         """
-        return schema_service.get_schema_details(name, schema_name)
+        return _json_result(
+            await executor.run('get_schema_details', schema_service.get_schema_details, name, schema_name)
+        )
 
     @mcp.tool()
-    def get_auth_info(name: str) -> Dict[str, Any]:
+    async def get_auth_info(name: str) -> Dict[str, Any]:
         """
         Get authentication configuration for an API
 
@@ -90,4 +219,57 @@ def register_query_tools(
         Returns:
             Detailed security schemes configuration
         """
-        return schema_service.get_auth_info(name)
+        return await executor.run('get_auth_info', schema_service.get_auth_info, name)
+
+    @mcp.tool()
+    async def find_operations_by_security(
+        name: str,
+        scheme: Optional[str] = None,
+        scope: Optional[str] = None,
+        unauthenticated: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Find operations by the security they effectively require
+
+        Operation-level security overrides the API-wide setting. With no
+        criteria, returns how many operations use each scheme and scope.
+
+        Args:
+            name: API name
+            scheme: Security scheme name like oauth, api_key (optional)
+            scope: OAuth scope like payments:write; without a scheme, matches any scheme (optional)
+            unauthenticated: If True, return operations callable without credentials (default: False)
+
+        Returns:
+            Matching operations with their effective security requirements
+        """
+        return await executor.run(
+            'find_operations_by_security', schema_service.find_operations_by_security,
+            name, scheme, scope, unauthenticated
+        )
+
+    @mcp.tool()
+    async def get_by_pointer(
+        name: str,
+        pointer: str,
+        resolve_refs: bool = False,
+        original: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get any node of an API document by JSON pointer
+
+        Args:
+            name: API name
+            pointer: JSON pointer like #/components/responses/NotFound or #/paths/~1users~1{id}/get
+                     ('/' inside a token is written '~1', '~' is written '~0')
+            resolve_refs: If True, resolve $ref references inside the returned node (default: False)
+            original: If True, read a Swagger 2.0 API as loaded rather than its OpenAPI 3.0
+                      form, e.g. #/definitions/Pet (default: False)
+
+        Returns:
+            The pointer and the node it refers to
+        """
+        return await executor.run(
+            'get_by_pointer', schema_service.get_by_pointer,
+            name, pointer, resolve_refs, original
+        )
@@ -5,12 +5,14 @@ MCP tools for searching endpoints and tags
 from typing import Dict, Any, Optional
 from src.services.search_service import SearchService
 from src.services.tag_service import TagService
+from src.execution import ToolExecutor
 
 
 def register_search_tools(
     mcp,
     search_service: SearchService,
-    tag_service: TagService
+    tag_service: TagService,
+    executor: ToolExecutor
 ):
     """
     Register search-related MCP tools.
@@ -19,10 +21,11 @@ def register_search_tools(
         mcp: FastMCP instance
         search_service: SearchService instance
         tag_service: TagService instance
+        executor: ToolExecutor running the tool bodies
     """
 
     @mcp.tool()
-    def search_endpoints(
+    async def search_endpoints(
         name: str,
         keyword: Optional[str] = None,
         method: Optional[str] = None,
@@ -40,10 +43,74 @@ def register_search_tools(
         Returns:
             List of matching endpoints
         """
-        return search_service.search_endpoints(name, keyword, method, tag)
+        return await executor.run(
+            'search_endpoints', search_service.search_endpoints,
+            name, keyword, method, tag
+        )
 
     @mcp.tool()
-    def list_tags(name: str) -> Dict[str, Any]:
+    async def pattern_search(
+        name: str,
+        pattern: str,
+        field: str = 'path',
+        syntax: str = 'regex',
+        method: Optional[str] = None,
+        ignore_case: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Search endpoints by regex or glob on path, operationId or summary
+
+        Regexes match anywhere (anchor with ^ and $), e.g. ^list.*Invoices$
+        on operationId. Globs match the whole value: * stays within a path
+        segment, ** crosses segments, e.g. /v*/accounts/{id}/*.
+
+        Args:
+            name: API name
+            pattern: Regular expression or glob
+            field: path, operationId or summary (default: path)
+            syntax: regex or glob (default: regex)
+            method: HTTP method filter like GET, POST (optional)
+            ignore_case: Match case-insensitively (default: False)
+
+        Returns:
+            List of matching endpoints
+        """
+        return await executor.run(
+            'pattern_search', search_service.pattern_search,
+            name, pattern, field, syntax, method, ignore_case
+        )
+
+    @mcp.tool()
+    async def semantic_search(
+        query: str,
+        name: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Search endpoints by meaning, e.g. "cancel a subscription"
+
+        Matches related wording ("terminate plan") as well as exact words,
+        across every loaded API unless a name is given.
+
+        Args:
+            query: Natural-language description of the endpoint you need
+            name: API name (optional, default: all loaded APIs)
+            method: HTTP method filter like GET, POST (optional)
+            tag: Tag filter (optional)
+            limit: Maximum number of results (default: 10)
+
+        Returns:
+            Best matching endpoints with their API and similarity score
+        """
+        return await executor.run(
+            'semantic_search', search_service.semantic_search,
+            query, name, method, tag, limit
+        )
+
+    @mcp.tool()
+    async def list_tags(name: str) -> Dict[str, Any]:
         """
         List all tags for an API
 
@@ -53,10 +120,10 @@ def register_search_tools(
         Returns:
             List of all tags with names and descriptions
         """
-        return tag_service.list_tags(name)
+        return await executor.run('list_tags', tag_service.list_tags, name)
 
     @mcp.tool()
-    def get_endpoints_by_tag(name: str, tag: str) -> Dict[str, Any]:
+    async def get_endpoints_by_tag(name: str, tag: str) -> Dict[str, Any]:
         """
         Get endpoints list by tag (overview only)
 
@@ -67,4 +134,4 @@ def register_search_tools(
         Returns:
             Overview of all endpoints under the tag
         """
-        return tag_service.get_endpoints_by_tag(name, tag)
+        return await executor.run('get_endpoints_by_tag', tag_service.get_endpoints_by_tag, name, tag)
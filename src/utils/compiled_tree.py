@@ -0,0 +1,405 @@
+"""
+Compiled binary format for parsed documents, served through mmap
+"""
+
+import os
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, List, Iterator, Tuple
+
+# File layout (native byte order, sections aligned to 8 bytes):
+#   header   MAGIC, version, root node, then (offset, count) of each section
+#   strings  UTF-8 string pool, deduplicated
+#   offsets  u32[count + 1] start offsets into the string pool
+#   nodes    u32[3 * count] records of (kind, a, b)
+#   children u32 entries; an object holds [key, value] * n followed by its keys'
+#            sorted permutation, an array holds [value] * n
+#   ints     i64 values of integer nodes
+#   floats   f64 values of float nodes
+MAGIC = b'OAPC'
+VERSION = 1
+HEADER = struct.Struct('=4sII' + 'QQ' * 6)
+
+KIND_NULL = 0
+KIND_FALSE = 1
+KIND_TRUE = 2
+KIND_INT = 3
+KIND_FLOAT = 4
+KIND_STRING = 5
+KIND_OBJECT = 6
+KIND_ARRAY = 7
+KIND_BIGINT = 8
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Number of decoded strings kept per open document
+STRING_CACHE_SIZE = 16384
+
+
+def _pad(size: int) -> int:
+    """Padding needed to align a section to 8 bytes."""
+    return -size % 8
+
+
+class _Compiler:
+    """
+    Flattens a JSON-like tree into node, children, string and scalar tables.
+
+    Containers reachable through several references (such as 'paths' and
+    raw['paths'] in stored documents) are encoded once.
+    """
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.nodes = array('I')
+        self.children = array('I')
+        self.ints = array('q')
+        self.floats = array('d')
+        self._memo: Dict[int, int] = {}
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings[value] = index
+        return index
+
+    def node(self, value: Any) -> int:
+        memo_index = self._memo.get(id(value))
+        if memo_index is not None:
+            return memo_index
+
+        index = len(self.nodes) // 3
+        self.nodes.extend((KIND_NULL, 0, 0))
+
+        if isinstance(value, dict):
+            self._memo[id(value)] = index
+            keys = [str(key) for key in value]
+            entries = []
+            for key, item in zip(keys, value.values()):
+                entries.append(self.string(key))
+                entries.append(self.node(item))
+            start = len(self.children)
+            self.children.extend(entries)
+            self.children.extend(sorted(range(len(keys)), key=keys.__getitem__))
+            self._set(index, KIND_OBJECT, start, len(keys))
+        elif isinstance(value, (list, tuple)):
+            self._memo[id(value)] = index
+            items = [self.node(item) for item in value]
+            start = len(self.children)
+            self.children.extend(items)
+            self._set(index, KIND_ARRAY, start, len(items))
+        elif value is None:
+            pass
+        elif value is True:
+            self._set(index, KIND_TRUE, 0, 0)
+        elif value is False:
+            self._set(index, KIND_FALSE, 0, 0)
+        elif isinstance(value, int):
+            if INT64_MIN <= value <= INT64_MAX:
+                self.ints.append(value)
+                self._set(index, KIND_INT, len(self.ints) - 1, 0)
+            else:
+                self._set(index, KIND_BIGINT, self.string(str(value)), 0)
+        elif isinstance(value, float):
+            self.floats.append(value)
+            self._set(index, KIND_FLOAT, len(self.floats) - 1, 0)
+        else:
+            # Strings, and anything else YAML produced (dates) in string form
+            self._set(index, KIND_STRING, self.string(str(value)), 0)
+
+        return index
+
+    def _set(self, index: int, kind: int, a: int, b: int) -> None:
+        base = index * 3
+        self.nodes[base] = kind
+        self.nodes[base + 1] = a
+        self.nodes[base + 2] = b
+
+    def to_bytes(self, root: int) -> bytes:
+        pool = bytearray()
+        offsets = array('I', [0])
+        for value in self.strings:
+            pool += value.encode('utf-8', 'surrogatepass')
+            offsets.append(len(pool))
+
+        sections = [
+            (bytes(pool), len(pool)),
+            (offsets.tobytes(), len(offsets)),
+            (self.nodes.tobytes(), len(self.nodes) // 3),
+            (self.children.tobytes(), len(self.children)),
+            (self.ints.tobytes(), len(self.ints)),
+            (self.floats.tobytes(), len(self.floats)),
+        ]
+
+        header_fields = []
+        body = bytearray()
+        position = HEADER.size + _pad(HEADER.size)
+        for data, count in sections:
+            header_fields.extend((position + len(body), count))
+            body += data + b'\0' * _pad(len(data))
+
+        header = HEADER.pack(MAGIC, VERSION, root, *header_fields)
+        return header + b'\0' * _pad(HEADER.size) + bytes(body)
+
+
+def compile_tree(value: Any) -> bytes:
+    """
+    Compile a JSON-like tree into the binary format.
+
+    Args:
+        value: Tree of dicts, lists and scalars
+
+    Returns:
+        Compiled bytes
+    """
+    compiler = _Compiler()
+    root = compiler.node(value)
+    return compiler.to_bytes(root)
+
+
+class CompiledTree:
+    """
+    Read-only access to a compiled tree in a memory-mapped file.
+
+    Containers are exposed as CompiledMapping / CompiledSequence views that
+    decode nodes on access, so reading one subtree never touches the rest.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a compiled file.
+
+        Args:
+            path: File written by write_compiled()
+
+        Raises:
+            ValueError: If the file is not in the compiled format
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size_bytes = len(self._mmap)
+
+        magic, version, self.root, *fields = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a compiled document: {path}")
+
+        view = memoryview(self._mmap)
+        (pool_at, pool_len, offsets_at, offsets_len, nodes_at, nodes_len,
+         children_at, children_len, ints_at, ints_len, floats_at, floats_len) = fields
+
+        self._pool = view[pool_at:pool_at + pool_len]
+        self._offsets = view[offsets_at:offsets_at + offsets_len * 4].cast('I')
+        self._nodes = view[nodes_at:nodes_at + nodes_len * 12].cast('I')
+        self._children = view[children_at:children_at + children_len * 4].cast('I')
+        self._ints = view[ints_at:ints_at + ints_len * 8].cast('q')
+        self._floats = view[floats_at:floats_at + floats_len * 8].cast('d')
+
+        self.string = lru_cache(maxsize=STRING_CACHE_SIZE)(self._decode_string)
+
+    def _decode_string(self, index: int) -> str:
+        return str(self._pool[self._offsets[index]:self._offsets[index + 1]], 'utf-8', 'surrogatepass')
+
+    def record(self, node: int) -> Tuple[int, int, int]:
+        """Get the (kind, a, b) record of a node."""
+        base = node * 3
+        return self._nodes[base], self._nodes[base + 1], self._nodes[base + 2]
+
+    def value(self, node: int) -> Any:
+        """
+        Get a node as a Python scalar or a lazy container view.
+        """
+        kind, a, b = self.record(node)
+        if kind == KIND_OBJECT:
+            return CompiledMapping(self, a, b)
+        if kind == KIND_ARRAY:
+            return CompiledSequence(self, a, b)
+        return self._scalar(kind, a)
+
+    def materialize(self, node: int) -> Any:
+        """
+        Decode a node and everything below it into plain dicts and lists.
+        """
+        kind, a, b = self.record(node)
+        if kind == KIND_OBJECT:
+            children = self._children
+            return {
+                self.string(children[a + 2 * i]): self.materialize(children[a + 2 * i + 1])
+                for i in range(b)
+            }
+        if kind == KIND_ARRAY:
+            return [self.materialize(child) for child in self._children[a:a + b]]
+        return self._scalar(kind, a)
+
+    def _scalar(self, kind: int, a: int) -> Any:
+        if kind == KIND_STRING:
+            return self.string(a)
+        if kind == KIND_INT:
+            return self._ints[a]
+        if kind == KIND_FLOAT:
+            return self._floats[a]
+        if kind == KIND_TRUE:
+            return True
+        if kind == KIND_FALSE:
+            return False
+        if kind == KIND_BIGINT:
+            return int(self.string(a))
+        return None
+
+    def root_value(self) -> Any:
+        """Get the root node as a view."""
+        return self.value(self.root)
+
+
+class CompiledMapping(Mapping):
+    """
+    Read-only dict view over an object node.
+
+    Iteration follows the original key order; lookups binary-search the
+    precomputed sorted key permutation.
+    """
+
+    __slots__ = ('_tree', '_start', '_count')
+
+    def __init__(self, tree: CompiledTree, start: int, count: int):
+        self._tree = tree
+        self._start = start
+        self._count = count
+
+    def _key(self, position: int) -> str:
+        return self._tree.string(self._tree._children[self._start + 2 * position])
+
+    def _find(self, key: Any) -> int:
+        """Position of a key in original order, or -1."""
+        if not isinstance(key, str):
+            return -1
+        children = self._tree._children
+        sorted_at = self._start + 2 * self._count
+        order = children[sorted_at:sorted_at + self._count]
+        lo = bisect_left(range(self._count), key, key=lambda i: self._key(order[i]))
+        if lo < self._count and self._key(order[lo]) == key:
+            return order[lo]
+        return -1
+
+    def __getitem__(self, key: Any) -> Any:
+        position = self._find(key)
+        if position < 0:
+            raise KeyError(key)
+        return self._tree.value(self._tree._children[self._start + 2 * position + 1])
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key(position)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self):
+        children = self._tree._children
+        for position in range(self._count):
+            at = self._start + 2 * position
+            yield self._tree.string(children[at]), self._tree.value(children[at + 1])
+
+    def values(self):
+        children = self._tree._children
+        for position in range(self._count):
+            yield self._tree.value(children[self._start + 2 * position + 1])
+
+    def materialize(self) -> Dict[str, Any]:
+        """Decode this object into a plain dict."""
+        children = self._tree._children
+        return {
+            self._tree.string(children[self._start + 2 * i]):
+                self._tree.materialize(children[self._start + 2 * i + 1])
+            for i in range(self._count)
+        }
+
+    def __repr__(self) -> str:
+        return f"CompiledMapping({self._count} keys)"
+
+
+class CompiledSequence(Sequence):
+    """
+    Read-only list view over an array node.
+    """
+
+    __slots__ = ('_tree', '_start', '_count')
+
+    def __init__(self, tree: CompiledTree, start: int, count: int):
+        self._tree = tree
+        self._start = start
+        self._count = count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._tree.value(self._tree._children[self._start + index])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def materialize(self) -> List[Any]:
+        """Decode this array into a plain list."""
+        return [self._tree.materialize(child) for child in self._tree._children[self._start:self._start + self._count]]
+
+    def __repr__(self) -> str:
+        return f"CompiledSequence({self._count} items)"
+
+
+def materialize(value: Any) -> Any:
+    """
+    Decode a compiled view into plain Python; other values are returned as-is.
+
+    Args:
+        value: Value read from a stored document
+
+    Returns:
+        Plain dict / list / scalar
+    """
+    if isinstance(value, (CompiledMapping, CompiledSequence)):
+        return value.materialize()
+    return value
+
+
+def write_compiled(path: str, value: Any) -> int:
+    """
+    Compile a tree and write it atomically to a file.
+
+    Args:
+        path: Destination file path
+        value: Tree of dicts, lists and scalars
+
+    Returns:
+        Number of bytes written
+    """
+    data = compile_tree(value)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_compiled(path: str) -> Any:
+    """
+    Open a compiled file and return its root as a lazy view.
+
+    Args:
+        path: File written by write_compiled()
+
+    Returns:
+        Root view (usually a CompiledMapping)
+    """
+    return CompiledTree(path).root_value()
@@ -0,0 +1,237 @@
+"""
+Structural hashing and hash-consing of JSON-like trees
+"""
+
+import hashlib
+from typing import Dict, Any, Tuple, Optional, Set
+
+# Digest size in bytes; 16 bytes makes accidental collisions negligible
+DIGEST_SIZE = 16
+
+# Subtrees smaller than this many nodes are not worth folding into references
+MIN_FOLD_NODES = 4
+
+
+def _scalar_token(value: Any) -> bytes:
+    """Encode a scalar so that equal JSON values, and only those, encode equally."""
+    if isinstance(value, str):
+        data = value.encode('utf-8', 'surrogatepass')
+        return b's%d:' % len(data) + data
+    if value is None:
+        return b'n'
+    if value is True:
+        return b't'
+    if value is False:
+        return b'f'
+    if isinstance(value, int):
+        return b'i%d;' % value
+    if isinstance(value, float):
+        return b'd' + repr(value).encode() + b';'
+    data = str(value).encode('utf-8', 'surrogatepass')
+    return b'o%d:' % len(data) + data
+
+
+class HashConsTable:
+    """
+    Interns containers by structural hash so identical subtrees share one object.
+
+    A dict or list is hashed from its children's digests, so every subtree
+    is hashed once, bottom-up. The first container seen with a digest
+    becomes canonical; later identical containers are replaced by it in
+    their parents. Key order is part of the structure, so shared objects
+    serialize exactly like the ones they replace.
+
+    Example:
+        table = HashConsTable()
+        doc = table.intern(doc)
+        table.stats()  # {"containers": 5200, "unique": 3100, "dedup_ratio": 0.404}
+    """
+
+    def __init__(self):
+        self._canonical: Dict[bytes, Any] = {}
+        # Digest of every container already processed, by id
+        self._digests: Dict[int, bytes] = {}
+        self.containers = 0
+
+    def intern(self, value: Any) -> Any:
+        """
+        Intern a tree in place.
+
+        Args:
+            value: Tree of dicts, lists and scalars (modified in place)
+
+        Returns:
+            The canonical object for value
+        """
+        return self._intern(value)[0]
+
+    def _intern(self, value: Any) -> Tuple[Any, bytes]:
+        if isinstance(value, dict):
+            tag = b'{'
+            items = value.items()
+        elif isinstance(value, list):
+            tag = b'['
+            items = enumerate(value)
+        else:
+            return value, hashlib.blake2b(_scalar_token(value), digest_size=DIGEST_SIZE).digest()
+
+        known = self._digests.get(id(value))
+        if known is not None:
+            return self._canonical[known], known
+
+        self.containers += 1
+        hasher = hashlib.blake2b(tag, digest_size=DIGEST_SIZE)
+        replacements = []
+        for key, child in items:
+            if tag == b'{':
+                hasher.update(_scalar_token(key))
+            if isinstance(child, (dict, list)):
+                canonical_child, child_digest = self._intern(child)
+                if canonical_child is not child:
+                    replacements.append((key, canonical_child))
+                hasher.update(b'#' + child_digest)
+            else:
+                hasher.update(_scalar_token(child))
+        for key, canonical_child in replacements:
+            value[key] = canonical_child
+
+        digest = hasher.digest()
+        canonical = self._canonical.setdefault(digest, value)
+        self._digests[id(value)] = digest
+        return canonical, digest
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get deduplication counters.
+
+        Returns:
+            Containers visited, unique containers kept and the share removed
+        """
+        unique = len(self._canonical)
+        return {
+            "containers": self.containers,
+            "unique": unique,
+            "dedup_ratio": round(1 - unique / self.containers, 4) if self.containers else 0.0
+        }
+
+
+def tree_digest(
+    value: Any,
+    refs: Optional[Set[str]] = None,
+    memo: Optional[Dict[int, Tuple[bytes, frozenset]]] = None
+) -> bytes:
+    """
+    Compute the structural (Merkle) hash of a tree without modifying it.
+
+    Args:
+        value: Tree of dicts, lists and scalars
+        refs: If given, every local '#/...' $ref found in the tree is added to it
+        memo: Digests and refs of containers already hashed, by id; pass the same
+              dict across calls to hash shared subtrees only once
+
+    Returns:
+        Digest bytes
+    """
+    if memo is None:
+        memo = {}
+
+    def visit(node: Any) -> Tuple[bytes, frozenset]:
+        if isinstance(node, dict):
+            tag = b'{'
+            items = node.items()
+        elif isinstance(node, list):
+            tag = b'['
+            items = enumerate(node)
+        else:
+            return hashlib.blake2b(_scalar_token(node), digest_size=DIGEST_SIZE).digest(), frozenset()
+
+        known = memo.get(id(node))
+        if known is not None:
+            return known
+
+        hasher = hashlib.blake2b(tag, digest_size=DIGEST_SIZE)
+        found = set()
+        for key, child in items:
+            if tag == b'{':
+                hasher.update(_scalar_token(key))
+                if key == '$ref' and isinstance(child, str) and child.startswith('#/'):
+                    found.add(child)
+            if isinstance(child, (dict, list)):
+                child_digest, child_refs = visit(child)
+                found.update(child_refs)
+                hasher.update(b'#' + child_digest)
+            else:
+                hasher.update(_scalar_token(child))
+
+        result = (hasher.digest(), frozenset(found))
+        memo[id(node)] = result
+        return result
+
+    digest, found = visit(value)
+    if refs is not None:
+        refs.update(found)
+    return digest
+
+
+def fold_repeats(value: Any, min_nodes: int = MIN_FOLD_NODES) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Replace subtrees that occur more than once with references by hash.
+
+    Every repeated subtree of at least min_nodes nodes is emitted once in
+    the returned map and replaced by {"x-shared": "<hash>"} wherever it
+    occurs, including inside other shared subtrees.
+
+    Args:
+        value: Plain tree, typically a resolved response payload
+        min_nodes: Smallest subtree size worth folding
+
+    Returns:
+        Tuple of (folded tree, shared subtrees by hash)
+    """
+    counts: Dict[bytes, int] = {}
+    sizes: Dict[bytes, int] = {}
+    digests: Dict[int, bytes] = {}
+
+    def measure(node: Any) -> Tuple[bytes, int]:
+        if isinstance(node, dict):
+            hasher = hashlib.blake2b(b'{', digest_size=DIGEST_SIZE)
+            size = 1
+            for key, child in node.items():
+                hasher.update(_scalar_token(key))
+                child_digest, child_size = measure(child)
+                hasher.update(b'#' + child_digest)
+                size += child_size
+        elif isinstance(node, list):
+            hasher = hashlib.blake2b(b'[', digest_size=DIGEST_SIZE)
+            size = 1
+            for child in node:
+                child_digest, child_size = measure(child)
+                hasher.update(b'#' + child_digest)
+                size += child_size
+        else:
+            return hashlib.blake2b(_scalar_token(node), digest_size=DIGEST_SIZE).digest(), 1
+
+        digest = hasher.digest()
+        digests[id(node)] = digest
+        counts[digest] = counts.get(digest, 0) + 1
+        sizes[digest] = size
+        return digest, size
+
+    measure(value)
+    shared: Dict[str, Any] = {}
+
+    def fold(node: Any, is_root: bool = False) -> Any:
+        if not isinstance(node, (dict, list)):
+            return node
+        digest = digests[id(node)]
+        if not is_root and counts[digest] > 1 and sizes[digest] >= min_nodes:
+            key = digest.hex()
+            if key not in shared:
+                shared[key] = None
+                shared[key] = fold(node, is_root=True)
+            return {"x-shared": key}
+        if isinstance(node, dict):
+            return {k: fold(v) for k, v in node.items()}
+        return [fold(item) for item in node]
+
+    return fold(value, is_root=True), shared
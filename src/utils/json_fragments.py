@@ -0,0 +1,239 @@
+"""
+Pre-serialized JSON fragments and the response encoder that splices them
+"""
+
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Any, Callable, Optional, Tuple
+from src.config import FRAGMENT_CACHE_BYTES
+
+try:
+    import orjson
+except ImportError:  # Optional faster encoder
+    orjson = None
+
+
+# Stands in for a fragment while the rest of a response is encoded; the
+# random token keeps document strings from ever matching it
+_PLACEHOLDER_TOKEN = 'fragment-' + secrets.token_hex(8) + '-'
+_PLACEHOLDER = '\x00' + _PLACEHOLDER_TOKEN + '{}\x00'
+# How both encoders write a placeholder's opening: quote, escaped NUL, token
+_PLACEHOLDER_START = b'"\\u0000' + _PLACEHOLDER_TOKEN.encode()
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value as compact JSON, with orjson when it is installed.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the standard encoder handles them
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode()
+
+
+class Fragment(dict):
+    """
+    A dict that carries its own serialized JSON.
+
+    It behaves like the dict it was built from, and encode_response()
+    splices its bytes into the response instead of encoding it again.
+    Like everything read from storage, it must not be modified.
+    """
+
+    __slots__ = ('json',)
+
+    def __init__(self, value: Mapping, encoded: Optional[bytes] = None):
+        super().__init__(value)
+        self.json = encoded if encoded is not None else dumps(self)
+
+
+def merge(*parts: Mapping) -> Fragment:
+    """
+    Combine the members of several objects into one fragment.
+
+    Fragments contribute their serialized members as they are; plain dicts
+    are encoded. Later parts win for duplicate keys, as with {**a, **b}.
+
+    Args:
+        parts: Objects whose members are concatenated in order
+
+    Returns:
+        Fragment of the combined object
+    """
+    merged: Dict[str, Any] = {}
+    members = []
+    for part in parts:
+        merged.update(part)
+        encoded = part.json if isinstance(part, Fragment) else dumps(part)
+        if len(encoded) > 2:
+            members.append(encoded[1:-1])
+    return Fragment(merged, b'{' + b','.join(members) + b'}')
+
+
+def encode_response(value: Any) -> bytes:
+    """
+    Encode a response, splicing in the bytes of every fragment it contains.
+
+    Only the containers around fragments are walked; fragments themselves
+    are replaced by placeholders, the small remainder is encoded in one
+    call, and the placeholders are then swapped for the fragment bytes.
+
+    Args:
+        value: Response dict, possibly holding Fragment values
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if isinstance(value, Fragment):
+        return value.json
+
+    fragments = []
+
+    def substitute(node: Any) -> Any:
+        if isinstance(node, Fragment):
+            fragments.append(node.json)
+            return _PLACEHOLDER.format(len(fragments) - 1)
+        if isinstance(node, dict):
+            replaced = {key: substitute(child) for key, child in node.items()}
+            return replaced if any(replaced[key] is not node[key] for key in node) else node
+        if isinstance(node, list):
+            replaced = [substitute(child) for child in node]
+            return replaced if any(new is not old for new, old in zip(replaced, node)) else node
+        return node
+
+    skeleton = substitute(value)
+    encoded = dumps(skeleton)
+    if not fragments:
+        return encoded
+
+    pieces = encoded.split(_PLACEHOLDER_START)
+    result = [pieces[0]]
+    for piece in pieces[1:]:
+        index, rest = piece.split(b'\\u0000"', 1)
+        result.append(fragments[int(index)])
+        result.append(rest)
+    return b''.join(result)
+
+
+class FragmentCache:
+    """
+    LRU cache of serialized document subtrees.
+
+    Entries are keyed by (API name, document generation, JSON pointer).
+    Storage never reuses a generation for an API, even after it is removed
+    and loaded again (local storage and the shared backends all number
+    generations from a catalog-wide sequence), so a reload never serves
+    bytes of an older document; entries of old generations simply age out.
+    Resolved views of a subtree are cached separately from the stored subtree.
+    """
+
+    def __init__(self, max_bytes: int = FRAGMENT_CACHE_BYTES):
+        """
+        Initialize FragmentCache.
+
+        Args:
+            max_bytes: Total size of cached serialized bytes (0 disables the cache)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, str, bool], Fragment]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        name: str,
+        generation: int,
+        pointer: str,
+        build: Callable[[], Any],
+        resolved: bool = False
+    ) -> Any:
+        """
+        Get the fragment of a subtree, building and encoding it on a miss.
+
+        Args:
+            name: API name
+            generation: Document generation the subtree belongs to
+            pointer: JSON pointer of the subtree, e.g. #/components/schemas/Pet
+            build: Returns the plain subtree (called on a miss only)
+            resolved: Whether build returns the subtree with references resolved
+
+        Returns:
+            Fragment of the subtree, or the built value itself if it is not an object
+        """
+        if self.max_bytes <= 0:
+            return build()
+
+        fragment = self.lookup(name, generation, pointer, resolved)
+        if fragment is not None:
+            return fragment
+
+        key = (name, generation, pointer, resolved)
+        value = build()
+        if not isinstance(value, Mapping):
+            return value
+
+        fragment = value if isinstance(value, Fragment) else Fragment(value)
+        size = len(fragment.json)
+        with self._lock:
+            self.misses += 1
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = fragment
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= len(evicted.json)
+        return fragment
+
+    def lookup(self, name: str, generation: int, pointer: str, resolved: bool = False) -> Optional[Fragment]:
+        """
+        Get a cached fragment without building it on a miss.
+
+        Args:
+            name: API name
+            generation: Document generation the subtree belongs to
+            pointer: JSON pointer of the subtree
+            resolved: Whether to look up the resolved view of the subtree
+
+        Returns:
+            Cached fragment, or None if it is not cached
+        """
+        key = (name, generation, pointer, resolved)
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return fragment
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage and hit rate.
+
+        Returns:
+            Budget, cached bytes and entries, hits, misses (fragments encoded) and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "encoder": "orjson" if orjson is not None else "json",
+                "max_bytes": self.max_bytes,
+                "cached_bytes": self._bytes,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
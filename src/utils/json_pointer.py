@@ -0,0 +1,118 @@
+"""
+JSON Pointer (RFC 6901) helpers
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, List
+from urllib.parse import unquote
+
+
+def unescape_token(token: str) -> str:
+    """
+    Decode one reference token ('~1' -> '/', then '~0' -> '~').
+
+    Args:
+        token: Escaped token
+
+    Returns:
+        Unescaped token
+    """
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def escape_token(token: str) -> str:
+    """
+    Encode one reference token ('~' -> '~0', '/' -> '~1').
+
+    Args:
+        token: Raw token
+
+    Returns:
+        Escaped token
+    """
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def split_pointer(pointer: str) -> List[str]:
+    """
+    Split a pointer or URI fragment into unescaped tokens.
+
+    Accepts '#/a/b', '/a/b' and '' (the whole document). Fragments are
+    percent-decoded first, as URI fragment pointers require.
+
+    Args:
+        pointer: JSON pointer
+
+    Returns:
+        List of tokens
+
+    Raises:
+        ValueError: If the pointer is not empty and does not start with '/'
+    """
+    if pointer.startswith('#'):
+        pointer = unquote(pointer[1:])
+    if not pointer:
+        return []
+    if not pointer.startswith('/'):
+        raise ValueError(f"Invalid JSON pointer: {pointer}")
+    return [unescape_token(token) for token in pointer[1:].split('/')]
+
+
+def join_pointer(tokens: List[str]) -> str:
+    """
+    Build a '#/...' fragment pointer from raw tokens.
+
+    Args:
+        tokens: Unescaped tokens
+
+    Returns:
+        Fragment pointer
+    """
+    return '#' + ''.join('/' + escape_token(str(token)) for token in tokens)
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """
+    Walk a document along a pointer.
+
+    Args:
+        document: Root object
+        pointer: JSON pointer or URI fragment
+
+    Returns:
+        The referenced node
+
+    Raises:
+        KeyError: If the pointer does not exist in the document
+    """
+    return resolve_tokens(document, split_pointer(pointer))
+
+
+def resolve_tokens(document: Any, tokens: Sequence) -> Any:
+    """
+    Walk a document along already unescaped pointer tokens.
+
+    Args:
+        document: Root object
+        tokens: Path tokens, as returned by split_pointer()
+
+    Returns:
+        The referenced node
+
+    Raises:
+        KeyError: If the path does not exist in the document
+    """
+    node = document
+    for token in tokens:
+        if isinstance(node, Mapping):
+            if token not in node:
+                raise KeyError(join_pointer(list(tokens)))
+            node = node[token]
+        elif isinstance(node, Sequence) and not isinstance(node, str):
+            try:
+                node = node[int(token)]
+            except (ValueError, IndexError):
+                raise KeyError(join_pointer(list(tokens)))
+        else:
+            raise KeyError(join_pointer(list(tokens)))
+    return node
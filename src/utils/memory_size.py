@@ -0,0 +1,61 @@
+"""
+Sampled estimate of the memory held by a JSON-like tree
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, List, Tuple
+from src.config import MEMORY_SAMPLE_CHILDREN
+
+
+def estimate_memory_bytes(value: Any, sample_children: int = MEMORY_SAMPLE_CHILDREN) -> int:
+    """
+    Estimate the bytes of Python objects reachable from a dict/list tree.
+
+    Every object is counted once, so subtrees shared by hash-consing are
+    not counted twice. Containers with more than sample_children children
+    are measured on evenly spaced children and scaled up, which keeps the
+    cost independent of the document's size.
+
+    Args:
+        value: Root of the tree
+        sample_children: Children measured per container (0 measures all)
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen = set()
+    total = 0.0
+    # (object, how many objects like it it stands for)
+    stack: List[Tuple[Any, float]] = [(value, 1.0)]
+    while stack:
+        node, weight = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        total += sys.getsizeof(node) * weight
+
+        if isinstance(node, Mapping):
+            children = list(node.items())
+        elif isinstance(node, (list, tuple)):
+            children = list(node)
+        else:
+            continue
+        if not children:
+            continue
+
+        if sample_children and len(children) > sample_children:
+            step = len(children) / sample_children
+            sample = [children[int(i * step)] for i in range(sample_children)]
+            child_weight = weight * len(children) / len(sample)
+        else:
+            sample = children
+            child_weight = weight
+
+        for child in sample:
+            if isinstance(node, Mapping):
+                stack.append((child[0], child_weight))
+                stack.append((child[1], child_weight))
+            else:
+                stack.append((child, child_weight))
+    return int(total)
@@ -0,0 +1,324 @@
+"""
+Regex and glob patterns compiled for prefiltered search
+"""
+
+import re
+import functools
+from typing import Any, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+from src.config import NGRAM_SIZE, PATTERN_CACHE_SIZE, MAX_PATTERN_LENGTH, MAX_AMBIGUOUS_REPEATS
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _compiler as sre_compile
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_compile
+    import sre_constants
+
+try:
+    import regex as timed_regex
+except ImportError:  # Optional: matching under a time limit
+    timed_regex = None
+
+
+_REPEATS = tuple(
+    getattr(sre_constants, op) for op in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+    if hasattr(sre_constants, op)
+)
+_POSSESSIVE = getattr(sre_constants, 'POSSESSIVE_REPEAT', None)
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_SINGLE_CHARACTER = (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN)
+
+# Characters sampled to decide whether two character sets overlap
+_SAMPLE_CHARACTERS = [chr(code) for code in range(0x250)]
+
+
+class PatternError(ValueError):
+    """Raised for patterns that do not compile or could backtrack catastrophically."""
+
+
+class CompiledPattern(NamedTuple):
+    """A compiled pattern and the literal fragments every match contains."""
+
+    # Compiled with the `regex` package when it is installed, else with re
+    regex: Any
+    # Lowercased, at least NGRAM_SIZE characters long
+    literals: Tuple[str, ...]
+
+    def search(self, text: str, timeout: Optional[float] = None) -> bool:
+        """
+        Check whether the pattern matches anywhere in a string.
+
+        Args:
+            text: String to search
+            timeout: Seconds the match may run; only enforced when the
+                     `regex` package is installed (optional)
+
+        Returns:
+            True if the pattern matches
+
+        Raises:
+            TimeoutError: If the match ran longer than timeout
+        """
+        if timeout is not None and timed_regex is not None:
+            return self.regex.search(text, timeout=timeout) is not None
+        return self.regex.search(text) is not None
+
+
+def glob_to_regex(glob: str) -> str:
+    """
+    Translate a glob into an anchored regular expression.
+
+    "*" matches within one path segment, "**" across segments and "?" one
+    character other than "/". Everything else is literal, including the
+    braces of path templates such as {id}.
+
+    Args:
+        glob: Glob pattern, e.g. /v*/accounts/{id}/*
+
+    Returns:
+        Regular expression matching whole strings
+    """
+    parts = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif glob[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif glob[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        else:
+            parts.append(re.escape(glob[i]))
+            i += 1
+    return r'\A' + ''.join(parts) + r'\Z'
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, syntax: str = 'regex', ignore_case: bool = False) -> CompiledPattern:
+    """
+    Compile a regex or glob pattern for search, caching the result.
+
+    Args:
+        pattern: Regular expression (matched anywhere) or glob (matched in full)
+        syntax: "regex" or "glob"
+        ignore_case: Match case-insensitively
+
+    Returns:
+        Compiled pattern with its required literal fragments
+
+    Raises:
+        PatternError: If the pattern is too long, invalid, uses nested
+                      repetition or backreferences, or chains quantifiers
+                      over overlapping characters
+    """
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise PatternError(f"longer than {MAX_PATTERN_LENGTH} characters")
+
+    source = glob_to_regex(pattern) if syntax == 'glob' else pattern
+    flags = re.IGNORECASE if ignore_case else 0
+    try:
+        parsed = sre_parse.parse(source, flags)
+    except re.error as e:
+        raise PatternError(str(e)) from None
+
+    _check_backtracking(list(parsed))
+    _check_ambiguity(list(parsed), parsed.state)
+    literals = {
+        run.lower() for run in _required_literals(list(parsed))
+        if len(run) >= NGRAM_SIZE
+    }
+    if timed_regex is not None:
+        compiled = timed_regex.compile(source, timed_regex.IGNORECASE if ignore_case else 0)
+    else:
+        compiled = re.compile(source, flags)
+    return CompiledPattern(compiled, tuple(sorted(literals)))
+
+
+def _check_backtracking(items: List[Tuple], repeated: bool = False) -> None:
+    """
+    Reject constructs that make the backtracking matcher take exponential time.
+
+    These are backreferences, and quantifiers or alternations nested inside
+    another quantifier, as in (a+)+ or (a|ab)*. A possessive outer quantifier
+    (++, *+) never backtracks into its body and is allowed.
+
+    Args:
+        items: Parsed pattern sequence
+        repeated: Whether the sequence sits inside a backtracking quantifier
+    """
+    for op, av in items:
+        if op in (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS):
+            raise PatternError("backreferences are not supported")
+        if op in _REPEATS:
+            _, high, body = av
+            if repeated and high > 1:
+                raise PatternError(
+                    "nested quantifiers such as (a+)+ can take exponential time; "
+                    "simplify the pattern or make the outer quantifier possessive (++)"
+                )
+            _check_backtracking(list(body), repeated or (high > 1 and op != _POSSESSIVE))
+        elif op == sre_constants.BRANCH:
+            if repeated:
+                raise PatternError(
+                    "alternation inside a quantifier such as (a|ab)* can take exponential time; "
+                    "simplify the pattern or make the quantifier possessive (*+)"
+                )
+            for alternative in av[1]:
+                _check_backtracking(list(alternative), repeated)
+        elif op == sre_constants.SUBPATTERN:
+            _check_backtracking(list(av[-1]), repeated)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _check_backtracking(list(av[1]), repeated)
+        elif op == _ATOMIC_GROUP:
+            _check_backtracking(list(av), repeated)
+
+
+def _check_ambiguity(items: List[Tuple], state: Any) -> None:
+    """
+    Reject chains of quantifiers that can split the same text in many ways.
+
+    Two backtracking quantifiers are ambiguous when the first can also
+    match what the second matches, and everything between them: in
+    .*a.*a the first .* can take any of the a's. A failing match then
+    tries every split, so each ambiguous quantifier in a chain multiplies
+    the work by the text length. Chains longer than MAX_AMBIGUOUS_REPEATS
+    are rejected, as are quantifiers directly following one over
+    overlapping characters (\\w*\\w*), which never add anything.
+
+    Args:
+        items: Parsed pattern sequence
+        state: Parser state of the whole pattern (flags and groups)
+    """
+    # (characters, chain length) of quantifiers that can still absorb the text so far
+    live: List[Tuple[Optional[FrozenSet[str]], int]] = []
+    after_repeat = False
+
+    for is_repeat, optional, characters in _sequence_tokens(items, state):
+        if is_repeat:
+            if after_repeat and _overlap(live[-1][0], characters):
+                raise PatternError(
+                    "adjacent quantifiers over the same characters, such as \\w*\\w*, "
+                    "can take polynomial time; merge them into one"
+                )
+            chain = 1 + max((length for chars, length in live if _overlap(chars, characters)), default=0)
+            if chain > MAX_AMBIGUOUS_REPEATS:
+                raise PatternError(
+                    f"more than {MAX_AMBIGUOUS_REPEATS} quantifiers over overlapping characters, "
+                    "as in .*a.*a.*a, can take polynomial time; use fewer, or narrower "
+                    "classes such as [^/]* instead of .*"
+                )
+        if not optional:
+            # Quantifiers that cannot match these characters stop competing here
+            live = [(chars, length) for chars, length in live if _overlap(chars, characters)]
+        if is_repeat:
+            live.append((characters, chain))
+        after_repeat = is_repeat
+
+
+def _sequence_tokens(items: List[Tuple], state: Any) -> Iterator[Tuple[bool, bool, Optional[FrozenSet[str]]]]:
+    """
+    Flatten a parsed sequence into (is backtracking quantifier, may match nothing, characters) tokens.
+
+    Groups are flattened in place; alternations, lookarounds and the bodies
+    of quantifiers are checked as sequences of their own. Characters are
+    None where any character may match.
+    """
+    for op, av in items:
+        if op == sre_constants.AT:
+            continue
+        if op == sre_constants.SUBPATTERN:
+            yield from _sequence_tokens(list(av[-1]), state)
+        elif op in _REPEATS:
+            low, high, body = av
+            body = list(body)
+            _check_ambiguity(body, state)
+            if high == low == 1:
+                yield from _sequence_tokens(body, state)
+            else:
+                # Fixed counts and possessive quantifiers never give characters back
+                backtracks = high != low and op != _POSSESSIVE
+                yield backtracks, low == 0, _characters(body, state)
+        elif op == sre_constants.BRANCH:
+            for alternative in av[1]:
+                _check_ambiguity(list(alternative), state)
+            yield False, False, None
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _check_ambiguity(list(av[1]), state)
+        elif op == _ATOMIC_GROUP:
+            _check_ambiguity(list(av), state)
+            yield False, False, None
+        else:
+            yield False, False, _characters([(op, av)], state)
+
+
+def _characters(items: List[Tuple], state: Any) -> Optional[FrozenSet[str]]:
+    """
+    Get the characters a single-character item matches.
+
+    Returns:
+        Matched characters among a sample, or None for anything longer than one character
+    """
+    if len(items) != 1 or items[0][0] not in _SINGLE_CHARACTER:
+        return None
+    code = sre_compile.compile(sre_parse.SubPattern(state, items), state.flags)
+    return frozenset(c for c in _SAMPLE_CHARACTERS if code.fullmatch(c))
+
+
+def _overlap(first: Optional[FrozenSet[str]], second: Optional[FrozenSet[str]]) -> bool:
+    """Whether two character sets (None: any character) share a character."""
+    if first is None or second is None:
+        return True
+    return not first.isdisjoint(second)
+
+
+def _required_literals(items: List[Tuple]) -> List[str]:
+    """
+    Collect the literal runs that every match of a parsed sequence contains.
+
+    Only mandatory parts contribute: groups, and quantified parts repeated
+    at least once. Alternations, character classes and optional parts end
+    the current run.
+
+    Args:
+        items: Parsed pattern sequence
+
+    Returns:
+        Literal runs, in pattern order
+    """
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append(''.join(current))
+            current.clear()
+
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            current.append(chr(av))
+        elif op == sre_constants.AT:
+            # Anchors match no characters, so they do not split a run
+            continue
+        elif op == sre_constants.SUBPATTERN:
+            body = list(av[-1])
+            if body and all(sub_op == sre_constants.LITERAL for sub_op, _ in body):
+                # A group of plain characters continues the current run
+                current.extend(chr(sub_av) for _, sub_av in body)
+            else:
+                flush()
+                runs.extend(_required_literals(body))
+        elif op in _REPEATS and av[0] >= 1:
+            flush()
+            runs.extend(_required_literals(list(av[2])))
+        elif op == _ATOMIC_GROUP:
+            flush()
+            runs.extend(_required_literals(list(av)))
+        else:
+            flush()
+    flush()
+    return runs
@@ -0,0 +1,83 @@
+"""
+Field projection for operation payloads
+"""
+
+from fnmatch import fnmatchcase
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Union
+from src.config import PROJECTION_LEVELS
+from src.utils.compiled_tree import materialize
+
+# A projection maps field patterns to True (whole subtree) or a nested projection
+Projection = Dict[str, Union[bool, 'Projection']]
+
+
+def build_projection(level: Optional[str] = None, fields: Optional[List[str]] = None) -> Optional[Projection]:
+    """
+    Build a projection from a named level and/or a field list.
+
+    Args:
+        level: Name of a level in PROJECTION_LEVELS; without one, only the
+               given fields are selected (or everything if there are none)
+        fields: Dotted field paths like "parameters" or "responses.200",
+                added to the level's fields (optional)
+
+    Returns:
+        Projection tree, or None to select everything
+
+    Raises:
+        ValueError: If the level is unknown
+    """
+    if level is None:
+        level_fields = [] if fields else None
+    elif level in PROJECTION_LEVELS:
+        level_fields = PROJECTION_LEVELS[level]
+    else:
+        raise ValueError(level)
+
+    if level_fields is None:
+        return None
+
+    projection: Projection = {}
+    for field in list(level_fields) + list(fields or []):
+        parts = field.split('.')
+        node = projection
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[parts[-1]] = True
+
+    return projection
+
+
+def project(node: Any, projection: Optional[Projection]) -> Any:
+    """
+    Select the projected fields of a stored node.
+
+    Only selected subtrees are visited, and they are decoded (compiled
+    views) but not copied; unselected subtrees are never touched. The
+    result shares plain containers with storage, so it must not be mutated.
+
+    Args:
+        node: Stored operation or sub-node
+        projection: Tree from build_projection(), or None for everything
+
+    Returns:
+        New dict holding only the selected fields
+    """
+    if projection is None:
+        return materialize(node)
+    # Cannot see through lists or unresolved references; keep them whole
+    if not isinstance(node, Mapping) or '$ref' in node:
+        return materialize(node)
+
+    result = {}
+    for key, value in node.items():
+        for pattern, sub_projection in projection.items():
+            if key == pattern or fnmatchcase(key, pattern):
+                result[key] = materialize(value) if sub_projection is True else project(value, sub_projection)
+                break
+    return result
@@ -2,33 +2,59 @@
 Reference resolver for OpenAPI $ref references
 """
 
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, Set, Optional, List, Tuple
 import copy
+from src.utils.compiled_tree import CompiledMapping, CompiledSequence
+from src.utils.json_pointer import split_pointer, resolve_tokens
+from src.execution import check_deadline
+
+# Refs with this prefix point at schemas, which resolve_many shares between results
+SCHEMA_POINTER_PREFIX = '#/components/schemas/'
+
+
+def _detached_copy(obj: Any) -> Any:
+    """
+    Copy a node out of a stored document so it can be modified.
+
+    Compiled views are decoded into fresh plain objects; anything else is deep-copied.
+    """
+    if isinstance(obj, (CompiledMapping, CompiledSequence)):
+        return obj.materialize()
+    return copy.deepcopy(obj)
 
 
 class RefResolver:
     """
     Resolves $ref references in OpenAPI documents.
 
-    This class recursively resolves JSON Schema $ref references (e.g., "#/components/schemas/User")
-    and replaces them with the actual schema definitions.
+    This class recursively resolves local $ref references of any kind (e.g.,
+    "#/components/schemas/User", "#/components/parameters/Limit") and
+    replaces them with the referenced definitions.
+    Targets are looked up in the document's precompiled pointer table when
+    one is given, so pointers are only parsed for refs outside the table.
     """
 
-    def __init__(self, document: Dict[str, Any]):
+    def __init__(self, document: Dict[str, Any], pointer_table: Optional[Dict[str, List[str]]] = None):
         """
         Initialize RefResolver with an OpenAPI document.
 
         Args:
-            document: Complete OpenAPI document containing components/schemas or definitions
+            document: Complete OpenAPI document
+            pointer_table: Pointer -> path tokens table built by PointerIndexer (optional)
         """
         self.document = document
-        # OpenAPI 3.x uses components/schemas
-        self.components = document.get('components', {})
-        self.schemas = self.components.get('schemas', {})
-        # Swagger 2.0 uses definitions
-        self.definitions = document.get('definitions', {})
-
-    def resolve(self, obj: Any, max_depth: int = 10, _current_depth: int = 0, _resolving: Optional[Set[str]] = None) -> Any:
+        self.pointer_table = pointer_table if pointer_table is not None else {}
+        self._targets: Dict[str, Any] = {}
+        self._pending_definitions: List[str] = []
+
+    def resolve(
+        self,
+        obj: Any,
+        max_depth: int = 10,
+        _current_depth: int = 0,
+        _resolving: Optional[Set[str]] = None,
+        definitions: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """
         Recursively resolve all $ref references in an object.
 
@@ -37,6 +63,8 @@ class RefResolver:
             max_depth: Maximum recursion depth to prevent infinite loops
             _current_depth: Current recursion depth (internal use)
             _resolving: Set of refs currently being resolved to detect cycles (internal use)
+            definitions: If given, schema refs are kept and their pointers recorded here
+                         instead of being expanded inline (see resolve_many)
 
         Returns:
             Object with all $ref references resolved
@@ -56,7 +84,7 @@ class RefResolver:
         # Handle lists
         if isinstance(obj, list):
             return [
-                self.resolve(item, max_depth, _current_depth + 1, _resolving)
+                self.resolve(item, max_depth, _current_depth + 1, _resolving, definitions)
                 for item in obj
             ]
 
@@ -64,78 +92,102 @@ class RefResolver:
         if isinstance(obj, dict):
             # Check if this is a $ref
             if '$ref' in obj:
+                # Stop here if the request running this resolution timed out
+                check_deadline()
+
                 ref_path = obj['$ref']
-                schema_name = None
-                schema_dict = None
-
-                # Handle OpenAPI 3.x format: #/components/schemas/SchemaName
-                if ref_path.startswith('#/components/schemas/'):
-                    schema_name = ref_path.split('/')[-1]
-                    schema_dict = self.schemas
-                # Handle Swagger 2.0 format: #/definitions/SchemaName
-                elif ref_path.startswith('#/definitions/'):
-                    schema_name = ref_path.split('/')[-1]
-                    schema_dict = self.definitions
-
-                # If we found a schema reference to resolve
-                if schema_name and schema_dict:
-                    # Detect circular reference
-                    if ref_path in _resolving:
-                        # Return a placeholder to prevent infinite recursion
-                        return {
-                            'x-ref-circular': ref_path,
-                            'description': f'Circular reference to {schema_name}'
-                        }
-
-                    # Check if schema exists
-                    if schema_name in schema_dict:
-                        # Mark this ref as being resolved
-                        _resolving.add(ref_path)
-
-                        # Get the schema and resolve it recursively
-                        schema = copy.deepcopy(schema_dict[schema_name])
-                        resolved_schema = self.resolve(schema, max_depth, _current_depth + 1, _resolving)
-
-                        # Unmark this ref
-                        _resolving.discard(ref_path)
-
-                        # Merge sibling properties from the original object (OpenAPI 3.1+ compatibility)
-                        # Properties alongside $ref like description, example, nullable, etc.
-                        if isinstance(resolved_schema, dict):
-                            # Add metadata about the original reference
-                            resolved_schema['x-ref-original'] = ref_path
-
-                            # Merge all properties from original object except $ref itself
-                            for key, value in obj.items():
-                                if key != '$ref' and key not in resolved_schema:
-                                    # Only add if not already in resolved schema to avoid overwriting
-                                    resolved_schema[key] = copy.deepcopy(value)
-
-                        return resolved_schema
-                    else:
-                        # Schema not found, keep the reference
-                        return obj
-                else:
-                    # Non-schema reference (e.g., parameters, responses), keep as-is
+
+                try:
+                    target = self.lookup(ref_path)
+                except (KeyError, ValueError):
+                    # External, malformed or dangling reference, keep as-is
+                    return obj
+
+                # Shared schemas are emitted once by resolve_many
+                if definitions is not None and ref_path.startswith(SCHEMA_POINTER_PREFIX):
+                    if ref_path not in definitions:
+                        definitions[ref_path] = None
+                        self._pending_definitions.append(ref_path)
                     return obj
 
+                # Detect circular reference
+                if ref_path in _resolving:
+                    # Return a placeholder to prevent infinite recursion
+                    return {
+                        'x-ref-circular': ref_path,
+                        'description': f'Circular reference to {split_pointer(ref_path)[-1]}'
+                    }
+
+                # Mark this ref as being resolved
+                _resolving.add(ref_path)
+
+                # Get the target and resolve it recursively
+                resolved_schema = self.resolve(_detached_copy(target), max_depth, _current_depth + 1, _resolving, definitions)
+
+                # Unmark this ref
+                _resolving.discard(ref_path)
+
+                # Merge sibling properties from the original object (OpenAPI 3.1+ compatibility)
+                # Properties alongside $ref like description, example, nullable, etc.
+                if isinstance(resolved_schema, dict):
+                    # Add metadata about the original reference
+                    resolved_schema['x-ref-original'] = ref_path
+
+                    # Merge all properties from original object except $ref itself
+                    for key, value in obj.items():
+                        if key != '$ref' and key not in resolved_schema:
+                            # Only add if not already in resolved schema to avoid overwriting
+                            resolved_schema[key] = copy.deepcopy(value)
+
+                return resolved_schema
+
             # Not a $ref, recursively resolve all values
             result = {}
             for key, value in obj.items():
-                result[key] = self.resolve(value, max_depth, _current_depth + 1, _resolving)
+                result[key] = self.resolve(value, max_depth, _current_depth + 1, _resolving, definitions)
             return result
 
         # Unknown type, return as-is
         return obj
 
+    def lookup(self, pointer: str) -> Any:
+        """
+        Get the node a local pointer refers to.
+
+        Args:
+            pointer: Local pointer like "#/components/responses/NotFound"
+
+        Returns:
+            Referenced node (not copied)
+
+        Raises:
+            KeyError: If the pointer does not exist in the document
+            ValueError: If the pointer is not a local JSON pointer
+        """
+        if not isinstance(pointer, str) or not pointer.startswith('#/'):
+            raise ValueError(f"Not a local JSON pointer: {pointer}")
+
+        target = self._targets.get(pointer)
+        if target is not None:
+            return target
+
+        tokens = self.pointer_table.get(pointer)
+        if tokens is None:
+            tokens = split_pointer(pointer)
+
+        target = resolve_tokens(self.document, tokens)
+        self._targets[pointer] = target
+        return target
+
     def resolve_operation(self, operation: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Resolve all schema references in an operation object.
+        Resolve all references in an operation object.
 
         This is a convenience method that resolves references in:
-        - requestBody.content.*.schema
-        - responses.*.content.*.schema
-        - parameters[].schema
+        - parameters[] and parameters[].schema
+        - requestBody and requestBody.content.*.schema
+        - responses.* and responses.*.content.*.schema
+        - headers, examples and links
 
         Args:
             operation: OpenAPI operation object
@@ -143,4 +195,36 @@ class RefResolver:
         Returns:
             Operation object with all schema references resolved
         """
-        return self.resolve(copy.deepcopy(operation))
+        return self.resolve(_detached_copy(operation))
+
+    def resolve_many(self, objs: List[Any], max_depth: int = 10) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Resolve several objects in one pass, sharing schema definitions.
+
+        Parameters, responses, request bodies and other non-schema refs are
+        expanded inline as in resolve(). Schema refs are kept as $ref, and
+        every referenced schema is resolved exactly once into a definitions
+        map keyed by its pointer, so schemas shared between objects (or
+        referenced recursively) are emitted once.
+
+        Args:
+            objs: Objects to resolve (typically operations)
+            max_depth: Maximum recursion depth per object and per definition
+
+        Returns:
+            Tuple of (resolved objects, definitions by pointer)
+        """
+        definitions: Dict[str, Any] = {}
+        self._pending_definitions = []
+
+        resolved = [
+            self.resolve(_detached_copy(obj), max_depth, definitions=definitions)
+            for obj in objs
+        ]
+
+        while self._pending_definitions:
+            pointer = self._pending_definitions.pop()
+            target = _detached_copy(self.lookup(pointer))
+            definitions[pointer] = self.resolve(target, max_depth, definitions=definitions)
+
+        return resolved, dict(sorted(definitions.items()))
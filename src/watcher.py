@@ -0,0 +1,66 @@
+"""
+Polling watcher that reloads local files when they change
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Optional
+from src.config import FILE_WATCH_INTERVAL
+from src.services.api_service import ApiService
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileWatcher:
+    """
+    Periodically reloads the local files and directories loaded through an ApiService.
+
+    Each poll only stats the watched files; files whose modification time
+    or size changed are hashed, and only those whose content changed are
+    parsed again (see ApiService.refresh_files). Polling runs on its own
+    thread and event loop.
+    """
+
+    def __init__(self, api_service: ApiService, interval: float = FILE_WATCH_INTERVAL):
+        """
+        Initialize FileWatcher.
+
+        Args:
+            api_service: ApiService whose local sources are watched
+            interval: Seconds between two polls (0 disables watching)
+        """
+        self.api_service = api_service
+        self.interval = interval
+
+    def start(self) -> Optional[threading.Thread]:
+        """
+        Start polling in a background thread.
+
+        Returns:
+            The started daemon thread, or None if watching is disabled
+        """
+        if self.interval <= 0:
+            return None
+        thread = threading.Thread(target=asyncio.run, args=(self.run(),), name="file-watcher", daemon=True)
+        thread.start()
+        return thread
+
+    async def run(self) -> None:
+        """Poll the watched sources forever."""
+        while True:
+            await asyncio.sleep(self.interval)
+            started = time.perf_counter()
+            try:
+                result = await self.api_service.refresh_files()
+            except Exception:
+                logger.exception("Polling local files failed")
+                continue
+            if result["changed"]:
+                logger.info(
+                    "Reloaded changed files of %s in %.1f ms",
+                    ", ".join(f"'{name}'" for name in result["changed"]),
+                    (time.perf_counter() - started) * 1000
+                )
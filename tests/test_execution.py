@@ -0,0 +1,72 @@
+"""
+ToolExecutor admission control and slot release
+"""
+
+import asyncio
+import threading
+from src.execution import ToolExecutor
+
+
+def test_cancelled_waiters_release_their_slots():
+    async def scenario():
+        executor = ToolExecutor(max_workers=1, max_queue=8, timeout=0)
+        gate = threading.Event()
+
+        # Occupies the only worker until the gate opens
+        running = asyncio.create_task(executor.run('slow', gate.wait))
+        await asyncio.sleep(0.05)
+
+        # Each waiter takes its tool slot, then blocks on the worker; cancel it there
+        for _ in range(3):
+            waiter = asyncio.create_task(executor.run('fast', lambda: {"ok": True}))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+
+        gate.set()
+        await running
+
+        workers, slot = executor._semaphores('fast')
+        assert not workers.locked()
+        assert not slot.locked()
+        assert executor.stats()["waiting"] == 0
+        return await asyncio.wait_for(executor.run('fast', lambda: {"ok": True}), 1)
+
+    assert asyncio.run(scenario()) == {"ok": True}
+
+
+def test_deadline_while_waiting_releases_slots():
+    async def scenario():
+        executor = ToolExecutor(max_workers=1, max_queue=8, timeout=0.1)
+        gate = threading.Event()
+        running = asyncio.create_task(executor.run('slow', gate.wait))
+        await asyncio.sleep(0.02)
+
+        result = await executor.run('fast', lambda: {"ok": True})
+        assert result["error"] is True
+
+        # The slow call passed its deadline too, but holds the worker until its body returns
+        gate.set()
+        await running
+        await asyncio.sleep(0.05)
+        workers, slot = executor._semaphores('fast')
+        assert not workers.locked() and not slot.locked()
+        assert executor.stats()["timed_out"] >= 1
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_is_rejected():
+    async def scenario():
+        executor = ToolExecutor(max_workers=1, max_queue=0, timeout=0)
+        gate = threading.Event()
+        running = asyncio.create_task(executor.run('slow', gate.wait))
+        await asyncio.sleep(0.02)
+
+        result = await executor.run('fast', lambda: {"ok": True})
+        gate.set()
+        await running
+        return result
+
+    result = asyncio.run(scenario())
+    assert result["busy"] is True
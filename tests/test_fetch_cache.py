@@ -0,0 +1,72 @@
+"""
+FetchCache shared by loads running on several threads and event loops
+"""
+
+import asyncio
+import threading
+from src.loaders.fetch_cache import FetchCache
+
+
+class _Fetcher:
+    """Fetch function recording how many fetches run at once."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    async def __call__(self, url: str) -> dict:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            return {"url": url}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def test_concurrency_limit_holds_across_event_loops():
+    fetcher = _Fetcher()
+    cache = FetchCache(fetcher, max_entries=16, ttl=60, concurrency=3)
+    results = {}
+    errors = []
+
+    def load(thread: int) -> None:
+        async def fetch_all():
+            urls = [f"https://example.com/{thread}/{i}.json" for i in range(10)]
+            return await asyncio.gather(*(cache.get(url) for url in urls))
+        try:
+            results[thread] = asyncio.run(fetch_all())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=load, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert fetcher.peak <= 3
+    for thread, documents in results.items():
+        assert [d["url"] for d in documents] == [f"https://example.com/{thread}/{i}.json" for i in range(10)]
+    stats = cache.stats()
+    assert stats["entries"] == 16
+    assert stats["misses"] == 60
+
+
+def test_cancelled_waiters_do_not_hold_slots():
+    fetcher = _Fetcher()
+    cache = FetchCache(fetcher, max_entries=16, ttl=60, concurrency=1)
+
+    async def scenario():
+        first = asyncio.create_task(cache.get("https://example.com/a.json"))
+        waiter = asyncio.create_task(cache.get("https://example.com/b.json"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(first, waiter, return_exceptions=True)
+        return await asyncio.wait_for(cache.get("https://example.com/c.json"), 1)
+
+    assert asyncio.run(scenario()) == {"url": "https://example.com/c.json"}
@@ -0,0 +1,134 @@
+"""
+Generations must never repeat for an API, even after it is removed and loaded again
+"""
+
+import pytest
+from src.storage import OpenAPIStorage
+from src.backends.sqlite_backend import SQLiteBackend
+from src.backends.shared_catalog import SharedCatalogBackend
+
+
+def _document(title: str) -> dict:
+    return {
+        "info": {"title": title},
+        "paths": {"/pets": {"get": {"operationId": "listPets", "summary": title}}},
+        "raw": {"openapi": "3.0.3", "info": {"title": title}, "paths": {}}
+    }
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'shared'])
+def storage(request, tmp_path):
+    if request.param == 'sqlite':
+        return OpenAPIStorage(SQLiteBackend(str(tmp_path / 'catalog.db')), memory_budget_bytes=0)
+    if request.param == 'shared':
+        return OpenAPIStorage(SharedCatalogBackend(str(tmp_path / 'catalog')), memory_budget_bytes=0)
+    return OpenAPIStorage(memory_budget_bytes=0)
+
+
+def test_reload_after_remove_gets_a_new_generation(storage):
+    first = storage.add('petstore', _document('v1'))
+    assert storage.remove('petstore')
+    second = storage.add('petstore', _document('v2'))
+
+    assert second > first
+    snapshot = storage.snapshot('petstore')
+    assert snapshot.generation == second
+    assert snapshot.document['info']['title'] == 'v2'
+
+
+def test_generations_increase_across_apis(storage):
+    generations = [storage.add(name, _document(name)) for name in ('a', 'b', 'a', 'c')]
+    assert generations == sorted(set(generations))
+
+
+def test_sqlite_sequence_survives_reopening(tmp_path):
+    path = str(tmp_path / 'catalog.db')
+    storage = OpenAPIStorage(SQLiteBackend(path), memory_budget_bytes=0)
+    first = storage.add('petstore', _document('v1'))
+    storage.remove('petstore')
+
+    reopened = OpenAPIStorage(SQLiteBackend(path), memory_budget_bytes=0)
+    assert reopened.add('petstore', _document('v2')) > first
+
+
+def test_shared_catalog_is_seen_by_other_processes(tmp_path):
+    writer = OpenAPIStorage(SharedCatalogBackend(str(tmp_path / 'catalog')), memory_budget_bytes=0)
+    reader = OpenAPIStorage(SharedCatalogBackend(str(tmp_path / 'catalog')), memory_budget_bytes=0)
+
+    first = writer.add('petstore', _document('v1'))
+    assert reader.snapshot('petstore').generation == first
+
+    writer.remove('petstore')
+    assert reader.snapshot('petstore') is None
+    second = writer.add('petstore', _document('v2'))
+    snapshot = reader.snapshot('petstore')
+    assert snapshot.generation == second > first
+    assert snapshot.document['info']['title'] == 'v2'
+
+
+class RacingBackend:
+    """Wraps a backend and runs a write just before each pushed-down query."""
+
+    def __init__(self, backend, before_query):
+        self._backend = backend
+        self._before_query = before_query
+
+    def __getattr__(self, attr):
+        return getattr(self._backend, attr)
+
+    def _racing(self, method):
+        def query(*args):
+            self._before_query()
+            return method(*args)
+        return query
+
+    def search_operations(self, *args):
+        return self._racing(self._backend.search_operations)(*args)
+
+    def find_operations_by_tag(self, *args):
+        return self._racing(self._backend.find_operations_by_tag)(*args)
+
+    def get_schema(self, *args):
+        return self._racing(self._backend.get_schema)(*args)
+
+
+def _tagged_document(version: str) -> dict:
+    components = {"schemas": {"Pet": {"type": "object", "description": version}}}
+    return {
+        "info": {"title": version},
+        "paths": {f"/pets/{version}": {"get": {"operationId": "listPets", "summary": version, "tags": ["pets"]}}},
+        "components": components,
+        "raw": {"openapi": "3.0.3", "info": {"title": version}, "paths": {}, "components": components}
+    }
+
+
+def test_pushed_down_queries_report_the_generation_they_read(tmp_path):
+    from src.services.search_service import SearchService
+    from src.services.schema_service import SchemaService
+    from src.services.tag_service import TagService
+    from src.utils.json_fragments import FragmentCache
+
+    path = str(tmp_path / 'catalog.db')
+    writer = OpenAPIStorage(SQLiteBackend(path), memory_budget_bytes=0)
+    writer.add('petstore', _tagged_document('v1'))
+    versions = iter(f'v{i}' for i in range(2, 100))
+    reader = OpenAPIStorage(
+        RacingBackend(SQLiteBackend(path), lambda: writer.add('petstore', _tagged_document(next(versions)))),
+        memory_budget_bytes=0
+    )
+    fragments = FragmentCache(max_bytes=1 << 20)
+
+    def stored_generation(version):
+        return SQLiteBackend(path).catalog()['petstore']['generation'], version
+
+    result = SearchService(reader).search_endpoints('petstore', tag='pets')
+    assert (result["generation"], result["results"][0]["summary"]) == stored_generation('v2')
+
+    result = TagService(reader).get_endpoints_by_tag('petstore', 'pets')
+    assert (result["generation"], result["endpoints"][0]["summary"]) == stored_generation('v3')
+
+    result = SchemaService(reader, fragments).get_schema_details('petstore', 'Pet')
+    assert (result["generation"], result["description"]) == stored_generation('v4')
+    # Cached under the generation it was read from, not the one seen before the query
+    assert fragments.lookup('petstore', result["generation"], '#/components/schemas/Pet')["description"] == 'v4'
+    assert fragments.lookup('petstore', result["generation"] - 1, '#/components/schemas/Pet') is None
@@ -0,0 +1,82 @@
+"""
+FragmentCache must never serve bytes of a removed document for its replacement
+"""
+
+import json
+import pytest
+from src.storage import OpenAPIStorage
+from src.backends.sqlite_backend import SQLiteBackend
+from src.backends.shared_catalog import SharedCatalogBackend
+from src.services.schema_service import SchemaService
+from src.utils.json_fragments import FragmentCache
+
+
+def _document(description: str) -> dict:
+    components = {"schemas": {"Pet": {"type": "object", "description": description}}}
+    return {
+        "info": {"title": "Pets"},
+        "paths": {},
+        "components": components,
+        "raw": {"openapi": "3.0.3", "paths": {}, "components": components}
+    }
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'shared'])
+def storage(request, tmp_path):
+    if request.param == 'sqlite':
+        return OpenAPIStorage(SQLiteBackend(str(tmp_path / 'catalog.db')), memory_budget_bytes=0)
+    if request.param == 'shared':
+        return OpenAPIStorage(SharedCatalogBackend(str(tmp_path / 'catalog')), memory_budget_bytes=0)
+    return OpenAPIStorage(memory_budget_bytes=0)
+
+
+def test_reload_after_remove_is_not_served_from_cache(storage):
+    fragments = FragmentCache(max_bytes=1 << 20)
+    service = SchemaService(storage, fragments)
+
+    storage.add('petstore', _document('old'))
+    assert service.get_schema_details('petstore', 'Pet')["description"] == 'old'
+
+    storage.remove('petstore')
+    storage.add('petstore', _document('new'))
+    result = service.get_schema_details('petstore', 'Pet')
+
+    assert result["description"] == 'new'
+    assert json.loads(result.json)["description"] == 'new'
+    assert fragments.stats()["misses"] == 2
+
+
+def test_stats_report_hits():
+    fragments = FragmentCache(max_bytes=1 << 20)
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+    service = SchemaService(storage, fragments)
+    storage.add('petstore', _document('pet'))
+
+    for _ in range(3):
+        service.get_schema_details('petstore', 'Pet')
+
+    stats = fragments.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["cached_bytes"] > 0
+
+
+def test_query_tools_return_structured_content():
+    import asyncio
+    from fastmcp import FastMCP, Client
+    from src.execution import ToolExecutor
+    from src.services.path_service import PathService
+    from src.tools.query_tools import register_query_tools
+
+    fragments = FragmentCache(max_bytes=1 << 20)
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+    storage.add('petstore', _document('pet'))
+    mcp = FastMCP("test")
+    register_query_tools(mcp, PathService(storage, fragments=fragments), SchemaService(storage, fragments), ToolExecutor())
+
+    async def call():
+        async with Client(mcp) as client:
+            return await client.call_tool("get_schema_details", {"name": "petstore", "schema_name": "Pet"})
+
+    result = asyncio.run(call())
+    assert result.structured_content["description"] == 'pet'
+    assert result.structured_content == json.loads(result.content[0].text)
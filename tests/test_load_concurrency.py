@@ -0,0 +1,55 @@
+"""
+Loading a document must leave the event loop free for other sessions
+"""
+
+import json
+import time
+import asyncio
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.indexers.semantic_indexer import SemanticIndex
+
+
+def _large_spec(operations: int) -> dict:
+    paths = {
+        f"/resources{i}/{{id}}": {
+            "get": {
+                "operationId": f"getResource{i}",
+                "summary": f"Get resource {i}",
+                "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {
+                    "200": {
+                        "description": "ok",
+                        "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/S{i % 100}"}}}
+                    }
+                }
+            }
+        }
+        for i in range(operations)
+    }
+    schemas = {f"S{i}": {"type": "object", "properties": {f"p{j}": {"type": "string"} for j in range(10)}}
+               for i in range(100)}
+    return {"openapi": "3.0.3", "info": {"title": "Large", "version": "1"}, "paths": paths,
+            "components": {"schemas": schemas}}
+
+
+def test_event_loop_keeps_running_during_a_load(tmp_path):
+    spec = tmp_path / 'large.json'
+    spec.write_text(json.dumps(_large_spec(3000)))
+    api = ApiService(OpenAPIStorage(memory_budget_bytes=0), SemanticIndex(), local_roots=[str(tmp_path)])
+
+    async def scenario():
+        ticks = 0
+        loading = asyncio.create_task(api.load_openapi('large', spec.as_uri()))
+        started = time.perf_counter()
+        while not loading.done():
+            await asyncio.sleep(0.005)
+            ticks += 1
+        return await loading, ticks, time.perf_counter() - started
+
+    result, ticks, elapsed = asyncio.run(scenario())
+
+    assert not result.get("error"), result
+    # The ticker ran throughout, not just before and after the load
+    assert ticks >= 10
+    assert ticks * 0.2 >= elapsed
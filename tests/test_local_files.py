@@ -0,0 +1,125 @@
+"""
+Confinement of file:// loads to the configured local roots
+"""
+
+import os
+import json
+import asyncio
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+
+
+def _spec(schema_ref: str = '#/components/schemas/Pet') -> dict:
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Local", "version": "1"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {"description": "ok", "content": {"application/json": {"schema": {"$ref": schema_ref}}}}
+                    }
+                }
+            }
+        },
+        "components": {"schemas": {"Pet": {"type": "object"}}}
+    }
+
+
+def _load(url: str, local_roots, trusted: bool = False):
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+    api = ApiService(storage, local_roots=local_roots)
+    return storage, asyncio.run(api.load_openapi('local', url, trusted=trusted))
+
+
+def _layout(tmp_path):
+    root = tmp_path / 'specs'
+    root.mkdir()
+    secret = tmp_path / 'secret.txt'
+    secret.write_text("secret_token: abc123\nbroken: value: here\n")
+    return root, secret
+
+
+def test_file_outside_the_roots_is_refused(tmp_path):
+    root, secret = _layout(tmp_path)
+
+    storage, result = _load(secret.as_uri(), [str(root)])
+
+    assert result["error"] is True
+    assert "OPENAPI_LOCAL_ROOTS" in result["message"]
+    assert "abc123" not in json.dumps(result)
+    assert not storage.exists('local')
+
+
+def test_local_files_are_refused_without_roots(tmp_path):
+    root, _ = _layout(tmp_path)
+    spec = root / 'spec.json'
+    spec.write_text(json.dumps(_spec()))
+
+    _, result = _load(spec.as_uri(), [])
+    assert result["error"] is True
+
+    _, result = _load(root.as_uri(), [])
+    assert result["error"] is True
+
+
+def test_file_under_a_root_loads(tmp_path):
+    root, _ = _layout(tmp_path)
+    spec = root / 'spec.json'
+    spec.write_text(json.dumps(_spec()))
+
+    storage, result = _load(spec.as_uri(), [str(root)])
+
+    assert not result.get("error"), result
+    assert storage.exists('local')
+
+
+def test_symlink_out_of_a_root_is_refused(tmp_path):
+    root, secret = _layout(tmp_path)
+    link = root / 'spec.yaml'
+    os.symlink(secret, link)
+
+    _, result = _load(link.as_uri(), [str(root)])
+    assert result["error"] is True
+    assert "abc123" not in json.dumps(result)
+
+    # Nor is it picked up from a directory load
+    (root / 'api.json').write_text(json.dumps(_spec()))
+    _, result = _load(root.as_uri(), [str(root)])
+    assert list(result["apis"]) == ['local/api']
+    assert "abc123" not in json.dumps(result)
+
+
+def test_ref_out_of_a_root_is_refused(tmp_path):
+    root, secret = _layout(tmp_path)
+    spec = root / 'spec.json'
+    spec.write_text(json.dumps(_spec('../secret.txt#/secret_token')))
+
+    storage, result = _load(spec.as_uri(), [str(root)])
+
+    assert result["error"] is True
+    assert "outside OPENAPI_LOCAL_ROOTS" in result["message"]
+    assert not storage.exists('local')
+
+
+def test_parse_errors_do_not_quote_the_file(tmp_path):
+    root, _ = _layout(tmp_path)
+    spec = root / 'spec.yaml'
+    spec.write_text("secret_token: abc123\nbroken: value: here\n")
+
+    _, result = _load(spec.as_uri(), [str(root)])
+
+    assert result["error"] is True
+    assert result["message"].startswith("Failed to parse document: mapping values are not allowed here at line 2")
+    assert "abc123" not in result["message"]
+
+
+def test_trusted_loads_may_read_any_file(tmp_path):
+    _, _ = _layout(tmp_path)
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps(_spec()))
+
+    storage, result = _load(spec.as_uri(), [], trusted=True)
+
+    assert not result.get("error"), result
+    assert storage.exists('local')
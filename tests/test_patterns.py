@@ -0,0 +1,70 @@
+"""
+Rejection of patterns that backtrack polynomially, and the pattern_search time limit
+"""
+
+import json
+import asyncio
+import pytest
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.services import search_service
+from src.services.search_service import SearchService
+from src.utils.patterns import PatternError, compile_pattern, timed_regex
+
+
+@pytest.mark.parametrize('pattern', [
+    r'\w*' * 8 + '!',
+    r'\w*\w*',
+    r'.*a.*a.*a.*a!',
+    r'a.*b.*c.*d',
+    r'(a+)+$',
+])
+def test_ambiguous_patterns_are_rejected(pattern):
+    with pytest.raises(PatternError):
+        compile_pattern(pattern)
+
+
+@pytest.mark.parametrize('pattern, syntax', [
+    (r'^/v\d+/accounts/\{id\}/.*$', 'regex'),
+    (r'^list.*Invoices$', 'regex'),
+    (r'.*a.*b', 'regex'),
+    (r'^/[^/]*/[^/]*/[^/]*/[^/]*$', 'regex'),
+    (r'[a-z]+\d+', 'regex'),
+    (r'(get|list)[A-Z]\w*', 'regex'),
+    ('/v*/accounts/{id}/*', 'glob'),
+    ('/**/invoices/*', 'glob'),
+    ('/pets/?', 'glob'),
+])
+def test_common_patterns_are_allowed(pattern, syntax):
+    compile_pattern(pattern, syntax)
+
+
+def _service(tmp_path, paths) -> SearchService:
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps({
+        "openapi": "3.0.3",
+        "info": {"title": "Patterns", "version": "1"},
+        "paths": {path: {"get": {"responses": {"200": {"description": "ok"}}}} for path in paths}
+    }))
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+    result = asyncio.run(ApiService(storage, local_roots=[str(tmp_path)]).load_openapi('patterns', spec.as_uri()))
+    assert not result.get("error"), result
+    return SearchService(storage)
+
+
+def test_rejected_pattern_returns_an_error(tmp_path):
+    result = _service(tmp_path, ['/pets']).pattern_search('patterns', r'.*a.*a.*a.*a!')
+
+    assert result["error"] is True
+    assert "polynomial time" in result["message"]
+
+
+@pytest.mark.skipif(timed_regex is None, reason="needs the optional regex package")
+def test_slow_match_is_stopped(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_service, 'PATTERN_MATCH_TIMEOUT', 0.05)
+    service = _service(tmp_path, ['/' + 'a' * 5000])
+
+    result = service.pattern_search('patterns', r'.*a.*a!')
+
+    assert result["error"] is True
+    assert "took longer than 0.05s" in result["message"]
@@ -0,0 +1,39 @@
+"""
+Bounded lookup counting in OperationPrewarmer
+"""
+
+from src.storage import OpenAPIStorage
+from src.prewarmer import OperationPrewarmer
+
+
+def _prewarmer(max_tracked: int = 100) -> OperationPrewarmer:
+    # replan_misses=0 keeps the background thread out of these tests
+    return OperationPrewarmer(OpenAPIStorage(memory_budget_bytes=0), budget_bytes=1024,
+                              replan_misses=0, max_tracked=max_tracked)
+
+
+def test_remove_forgets_an_api():
+    prewarmer = _prewarmer()
+    for op in ('listPets', 'getPet', 'getPet'):
+        prewarmer.lookup('petstore', 1, op)
+    prewarmer.lookup('billing', 1, 'listInvoices')
+
+    prewarmer.remove('petstore')
+
+    stats = prewarmer.stats()
+    assert list(stats["apis"]) == ['billing']
+    assert prewarmer._tracked == 1
+
+
+def test_tracked_operations_stay_bounded():
+    prewarmer = _prewarmer(max_tracked=100)
+    for i in range(10_000):
+        prewarmer.lookup('petstore', 1, f'cold{i}')
+        if i % 10 == 0:
+            prewarmer.lookup('petstore', 1, 'hot')
+        assert prewarmer._tracked <= 100
+
+    counts = prewarmer._counts['petstore']
+    assert sum(len(c) for c in prewarmer._counts.values()) == prewarmer._tracked
+    # Frequently requested operations outlive one-off lookups
+    assert counts.most_common(1)[0][0] == 'hot'
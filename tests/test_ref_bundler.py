@@ -0,0 +1,144 @@
+"""
+External $ref bundling and the confinement of refs to the root document's scheme
+"""
+
+import json
+import asyncio
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import pytest
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.services.schema_service import SchemaService
+from src.loaders.fetch_cache import FetchCache
+from src.loaders.ref_bundler import ExternalRefBundler, ExternalRefError
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _spec(schema_ref: str) -> dict:
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Remote", "version": "1"},
+        "paths": {
+            "/creds": {
+                "get": {
+                    "operationId": "getCreds",
+                    "responses": {
+                        "200": {
+                            "description": "ok",
+                            "content": {"application/json": {"schema": {"$ref": schema_ref}}}
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+def _write(path, document) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document))
+
+
+@pytest.fixture
+def secret(tmp_path):
+    path = tmp_path / 'secret' / 'creds.json'
+    _write(path, {"Creds": {"type": "string", "example": "TOPSECRET"}})
+    return path
+
+
+@pytest.fixture
+def server(tmp_path):
+    root = tmp_path / 'www'
+    root.mkdir()
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _load(name: str, url: str, local_roots=None):
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+    api = ApiService(storage, local_roots=local_roots)
+    return storage, asyncio.run(api.load_openapi(name, url))
+
+
+def test_remote_spec_cannot_reference_a_local_file(server, secret):
+    root, base_url = server
+    _write(root / 'spec.json', _spec(f"{secret.as_uri()}#/Creds"))
+
+    storage, result = _load('remote', f"{base_url}/spec.json")
+
+    assert result["error"] is True
+    assert "Refused to follow $ref" in result["message"]
+    assert "TOPSECRET" not in json.dumps(result)
+    assert not storage.exists('remote')
+
+
+def test_remote_spec_cannot_reach_a_local_file_through_another_document(server, secret):
+    root, base_url = server
+    _write(root / 'spec.json', _spec('common.json#/Creds'))
+    _write(root / 'common.json', {"Creds": {"$ref": f"{secret.as_uri()}#/Creds"}})
+
+    storage, result = _load('remote', f"{base_url}/spec.json")
+
+    assert result["error"] is True
+    assert "Refused to follow $ref" in result["message"]
+    assert not storage.exists('remote')
+
+
+def test_absolute_path_ref_stays_on_the_remote_server(server, secret):
+    root, base_url = server
+    # The same path as the local secret, but resolved against the server
+    _write(root / 'spec.json', _spec(f"{secret}#/Creds"))
+    _write(root / secret.relative_to('/'), {"Creds": {"type": "string", "example": "served"}})
+
+    storage, result = _load('remote', f"{base_url}/spec.json")
+
+    assert not result.get("error"), result
+    details = SchemaService(storage).get_schema_details('remote', 'Creds')
+    assert details["example"] == "served"
+
+
+def test_remote_relative_refs_are_bundled(server):
+    root, base_url = server
+    _write(root / 'spec.json', _spec('common.json#/Error'))
+    _write(root / 'common.json', {"Error": {"type": "object", "properties": {"code": {"type": "integer"}}}})
+
+    storage, result = _load('remote', f"{base_url}/spec.json")
+
+    assert not result.get("error"), result
+    assert result["external_refs"]["bundled_refs"] == 1
+    assert SchemaService(storage).get_schema_details('remote', 'Error')["type"] == "object"
+
+
+def test_local_spec_may_reference_local_files(tmp_path, secret):
+    spec = tmp_path / 'spec.json'
+    _write(spec, _spec('secret/creds.json#/Creds'))
+
+    storage, result = _load('local', spec.as_uri(), [str(tmp_path)])
+
+    assert not result.get("error"), result
+    assert SchemaService(storage).get_schema_details('local', 'Creds')["example"] == "TOPSECRET"
+
+
+def test_bundler_refuses_other_schemes():
+    fetched = []
+
+    async def fetch(url):
+        fetched.append(url)
+        return {}
+
+    doc = _spec('ftp://example.com/common.json#/Error')
+    bundler = ExternalRefBundler(FetchCache(fetch))
+    with pytest.raises(ExternalRefError):
+        asyncio.run(bundler.bundle(doc, 'https://example.com/spec.json'))
+    assert fetched == []
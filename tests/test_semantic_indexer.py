@@ -0,0 +1,23 @@
+"""
+HashingVectorizer must keep a bounded number of hashed features however many queries it sees
+"""
+
+from src.indexers.semantic_indexer import HashingVectorizer
+
+
+def _features(vectorizer, text):
+    out = {}
+    vectorizer.features(text.split(), 1.0, out)
+    return out
+
+
+def test_feature_cache_is_bounded():
+    vectorizer = HashingVectorizer(dimensions=64, cache_size=100)
+    expected = _features(HashingVectorizer(dimensions=64), 'cancel subscription')
+
+    for i in range(1000):
+        _features(vectorizer, 'word%d other%d' % (i, i))
+
+    assert vectorizer._column.cache_info().currsize == 100
+    # Evicted features hash to the same columns when seen again
+    assert _features(vectorizer, 'cancel subscription') == expected
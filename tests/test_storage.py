@@ -0,0 +1,110 @@
+"""
+Shared-backend catalog caching in OpenAPIStorage
+"""
+
+import pytest
+from src.storage import OpenAPIStorage
+from src.backends.sqlite_backend import SQLiteBackend
+from src.backends.shared_catalog import SharedCatalogBackend
+
+
+def _document(title: str) -> dict:
+    return {"info": {"title": title}, "paths": {}, "raw": {"openapi": "3.0.3", "paths": {}}}
+
+
+class CountingBackend:
+    """Wraps a backend and counts catalog() reads."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.catalog_reads = 0
+
+    def __getattr__(self, attr):
+        return getattr(self._backend, attr)
+
+    def catalog(self):
+        self.catalog_reads += 1
+        return self._backend.catalog()
+
+
+@pytest.fixture(params=['sqlite', 'shared'])
+def make_backend(request, tmp_path):
+    if request.param == 'sqlite':
+        return lambda: SQLiteBackend(str(tmp_path / 'catalog.db'))
+    return lambda: SharedCatalogBackend(str(tmp_path / 'catalog'))
+
+
+def test_unchanged_catalog_is_not_reread(make_backend):
+    writer = OpenAPIStorage(make_backend(), memory_budget_bytes=0)
+    writer.add('a', _document('a'))
+    writer.add('b', _document('b'))
+
+    backend = CountingBackend(make_backend())
+    reader = OpenAPIStorage(backend, memory_budget_bytes=0)
+    for _ in range(50):
+        assert reader.snapshot('a') is not None
+        assert reader.exists('b')
+        reader.list_summaries()
+    assert backend.catalog_reads == 1
+
+
+def test_changed_catalog_is_reread(make_backend):
+    writer = OpenAPIStorage(make_backend(), memory_budget_bytes=0)
+    writer.add('a', _document('v1'))
+
+    backend = CountingBackend(make_backend())
+    reader = OpenAPIStorage(backend, memory_budget_bytes=0)
+    assert reader.get('a')['info']['title'] == 'v1'
+
+    writer.add('a', _document('v2'))
+    assert reader.get('a')['info']['title'] == 'v2'
+    writer.remove('a')
+    assert not reader.exists('a')
+    assert backend.catalog_reads == 3
+
+
+def _large_document(title: str, operations: int = 500) -> dict:
+    paths = {
+        f"/items{i}": {"get": {"operationId": f"get{i}", "summary": f"{title} item {i}", "tags": [title]}}
+        for i in range(operations)
+    }
+    return {"info": {"title": title}, "paths": paths, "raw": {"openapi": "3.0.3", "paths": paths}}
+
+
+def test_budget_is_charged_the_in_memory_size(tmp_path):
+    probe = OpenAPIStorage(memory_budget_bytes=1 << 40, spill_dir=str(tmp_path / 'probe'))
+    probe.add('a', _large_document('a'))
+    stats = probe.get_residency_stats()["apis"]["a"]
+    assert stats["memory_bytes"] > 2 * stats["size_bytes"]
+
+    # Room for two documents by stored size, but not by memory
+    storage = OpenAPIStorage(memory_budget_bytes=3 * stats["size_bytes"], spill_dir=str(tmp_path / 'spill'))
+    storage.add('a', _large_document('a'))
+    storage.add('b', _large_document('b'))
+
+    stats = storage.get_residency_stats()
+    assert stats["resident_count"] == 1
+    assert stats["apis"]["b"]["resident"] and not stats["apis"]["a"]["resident"]
+    assert storage.get('a')['info']['title'] == 'a'
+
+
+def test_memory_estimate_tracks_the_object_graph():
+    import sys
+    from src.utils.memory_size import estimate_memory_bytes
+
+    def exact(value, seen):
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(exact(k, seen) + exact(v, seen) for k, v in value.items())
+        elif isinstance(value, list):
+            size += sum(exact(v, seen) for v in value)
+        return size
+
+    document = _large_document('a', operations=2000)
+    measured = exact(document, set())
+
+    assert estimate_memory_bytes(document, sample_children=0) == measured
+    assert 0.5 * measured <= estimate_memory_bytes(document) <= 2 * measured
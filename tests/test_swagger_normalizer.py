@@ -0,0 +1,149 @@
+"""
+Conversion of Swagger 2.0 documents into the OpenAPI 3.0 shape
+"""
+
+import copy
+import json
+import asyncio
+from src.storage import OpenAPIStorage
+from src.services.api_service import ApiService
+from src.services.schema_service import SchemaService
+from src.loaders.swagger_normalizer import SwaggerNormalizer
+
+SWAGGER = {
+    "swagger": "2.0",
+    "info": {"title": "Petstore", "version": "1"},
+    "host": "api.example.com",
+    "basePath": "/v1",
+    "schemes": ["https", "http"],
+    "consumes": ["application/json"],
+    "produces": ["application/json"],
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "parameters": [
+                    {"name": "tags", "in": "query", "type": "array", "items": {"type": "string"},
+                     "collectionFormat": "multi"},
+                    {"$ref": "#/parameters/Limit"}
+                ],
+                "responses": {
+                    "200": {"description": "ok", "schema": {"type": "array", "items": {"$ref": "#/definitions/Pet"}}},
+                    "default": {"$ref": "#/responses/Error"}
+                }
+            },
+            "post": {
+                "operationId": "createPet",
+                "parameters": [{"$ref": "#/parameters/PetBody"}],
+                "responses": {"201": {"description": "created"}}
+            }
+        },
+        "/pets/{id}/photo": {
+            "put": {
+                "operationId": "uploadPhoto",
+                "consumes": ["multipart/form-data"],
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True, "type": "integer"},
+                    {"name": "file", "in": "formData", "required": True, "type": "file"}
+                ],
+                "responses": {"204": {"description": "stored"}}
+            }
+        }
+    },
+    "definitions": {
+        "Pet": {"type": "object", "x-nullable": True, "properties": {"id": {"type": "integer"}}},
+        "Error": {"type": "object", "properties": {"message": {"type": "string"}}}
+    },
+    "parameters": {
+        "Limit": {"name": "limit", "in": "query", "type": "integer", "maximum": 100},
+        "PetBody": {"name": "pet", "in": "body", "required": True, "schema": {"$ref": "#/definitions/Pet"}}
+    },
+    "responses": {
+        "Error": {"description": "error", "schema": {"$ref": "#/definitions/Error"}}
+    },
+    "securityDefinitions": {
+        "oauth": {"type": "oauth2", "flow": "accessCode", "authorizationUrl": "https://auth",
+                  "tokenUrl": "https://token", "scopes": {"read": "Read pets"}},
+        "basic": {"type": "basic"}
+    }
+}
+
+
+def _normalize() -> dict:
+    return SwaggerNormalizer(SWAGGER).normalize()
+
+
+def test_sections_become_components():
+    doc = _normalize()
+
+    assert doc["openapi"] == "3.0.3"
+    assert set(doc["components"]) == {"schemas", "parameters", "responses", "securitySchemes"}
+    # Body parameters are inlined where they are used
+    assert set(doc["components"]["parameters"]) == {"Limit"}
+    assert doc["components"]["parameters"]["Limit"]["schema"] == {"type": "integer", "maximum": 100}
+    assert doc["components"]["schemas"]["Pet"]["nullable"] is True
+    assert not any(key in doc for key in ("swagger", "definitions", "host", "basePath", "consumes"))
+
+
+def test_refs_are_rewritten():
+    doc = _normalize()
+    get = doc["paths"]["/pets"]["get"]
+
+    assert get["parameters"][1] == {"$ref": "#/components/parameters/Limit"}
+    assert get["responses"]["default"] == {"$ref": "#/components/responses/Error"}
+    schema = get["responses"]["200"]["content"]["application/json"]["schema"]
+    assert schema["items"] == {"$ref": "#/components/schemas/Pet"}
+    assert "#/definitions/" not in json.dumps(doc)
+
+
+def test_body_and_form_parameters_become_request_bodies():
+    doc = _normalize()
+
+    post = doc["paths"]["/pets"]["post"]
+    assert "parameters" not in post
+    assert post["requestBody"]["required"] is True
+    assert post["requestBody"]["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/Pet"}
+
+    put = doc["paths"]["/pets/{id}/photo"]["put"]
+    assert [parameter["name"] for parameter in put["parameters"]] == ["id"]
+    form = put["requestBody"]["content"]["multipart/form-data"]["schema"]
+    assert form["properties"]["file"] == {"type": "string", "format": "binary"}
+    assert form["required"] == ["file"]
+
+
+def test_query_arrays_and_security_schemes():
+    doc = _normalize()
+
+    tags = doc["paths"]["/pets"]["get"]["parameters"][0]
+    assert (tags["style"], tags["explode"]) == ("form", True)
+    schemes = doc["components"]["securitySchemes"]
+    assert schemes["basic"] == {"type": "http", "scheme": "basic"}
+    assert set(schemes["oauth"]["flows"]) == {"authorizationCode"}
+
+
+def test_servers_come_from_host_base_path_and_schemes():
+    assert _normalize()["servers"] == [
+        {"url": "https://api.example.com/v1"},
+        {"url": "http://api.example.com/v1"}
+    ]
+
+
+def test_input_is_left_unchanged():
+    original = copy.deepcopy(SWAGGER)
+    doc = _normalize()
+
+    assert SWAGGER == original
+    doc["components"]["schemas"]["Pet"]["properties"]["id"]["type"] = "string"
+    assert SWAGGER["definitions"]["Pet"]["properties"]["id"]["type"] == "integer"
+
+
+def test_swagger_documents_load_as_openapi(tmp_path):
+    spec = tmp_path / 'swagger.json'
+    spec.write_text(json.dumps(SWAGGER))
+    storage = OpenAPIStorage(memory_budget_bytes=0)
+
+    result = asyncio.run(ApiService(storage, local_roots=[str(tmp_path)]).load_openapi('petstore', spec.as_uri()))
+
+    assert not result.get("error"), result
+    assert result["normalized_from"] == "swagger 2.0"
+    assert SchemaService(storage).get_schema_details('petstore', 'Pet')["type"] == "object"